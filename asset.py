@@ -1,10 +1,10 @@
 import math
 
 import pygame
-import queue
-from queue import Queue
+from collections import deque
 from typing import Callable
 
+import incidents
 import resources
 import settings
 from incidents import Incident
@@ -31,10 +31,11 @@ class Asset:
         # Coordonnée du centre de l'actif (en pixels) - pour le calcul des distances
         self._center_position = resources.tiles_collection.tile_pos_to_center_pixel_pos(
             tile_position)
-        font = pygame.font.SysFont(None, 24)
-        self.text_char = font.render(self._name, True, (255, 255, 255))
+        self.text_char = resources.fonts.render(
+            'LABEL', self._name, (255, 255, 255))
 
-        self._incidents = Queue()
+        # incidents en attente : la boucle de jeu est seule à y accéder, aucun verrou n'est nécessaire
+        self._incidents = deque()
         self._active_incident = None
 
         # action à faire lorsqu'un incident arrive pour cet actif en particulier
@@ -43,6 +44,8 @@ class Asset:
         self._expiring_action = None
         # action à faire lorsqu'un incident est résolu pour cet actif en particulier
         self._solving_action = None
+        # action à faire lorsque la charge de cet actif change (voir routing.Router)
+        self._load_changed_action = None
 
         self._fail_sound = resources.sounds_collection.get('INCIDENT-FAIL')
         self._solve_sound = resources.sounds_collection.get('INCIDENT-SOLVE')
@@ -57,7 +60,8 @@ class Asset:
         :param incident: l'incident à ajouter
         :return: aucun
         """
-        self._incidents.put(incident)
+        self._incidents.append(incident)
+        self._notify_load_changed()
 
     def solve_incident(self) -> None:
         """
@@ -69,21 +73,32 @@ class Asset:
                 self._play_solve_sound()
                 remaining_percentage = self._active_incident.get_remaining_time_percentage()
                 self._solving_action(math.floor(remaining_percentage))
-            self._active_incident.stop()
+            incidents.pool.release(self._active_incident)
             self._active_incident = None
+            self._notify_load_changed()
 
-    def draw(self, destination: pygame.Surface, display_name) -> None:
+    def draw_static(self, destination: pygame.Surface) -> None:
         """
-        Dessine l'actif (et l'incident qui l'affecte s'il y en a un).
+        Dessine l'image de l'actif (partie qui ne change jamais).
         :param destination: surface sur laquelle dessiner l'actif
         :return: aucun
         """
-        # Dessin de l'actif
         asset_surface = resources.assets_collection.get(self._asset_id)
         destination.blit(asset_surface, self._position)
 
+    def draw(self, destination: pygame.Surface, display_name) -> list:
+        """
+        Dessine les éléments dynamiques de l'actif (l'incident qui l'affecte s'il y en a un et son nom).
+        L'image de l'actif elle-même est dessinée une seule fois par draw_static().
+        :param destination: surface sur laquelle dessiner l'actif
+        :param display_name: True pour afficher le nom de l'actif
+        :return: liste des rectangles modifiés sur la surface de destination
+        """
+        dirty_rects = []
+
         # Dessin de l'incident, s'il y a lieu
         if self._active_incident:
+            asset_surface = resources.assets_collection.get(self._asset_id)
             incident_type = self._active_incident.expertise
             incident_surface = resources.incidents_collection.get(
                 self._timer_id, incident_type)
@@ -91,9 +106,12 @@ class Asset:
                       incident_surface.get_width()) / 2
             x, y = self._position
             position = x + offset, y + offset
-            destination.blit(incident_surface, position)
+            dirty_rects.append(destination.blit(incident_surface, position))
         if display_name:
-            destination.blit(self.text_char, (self._position))
+            dirty_rects.append(destination.blit(
+                self.text_char, (self._position)))
+
+        return dirty_rects
 
     def set_incoming_action(self, action: Callable) -> None:
         """
@@ -119,6 +137,19 @@ class Asset:
         """
         self._solving_action = action
 
+    def set_load_changed_action(self, action: Callable) -> None:
+        """
+        Assigne l'action à accomplir lorsque la charge de l'actif (voir load) change.
+        :param action: action à accomplir (nom de la fonction à appeler)
+        :return: aucun
+        """
+        self._load_changed_action = action
+
+    def _notify_load_changed(self) -> None:
+        """ Signale un changement de charge de l'actif (incident ajouté, activé ou retiré). """
+        if self._load_changed_action:
+            self._load_changed_action()
+
     def pause_incident(self) -> None:
         """
         Pause l'incident en cours sur l'actif.
@@ -141,12 +172,14 @@ class Asset:
         :return: aucun
         """
         # Retrait (suppression) de tous les incidents en attente
-        while not self._incidents.empty():
-            self._incidents.get()
+        for incident in self._incidents:
+            incidents.pool.release(incident)
+        self._incidents.clear()
         # Arrêt et suppression de l'incident en cours, s'il y a lieu
         if self._active_incident:
-            self._active_incident.stop()
+            incidents.pool.release(self._active_incident)
             self._active_incident = None
+        self._notify_load_changed()
 
     def update(self) -> int:
         """
@@ -163,17 +196,13 @@ class Asset:
             return isTimeout
 
         if not self._active_incident:
-            if not self._incidents.empty():
-                try:
-                    self._active_incident = self._incidents.get(block=False)
-                except queue.Empty:
-                    # aucune gestion d'exception nécessaire ici
-                    return isTimeout
-
+            if self._incidents:
+                self._active_incident = self._incidents.popleft()
                 self._active_incident.start()
                 self._timer_id = Asset.compute_timer_id(self._active_incident)
                 if self._incoming_action:
                     self._incoming_action()
+                self._notify_load_changed()
         else:
             self._timer_id = Asset.compute_timer_id(self._active_incident)
             if self._active_incident.has_expired():
@@ -181,8 +210,9 @@ class Asset:
                 self._play_fail_sound()
                 if self._expiring_action:
                     self._expiring_action()
-                self._active_incident.stop()
+                incidents.pool.release(self._active_incident)
                 self._active_incident = None
+                self._notify_load_changed()
         return isTimeout
 
     @staticmethod
@@ -222,6 +252,11 @@ class Asset:
     def active_incident(self) -> Incident:
         return self._active_incident
 
+    @property
+    def load(self) -> int:
+        # nombre d'incidents confiés à l'actif (en attente ou actif)
+        return len(self._incidents) + (1 if self._active_incident else 0)
+
     @property
     def image_incident(self) -> pygame.Surface:
         incident_type = self._active_incident.expertise
@@ -0,0 +1,353 @@
+# Gestion de l'audio : répartition des canaux du mélangeur entre catégories de sons (budget de canaux) et lecture en
+# continu à partir du disque des longues boucles sonores (pygame.mixer.music, ou par morceaux sur un canal réservé)
+import file_cache
+import itertools
+import os
+import pygame
+
+from enum import IntEnum
+
+
+class Category(IntEnum):
+    """ Catégorie de son : chaque catégorie dispose de ses propres canaux (voir CHANNEL_BUDGETS). """
+    EFFECT = 0  # effets courts (résolution, échec, tuile qui grince)
+    ALERT = 1  # alertes de temps restant des incidents
+    LOOP = 2  # sons joués en boucle (sonnerie du téléphone, ambiance du bureau)
+
+
+class Playback(IntEnum):
+    """ Mode de lecture d'un son. """
+    DECODED = 0  # décodé en entier en mémoire (sons courts, voir ManagedSound)
+    MUSIC = 1  # lu en continu à partir du disque par pygame.mixer.music (voir StreamedSound)
+    CHUNKED = 2  # lu par morceaux à partir du cache sur un canal réservé de sa catégorie (voir ChunkedSound)
+
+
+# nombre de canaux réservés à chaque catégorie
+CHANNEL_BUDGETS = {Category.EFFECT: 4,
+                   Category.ALERT: 2,
+                   Category.LOOP: 2}
+
+# catégories dans lesquelles un son déjà en cours n'est pas rejoué par-dessus lui-même (des alertes identiques qui
+# se chevauchent ne font que du bruit)
+NO_OVERLAP_CATEGORIES = (Category.ALERT,)
+
+# durée d'un morceau d'un son lu par morceaux (en secondes) : le morceau suivant doit être mis en file avant la fin du
+# morceau en cours (voir __Mixer.update())
+CHUNK_DURATION = 1.0
+
+
+class __Mixer:
+    """
+    Budget de canaux utilisé par l'objet global mixer (voir plus bas).
+    Chaque catégorie joue sur ses propres canaux : une rafale d'alertes ne peut donc pas priver la musique ou les
+    effets de canaux. Lorsque tous les canaux d'une catégorie sont occupés, le son le plus ancien de la catégorie
+    est interrompu au profit du nouveau.
+    """
+
+    def __init__(self) -> None:
+        # catégorie -> canaux (pygame.mixer.Channel)
+        self.__channels = {}
+        # numéro du canal -> ordre de démarrage du son qui y joue
+        self.__started = {}
+        self.__counter = itertools.count()
+        # sons lus par morceaux, alimentés par update()
+        self.__streams = []
+
+    def init(self) -> None:
+        """
+        Initialise l'instance unique de audio.mixer : réserve les canaux de chaque catégorie.
+        pygame.mixer doit être initialisé.
+        :return: aucun
+        """
+        pygame.mixer.set_num_channels(sum(CHANNEL_BUDGETS.values()))
+
+        first = 0
+        for category, budget in CHANNEL_BUDGETS.items():
+            self.__channels[category] = [(number, pygame.mixer.Channel(number))
+                                         for number in range(first, first + budget)]
+            first += budget
+
+    def play(self, sound: pygame.mixer.Sound, category: Category, loops: int = 0) -> pygame.mixer.Channel or None:
+        """
+        Joue un son sur un canal de sa catégorie.
+        :param sound: le son
+        :param category: catégorie du son
+        :param loops: nombre de répétitions (-1 pour jouer en boucle)
+        :return: le canal utilisé, None si le son n'est pas joué (déjà en cours dans une catégorie sans chevauchement)
+        """
+        channels = self.__channels[category]
+
+        if category in NO_OVERLAP_CATEGORIES and \
+                any(channel.get_sound() is sound for _, channel in channels if channel.get_busy()):
+            return None
+
+        chosen = None
+        for number, channel in channels:
+            if not channel.get_busy():
+                chosen = number, channel
+                break
+        if chosen is None:
+            # tous les canaux de la catégorie sont occupés : le son le plus ancien est interrompu
+            chosen = min(channels, key=lambda numbered_channel: self.__started[numbered_channel[0]])
+
+        number, channel = chosen
+        channel.play(sound, loops)
+        self.__started[number] = next(self.__counter)
+        return channel
+
+    def reserve(self, category: Category, stream) -> pygame.mixer.Channel:
+        """
+        Réserve un canal d'une catégorie à un son lu par morceaux : le canal n'est plus attribué aux autres sons de la
+        catégorie et le son est alimenté à chaque appel de update().
+        :param category: catégorie du canal
+        :param stream: le son lu par morceaux (voir ChunkedSound)
+        :return: le canal réservé
+        """
+        channels = self.__channels[category]
+        assert len(channels) > 1, "Une catégorie doit garder au moins un canal"
+
+        _, channel = channels.pop()
+        self.__streams.append(stream)
+        return channel
+
+    def update(self) -> None:
+        """
+        Alimente les sons lus par morceaux : met en file le morceau suivant de chaque son qui en a besoin. À appeler à
+        chaque trame (au moins une fois par CHUNK_DURATION).
+        :return: aucun
+        """
+        for stream in self.__streams:
+            stream.update()
+
+
+class ManagedSound:
+    """
+    Son court, décodé en mémoire, joué à travers le budget de canaux de sa catégorie.
+    Offre la même interface que pygame.mixer.Sound pour les opérations utilisées par le jeu.
+    """
+
+    def __init__(self, sound: pygame.mixer.Sound, category: Category) -> None:
+        """
+        Initialise un son géré (objet ManagedSound).
+        :param sound: le son décodé
+        :param category: catégorie du son
+        """
+        self.__sound = sound
+        self.__category = category
+
+    def play(self, loops: int = 0) -> pygame.mixer.Channel or None:
+        return mixer.play(self.__sound, self.__category, loops)
+
+    def stop(self) -> None:
+        self.__sound.stop()
+
+    def fadeout(self, time: int) -> None:
+        self.__sound.fadeout(time)
+
+    def set_volume(self, value: float) -> None:
+        self.__sound.set_volume(value)
+
+    def get_num_channels(self) -> int:
+        return self.__sound.get_num_channels()
+
+    @property
+    def sound(self) -> pygame.mixer.Sound:
+        return self.__sound
+
+
+class StreamedSound:
+    """
+    Long son en boucle lu en continu à partir du disque par pygame.mixer.music (seuls quelques morceaux sont décodés
+    à la fois, plutôt que tout le fichier en mémoire). Offre la même interface que pygame.mixer.Sound pour les
+    opérations utilisées par le jeu. pygame.mixer.music n'a qu'un flux : démarrer un son en continu arrête le
+    précédent.
+    """
+
+    # son en continu qui occupe le flux de pygame.mixer.music
+    __current = None
+
+    def __init__(self, filename: str, volume: float = 1.0) -> None:
+        """
+        Initialise un son en continu (objet StreamedSound). Le fichier n'est ouvert qu'au moment de le jouer.
+        :param filename: nom du fichier
+        :param volume: volume (de 0 à 1)
+        """
+        self.__filename = filename
+        self.__volume = volume
+
+    def play(self, loops: int = 0) -> None:
+        pygame.mixer.music.load(self.__filename)
+        pygame.mixer.music.set_volume(self.__volume)
+        pygame.mixer.music.play(loops)
+        StreamedSound.__current = self
+
+    def stop(self) -> None:
+        if self.is_current():
+            pygame.mixer.music.stop()
+
+    def fadeout(self, time: int) -> None:
+        if self.is_current():
+            pygame.mixer.music.fadeout(time)
+
+    def set_volume(self, value: float) -> None:
+        self.__volume = value
+        if self.is_current():
+            pygame.mixer.music.set_volume(value)
+
+    def get_num_channels(self) -> int:
+        return 1 if self.is_current() and pygame.mixer.music.get_busy() else 0
+
+    def is_current(self) -> bool:
+        """
+        Vérifie si ce son occupe le flux de pygame.mixer.music.
+        :return: True si c'est le cas, False sinon
+        """
+        return StreamedSound.__current is self
+
+
+class ChunkedSound:
+    """
+    Long son en boucle lu par morceaux (voir CHUNK_DURATION) sur un canal réservé de sa catégorie, à partir de ses
+    échantillons bruts dans le cache (voir decode_to_cache()) : seuls le morceau en cours et le suivant sont en mémoire.
+    Contrairement à StreamedSound, plusieurs sons lus par morceaux peuvent jouer en même temps que pygame.mixer.music.
+    Offre la même interface que pygame.mixer.Sound pour les opérations utilisées par le jeu.
+    """
+
+    def __init__(self, filename: str, volume: float = 1.0, category: Category = Category.LOOP) -> None:
+        """
+        Initialise un son lu par morceaux (objet ChunkedSound) et lui réserve un canal (voir __Mixer.reserve()).
+        audio.mixer doit être initialisé.
+        :param filename: nom du fichier d'échantillons bruts, au format du mélangeur (voir decode_to_cache())
+        :param volume: volume (de 0 à 1)
+        :param category: catégorie du canal réservé
+        """
+        self.__filename = filename
+        self.__volume = volume
+        self.__channel = mixer.reserve(category, self)
+
+        frequency, size, channels = pygame.mixer.get_init()
+        frame_size = abs(size) // 8 * channels
+        self.__chunk_size = int(frequency * CHUNK_DURATION) * frame_size
+        # une seule trame de silence : mise en file pour remplacer le morceau suivant lorsque le son s'arrête en fondu
+        self.__silence = pygame.mixer.Sound(buffer=bytes(frame_size))
+
+        # fichier ouvert pendant la lecture, None à l'arrêt
+        self.__file = None
+        self.__loops = 0
+
+    def play(self, loops: int = 0) -> pygame.mixer.Channel or None:
+        self.stop()
+
+        self.__file = open(self.__filename, "rb")
+        self.__loops = loops
+        chunk = self.__next_chunk()
+        if not chunk:
+            return None
+
+        self.__channel.play(chunk)
+        self.update()
+        return self.__channel
+
+    def update(self) -> None:
+        """
+        Met en file le morceau suivant si le canal n'en a plus (appelé par audio.mixer.update()).
+        :return: aucun
+        """
+        if self.__file and not self.__channel.get_queue():
+            chunk = self.__next_chunk()
+            if chunk:
+                self.__channel.queue(chunk)
+
+    def stop(self) -> None:
+        self.__close()
+        self.__channel.stop()
+
+    def fadeout(self, time: int) -> None:
+        if self.__file:
+            self.__close()
+            self.__channel.fadeout(time)
+            # le morceau déjà en file jouerait après le fondu
+            self.__channel.queue(self.__silence)
+
+    def set_volume(self, value: float) -> None:
+        self.__volume = value
+        for sound in (self.__channel.get_sound(), self.__channel.get_queue()):
+            if sound:
+                sound.set_volume(value)
+
+    def get_num_channels(self) -> int:
+        return 1 if self.__file and self.__channel.get_busy() else 0
+
+    def __next_chunk(self) -> pygame.mixer.Sound or None:
+        """
+        Lit le morceau suivant du fichier, en reprenant au début du fichier s'il reste des répétitions.
+        :return: le morceau, None à la fin du son (le fichier est alors fermé)
+        """
+        data = self.__file.read(self.__chunk_size)
+        if len(data) < self.__chunk_size and self.__loops != 0:
+            if self.__loops > 0:
+                self.__loops -= 1
+            self.__file.seek(0)
+            data += self.__file.read(self.__chunk_size - len(data))
+
+        if not data:
+            self.__close()
+            return None
+
+        chunk = pygame.mixer.Sound(buffer=data)
+        chunk.set_volume(self.__volume)
+        return chunk
+
+    def __close(self) -> None:
+        if self.__file:
+            self.__file.close()
+            self.__file = None
+
+
+def decode_to_cache(filename: str) -> str or None:
+    """
+    Décode un son dans le cache (échantillons bruts au format du mélangeur) pour qu'il soit lu par morceaux (voir
+    ChunkedSound). Le son n'est décodé qu'au premier lancement, et n'est en mémoire que le temps de l'écrire : les
+    lancements suivants réutilisent le fichier tant que le son et le format du mélangeur ne changent pas. Les fichiers
+    du même son décodés pour un autre format sont alors supprimés.
+    pygame.mixer doit être initialisé.
+    :param filename: nom du fichier du son
+    :return: nom du fichier d'échantillons bruts, None si le cache ne peut pas être écrit
+    :raises OSError: si le fichier du son est introuvable ou illisible
+    :raises pygame.error: si le son ne peut pas être décodé
+    """
+    key = file_cache.compute_key([filename], ('sound', pygame.mixer.get_init()))
+    if not key:
+        raise OSError(f"Fichier de son introuvable ou illisible : {filename}")
+
+    prefix = 'sound_' + os.path.splitext(os.path.basename(filename))[0].replace('_', '-')
+    cache_filename = file_cache.cache_filename(prefix, key, '.pcm')
+    if os.path.isfile(cache_filename):
+        return cache_filename
+
+    sound = pygame.mixer.Sound(filename)
+    temporary_filename = cache_filename + '.tmp'
+    try:
+        os.makedirs(file_cache.CACHE_DIRECTORY, exist_ok=True)
+        with open(temporary_filename, "wb") as cache_file, memoryview(sound) as samples:
+            cache_file.write(samples)
+        # remplacement atomique : un autre lancement ne lit jamais un fichier à moitié écrit
+        os.replace(temporary_filename, cache_filename)
+    except OSError:
+        print(f"Erreur lors de l'écriture du cache : {cache_filename}")
+        return None
+
+    file_cache.remove_stale(prefix, '.pcm', cache_filename)
+    return cache_filename
+
+
+# budget de canaux (singleton du GoF implémenté avec un Global Object Pattern de python)
+mixer = None
+
+
+def init() -> None:
+    """ Initialise le budget de canaux. pygame.mixer doit être initialisé. """
+    global mixer
+    if not mixer:
+        mixer = __Mixer()
+        mixer.init()
@@ -0,0 +1,265 @@
+# Mesure du temps et de la mémoire de chaque étape du chargement et de l'exécution d'un niveau, sur des bureaux
+# générés de taille croissante (voir level_generator), sans affichage (pilotes factices de SDL)
+# Ce code ne fait pas partie du produit final
+#
+# Utilisation : python benchmarks/run_benchmarks.py [--sizes 25 50 100] [--incidents 0 10 50 100]
+#               [--frames 200] [--output benchmark_results.json]
+#
+# Les étapes mesurées pour chaque taille de bureau :
+#   map2level        conversion de la carte en fichier binaire de niveau (helper_tools.map2level)
+#   level_cold         Level.__init__ sans cache d'image statique (voir level_cache)
+#   level_warm         Level.__init__ avec le cache d'image statique
+#   office_get_image   composition d'une trame du bureau (Office.get_image), personnages en mouvement
+#   view_draw          copie de la vue à l'écran (View.draw), vue d'un joueur
+#   simulation_N       un pas de simulation (headless.Simulation.step) avec N incidents actifs en même temps
+#
+# Pour chaque étape : durée moyenne et minimale d'un appel, pointe de mémoire allouée par Python (tracemalloc,
+# mesurée lors d'un appel supplémentaire pour ne pas fausser les durées) et variation de la mémoire résidente du
+# processus (surfaces de SDL comprises, Linux seulement).
+import argparse
+import datetime
+import gc
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+REPOSITORY_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# numéro du premier niveau généré (les niveaux du jeu ne sont jamais touchés)
+FIRST_LEVEL_NUMBER = 100
+
+# durée (en secondes de temps virtuel) des incidents injectés : aucun n'expire pendant la mesure
+INCIDENT_DURATION = 1e6
+
+
+def prepare_workspace() -> str:
+    """
+    Prépare un répertoire de travail temporaire : les modules du jeu lisent et écrivent leurs fichiers (config.ini,
+    niveaux, cache) relativement au répertoire courant, le dépôt n'est donc jamais modifié.
+    :return: le chemin du répertoire de travail (devenu le répertoire courant)
+    """
+    workspace = tempfile.mkdtemp(prefix='cert93-benchmarks-')
+
+    for directory in ('config', 'img', 'snd'):
+        source = os.path.join(REPOSITORY_DIRECTORY, directory)
+        try:
+            os.symlink(source, os.path.join(workspace, directory), target_is_directory=True)
+        except OSError:
+            shutil.copytree(source, os.path.join(workspace, directory))
+    for directory in ('bin', 'txt'):
+        os.makedirs(os.path.join(workspace, directory))
+
+    os.chdir(workspace)
+    sys.path.insert(0, REPOSITORY_DIRECTORY)
+
+    return workspace
+
+
+def resident_memory() -> int or None:
+    """
+    Retourne la mémoire résidente du processus.
+    :return: nombre d'octets, None si la plateforme ne le permet pas
+    """
+    try:
+        with open('/proc/self/statm', "r") as statm_file:
+            return int(statm_file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def measure(function, calls: int = 1, setup=None) -> dict:
+    """
+    Mesure une étape.
+    :param function: fonction à mesurer (sans paramètre)
+    :param calls: nombre d'appels chronométrés
+    :param setup: fonction (sans paramètre) appelée avant chaque appel, hors chronométrage (None si aucune)
+    :return: dictionnaire des mesures
+    """
+    gc.collect()
+    memory_before = resident_memory()
+
+    durations = []
+    for _ in range(calls):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+
+    memory_after = resident_memory()
+
+    # un appel supplémentaire, sous tracemalloc (qui ralentit fortement l'exécution)
+    if setup:
+        setup()
+    gc.collect()
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {'calls': calls,
+            'mean_ms': sum(durations) / calls * 1000,
+            'min_ms': min(durations) * 1000,
+            'max_ms': max(durations) * 1000,
+            'python_peak_bytes': peak,
+            'resident_delta_bytes': memory_after - memory_before if memory_before is not None else None}
+
+
+def build_offices(sizes: list) -> list:
+    """
+    Génère les bureaux carrés mesurés (voir level_generator) et construit leurs niveaux avec le manifeste de
+    construction de l'espace de travail : les niveaux générés sont vérifiés comme ceux du jeu (voir integrity).
+    :param sizes: largeurs (et hauteurs) des bureaux, en tuiles
+    :return: numéros des niveaux générés, dans l'ordre des tailles
+    """
+    import helper_tools
+    import level_generator
+
+    level_numbers = [FIRST_LEVEL_NUMBER + i for i in range(len(sizes))]
+    for size, level_number in zip(sizes, level_numbers):
+        map_filename = helper_tools.level_filenames(level_number)[0]
+        with open(map_filename, "w") as map_file:
+            map_file.write(level_generator.generate_office(size, size, seed=level_number))
+
+    helper_tools.build_levels(level_numbers)
+    return level_numbers
+
+
+def benchmark_office(size: int, level_number: int, frames: int, incident_counts: list) -> dict:
+    """
+    Mesure toutes les étapes pour un bureau carré généré (voir build_offices()).
+    :param size: largeur et hauteur du bureau (en tuiles)
+    :param level_number: numéro de niveau à utiliser pour les fichiers du bureau
+    :param frames: nombre de trames mesurées pour les étapes d'affichage et de simulation
+    :param incident_counts: nombres d'incidents simultanés à simuler
+    :return: dictionnaire des mesures
+    """
+    import pygame
+
+    import file_cache
+    import helper_tools
+    import headless
+    import incidents
+    import settings
+
+    from expertise import Expertise
+    from level import Level
+    from view import View
+
+    stages = {'map2level': measure(lambda: helper_tools.create_level_file(level_number), calls=3)}
+
+    def clear_cache() -> None:
+        shutil.rmtree(file_cache.CACHE_DIRECTORY, ignore_errors=True)
+
+    def create_level() -> None:
+        Level(level_number).stop()
+
+    stages['level_cold'] = measure(create_level, calls=3, setup=clear_cache)
+    stages['level_warm'] = measure(create_level, calls=3)
+
+    level = Level(level_number)
+    office = level.office
+
+    # les personnages font des allers-retours pour que chaque trame ait des zones à restaurer et à redessiner
+    step = [0]
+    origins = {character: character.feet_position for character in level.characters}
+
+    def move_characters() -> None:
+        step[0] += 1
+        offset = 4 * (step[0] % 8)
+        for character, (x, y) in origins.items():
+            office.move_character(character, (x + offset, y))
+
+    stages['office_get_image'] = measure(lambda: office.get_image(False), calls=frames, setup=move_characters)
+
+    screen = pygame.Surface((settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+    view = View(screen, office, View.WIDTH_ONE_PLAYER, View.HEIGHT)
+    view.center_in_office(level.characters[0].feet_position)
+    office_surface = office.get_image(False)
+    stages['view_draw'] = measure(lambda: view.draw(office_surface), calls=frames)
+
+    level.stop()
+
+    # incidents injectés directement dans les actifs (générateur d'incidents en pause), répartis à tour de rôle
+    for incident_count in incident_counts:
+        simulation = headless.Simulation(level_number, seed=0)
+        simulation.start()
+        incidents.spawner.pause()
+
+        assets = simulation.level.assets[1:]
+        for i in range(incident_count):
+            expertise = Expertise(i % (settings.NB_SKILLS - 1) + 1)
+            assets[i % len(assets)].add_incident(incidents.pool.acquire(expertise, INCIDENT_DURATION))
+
+        stages[f'simulation_{incident_count}'] = measure(simulation.step, calls=frames)
+        simulation.stop()
+
+    columns, rows = office.grid_size
+    return {'size': [columns, rows],
+            'pixels': list(office.size),
+            'assets': len(level.assets),
+            'characters': len(level.characters),
+            'stages': stages}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Mesure des performances sur des bureaux générés")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[25, 50, 100],
+                        help="largeurs (et hauteurs) des bureaux, en tuiles")
+    parser.add_argument('--incidents', type=int, nargs='+', default=[0, 10, 50, 100],
+                        help="nombres d'incidents simultanés à simuler")
+    parser.add_argument('--frames', type=int, default=200, help="nombre de trames mesurées par étape")
+    parser.add_argument('--output', default='benchmark_results.json', help="fichier JSON des résultats")
+    parser.add_argument('--keep', action='store_true', help="conserver le répertoire de travail temporaire")
+    arguments = parser.parse_args()
+
+    output_filename = os.path.abspath(arguments.output)
+    workspace = prepare_workspace()
+
+    # les modules du jeu sont importés après le changement de répertoire (settings lit config/config.ini)
+    import pygame
+
+    import headless
+    from error_codes import ERROR_CODES_TEXT, Error_codes
+
+    # les niveaux générés figurent dans le manifeste de l'espace de travail, lu par la vérification d'intégrité
+    level_numbers = build_offices(arguments.sizes)
+
+    return_code = headless.init()
+    if return_code != Error_codes.SUCCES:
+        print(ERROR_CODES_TEXT[return_code] + " (Code : " + str(return_code) + ")")
+        sys.exit(return_code)
+
+    results = {'date': datetime.datetime.now().isoformat(timespec='seconds'),
+               'python': platform.python_version(),
+               'pygame': pygame.version.ver,
+               'platform': platform.platform(),
+               'frames': arguments.frames,
+               'offices': []}
+
+    try:
+        for size, level_number in zip(arguments.sizes, level_numbers):
+            print(f"Bureau de {size} x {size} tuiles...")
+            office_results = benchmark_office(size, level_number, arguments.frames, arguments.incidents)
+            results['offices'].append(office_results)
+            for stage, values in office_results['stages'].items():
+                print(f"  {stage:<20} {values['mean_ms']:10.3f} ms  (min {values['min_ms']:.3f} ms, "
+                      f"pointe Python {values['python_peak_bytes'] / 1024:.0f} Kio)")
+    finally:
+        pygame.quit()
+        os.chdir(REPOSITORY_DIRECTORY)
+        if not arguments.keep:
+            shutil.rmtree(workspace, ignore_errors=True)
+
+    with open(output_filename, "w") as output_file:
+        json.dump(results, output_file, indent=4)
+    print(f"Résultats : {output_filename}")
+
+
+if __name__ == '__main__':
+    main()
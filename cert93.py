@@ -1,29 +1,45 @@
 #! python3
+import argparse
+import audio
 import pygame
 from error_codes import ERROR_CODES_TEXT, Error_codes
 import incidents
 import input_manager
+import integrity
 import resources
 import settings
 import time
+import timers
 
-# pip install pypiwin32
-import win32api
-import win32con
-import win32gui
+# pip install pypiwin32 (Windows seulement : sans ces modules, les écrans de démarrage ne sont pas transparents)
+try:
+    import win32api
+    import win32con
+    import win32gui
+except ImportError:
+    win32api = win32con = win32gui = None
 
 from tkinter import *
 from tkinter import messagebox
 
 from game import Game
-from helper_tools import create_level_pickles
+from helper_tools import build_levels
+from replay import EventLog
 
 
-def __run_game() -> None:
+def __run_game(seed: int = None, record_filename: str = None, replay_log: EventLog = None) -> None:
+    """
+    Initialise le jeu et exécute une partie.
+    :param seed: graine du générateur pseudo-aléatoire des incidents (None pour une graine au hasard)
+    :param record_filename: fichier où enregistrer le journal d'événements de la partie (None pour ne pas l'enregistrer)
+    :param replay_log: journal d'événements à rejouer (None pour générer les incidents)
+    :return: aucun
+    """
 
     # Initialisation de l'engin de jeu (pygame)
     pygame.init()
     pygame.mixer.init()
+    audio.init()
     pygame.joystick.init()
 
     # Initialisation de la fenetre a la bonne taille, sans frame
@@ -33,16 +49,20 @@ def __run_game() -> None:
     fuchsia = (24, 32, 48)
     screen.fill(fuchsia)  # Remplir le background de fuschia
 
-    # Recuperer le handle de la fenetre
-    hwnd = pygame.display.get_wm_info()["window"]
-    # Mettre la fenetre en mode layered (permet la transparence et meilleur pour les jeux/medias)
-    win32gui.SetWindowLong(hwnd, win32con.GWL_EXSTYLE, win32gui.GetWindowLong(
-        hwnd, win32con.GWL_EXSTYLE) | win32con.WS_EX_LAYERED)
+    # Décodage des sons en arrière-plan pendant les écrans de démarrage
+    resources.start_loading()
 
-    # Set les attribus suivants sur la fenetre layered:
-    # la couleur cle est fuchsia, l'opacite de cette couleur est 0, et le mode est transparence par cle
-    win32gui.SetLayeredWindowAttributes(
-        hwnd, win32api.RGB(*fuchsia), 0, win32con.LWA_COLORKEY)
+    if win32gui:
+        # Recuperer le handle de la fenetre
+        hwnd = pygame.display.get_wm_info()["window"]
+        # Mettre la fenetre en mode layered (permet la transparence et meilleur pour les jeux/medias)
+        win32gui.SetWindowLong(hwnd, win32con.GWL_EXSTYLE, win32gui.GetWindowLong(
+            hwnd, win32con.GWL_EXSTYLE) | win32con.WS_EX_LAYERED)
+
+        # Set les attribus suivants sur la fenetre layered:
+        # la couleur cle est fuchsia, l'opacite de cette couleur est 0, et le mode est transparence par cle
+        win32gui.SetLayeredWindowAttributes(
+            hwnd, win32api.RGB(*fuchsia), 0, win32con.LWA_COLORKEY)
 
     # Splash logo dev
     splash_screen("img\logo_stacknoodles.png", 1, screen)
@@ -50,32 +70,71 @@ def __run_game() -> None:
     # Splash screen logo jeu
     splash_screen("img\logo_cert93.png", 2, screen)
 
-    # Enlever les settings d'opacité à la fenêtre layered
-    win32gui.SetLayeredWindowAttributes(
-        hwnd, win32api.RGB(*fuchsia), 255, win32con.LWA_ALPHA)
+    if win32gui:
+        # Enlever les settings d'opacité à la fenêtre layered
+        win32gui.SetLayeredWindowAttributes(
+            hwnd, win32api.RGB(*fuchsia), 255, win32con.LWA_ALPHA)
     # Création de la fenêtre de jeu
     pygame.display.set_caption("CERT-93")
-    screen = pygame.display.set_mode(
-        (settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT))
+    screen = __create_game_window()
 
-    # Initialisation des ressources spécifiques au jeu
+    # Initialisation des ressources spécifiques au jeu et vérification des fichiers de niveau
     return_code = resources.init()
+    if return_code == Error_codes.SUCCES:
+        return_code = integrity.init()
     if return_code != Error_codes.SUCCES:
-        pygame.quit()
-        messagebox.showerror(
-            "ERREUR", ERROR_CODES_TEXT[return_code] + "\n(Code : " + str(return_code) + ")")
-        quit()
+        __show_error(return_code)
 
     input_manager.init()
+    timers.init()
     incidents.init()
 
-    game = Game(screen)
-    game.run()
+    game = Game(screen, seed, record_filename, replay_log)
+    # la partie ne se termine ici que si un niveau ne peut pas être chargé (fichier altéré ou illisible)
+    return_code = game.run()
+    if return_code != Error_codes.SUCCES:
+        __show_error(return_code)
 
     pygame.quit()
 
 
-def splash_screen(image_path: str, time_up: int, screen: pygame.display.set_mode) -> None:
+def __show_error(return_code: Error_codes) -> None:
+    """
+    Ferme le jeu et affiche le message du code d'erreur spécifié, puis quitte.
+    :param return_code: code d'erreur
+    :return: aucun
+    """
+    pygame.quit()
+    messagebox.showerror(
+        "ERREUR", ERROR_CODES_TEXT[return_code] + "\n(Code : " + str(return_code) + ")")
+    quit()
+
+
+def __create_game_window() -> pygame.Surface:
+    """
+    Crée la fenêtre de jeu, avec synchronisation verticale si demandée (et supportée).
+    :return: la surface représentant l'écran
+    """
+    size = (settings.SCREEN_WIDTH, settings.SCREEN_HEIGHT)
+    if settings.VSYNC:
+        try:
+            # la synchronisation verticale n'est offerte par pygame qu'avec une fenêtre SCALED ou OPENGL
+            return pygame.display.set_mode(size, pygame.SCALED, vsync=1)
+        except pygame.error:
+            print("Synchronisation verticale non supportée, limitation par TARGET_FPS seulement")
+
+    return pygame.display.set_mode(size)
+
+
+def splash_screen(image_path: str, time_up: float, screen: pygame.display.set_mode) -> None:
+    """
+    Affiche un écran de démarrage pendant la durée spécifiée. La fenêtre reste réactive pendant l'attente et les
+    ressources continuent de se charger en arrière-plan (voir resources.start_loading()).
+    :param image_path: image à afficher
+    :param time_up: durée d'affichage (en secondes)
+    :param screen: surface écran
+    :return: aucun
+    """
     splash_image = pygame.image.load(image_path)
 
     origin_x = (settings.SCREEN_WIDTH/2) - (splash_image.get_width()/2)
@@ -83,15 +142,30 @@ def splash_screen(image_path: str, time_up: int, screen: pygame.display.set_mode
     screen.blit(splash_image, (origin_x, origin_y))
 
     pygame.display.update()
-    time.sleep(3)
+
+    end = time.monotonic() + time_up
+    while (remaining := end - time.monotonic()) > 0:
+        pygame.event.pump()
+        time.sleep(min(remaining, 0.05))
 
 
 if __name__ == '__main__':
-    create_level_pickles(1)
-    create_level_pickles(2)
-    create_level_pickles(3)
+    parser = argparse.ArgumentParser(description="CERT-93")
+    parser.add_argument('--seed', type=int, help="graine du générateur d'incidents")
+    parser.add_argument('--record', help="fichier où enregistrer le journal d'événements de la partie")
+    parser.add_argument('--replay', help="journal d'événements à rejouer (même charge d'une partie à l'autre)")
+    arguments = parser.parse_args()
+
+    replay_log = None
+    if arguments.replay:
+        replay_log = EventLog.load(arguments.replay)
+        if not replay_log:
+            quit()
+
+    # seuls les niveaux dont la carte a changé sont reconstruits
+    build_levels([1, 2, 3])
     try:
-        __run_game()
+        __run_game(arguments.seed, arguments.record, replay_log)
     except KeyboardInterrupt:
         pygame.quit()
         quit()
@@ -26,9 +26,11 @@ class Character:
         self.__locked = False
         self.__progress_bar = None
         self.__current_working_incident = None
+        # génération de l'incident en cours de résolution (un incident recyclé change de génération)
+        self.__current_working_generation = None
 
-        font = pygame.font.SysFont(None, 24)
-        self.text_char = font.render(self.__name, True, (255, 255, 255))
+        self.text_char = resources.fonts.render(
+            'LABEL', self.__name, (255, 255, 255))
 
         # Conversion de la position d'une coordonnée en tuile vers une coordonnée en pixels
         x, y = resources.tiles_collection.tile_pos_to_pixel_pos(tile_position)
@@ -36,21 +38,24 @@ class Character:
         # On positionne le personnage au centre de la tuile
         self.__feet_position = x + (tile_width / 2), y + (tile_height/2)
 
-    def draw(self, destination: pygame.Surface, display_name) -> None:
+    def draw(self, destination: pygame.Surface, display_name) -> list:
         """
         Dessine le personnage.
         :param destination: surface sur laquelle dessiner le personnage
-        :return: aucun
+        :param display_name: True pour afficher le nom du personnage
+        :return: liste des rectangles modifiés sur la surface de destination
         """
 
         image = resources.characters_collection.get(self.__character_id)
         x = self.__feet_position[0] - (image.get_width() / 2)
         y = self.__feet_position[1] - image.get_height()
 
-        destination.blit(image, (x, y))
+        dirty_rects = [destination.blit(image, (x, y))]
         if display_name:
-            destination.blit(
-                self.text_char, (x - self.text_char.get_width() / 2, y + image.get_height()))
+            dirty_rects.append(destination.blit(
+                self.text_char, (x - self.text_char.get_width() / 2, y + image.get_height())))
+
+        return dirty_rects
 
     def compute_next_feet_position(self, movement: tuple, delta_time: float) -> tuple:
         """
@@ -74,6 +79,7 @@ class Character:
         expiration_time = incident.duration / \
             10 if self.expertise == incident.expertise or self.__character_id == 5 else incident.duration/5
         self.__current_working_incident = incident
+        self.__current_working_generation = incident.generation
         self.__locked = True
         self.__progress_bar = ProgressBar(expiration_time)
         self.__progress_bar.start()
@@ -81,11 +87,14 @@ class Character:
     def remove_progress_bar(self, incident: Incident) -> None:
         """
         Arrete la resolution, retire la barre de progression et debloque le personage.
+        Un incident recyclé depuis le début de la résolution (autre génération) n'est pas modifié.
         :param incident: l'incident que le personnage resoud.
         :reutrn: aucun
         """
-        incident.unresolve()
+        if incident is not self.__current_working_incident or incident.generation == self.__current_working_generation:
+            incident.unresolve()
         self.__current_working_incident = None
+        self.__current_working_generation = None
         self.__progress_bar.stop()
         self.__progress_bar = None
         self.__locked = False
@@ -95,8 +104,12 @@ class Character:
         return self.__locked
 
     @property
-    def current_working_incident(self) -> Incident:
-        return self.__current_working_incident
+    def current_working_incident(self) -> Incident or None:
+        # une référence vers un incident recyclé (autre génération) est périmée
+        incident = self.__current_working_incident
+        if incident and incident.generation != self.__current_working_generation:
+            return None
+        return incident
 
     @property
     def progress_bar(self) -> ProgressBar:
@@ -1,66 +1,93 @@
+import math
 import pygame
+import resources
 import settings
-import time
-import datetime
-from threading import Thread, Event
+import timers
 
-DEFAULT_FONT_SIZE = 20
+from typing import Callable
 
 TIME_PER_LEVEL = settings.TIME_PER_LEVEL
 
+# temps restants (en secondes) auxquels le minuteur publie un événement, en plus de la fin du temps (0)
+THRESHOLDS = (settings.COUNTDOWN_WARNING_TIME,)
 
-class Countdown(Thread):
+COLOR = (255, 255, 255)
+WARNING_COLOR = (255, 64, 64)
+
+
+class Countdown:
     """ Trames par seconde (minuteur - Countdown). """
 
     def __init__(self) -> None:
         """
         Initialise une instance de Countdown. Un objet Countdowm permet permet d'avoir un minuteur en second.
+        Le temps restant est calculé à la demande (aucune tâche ne décompte le temps, même en pause) et les seuils
+        atteints (voir THRESHOLDS) ainsi que la fin du temps sont publiés aux abonnés (voir subscribe()) plutôt que
+        d'être vérifiés à chaque trame.
         """
-        super().__init__()
-
-        self.__time = TIME_PER_LEVEL
+        # abonnés aux événements du minuteur, appelés avec le temps restant du seuil atteint (0 à la fin du temps)
+        self.__listeners = []
+        self.__is_warning = False
 
-        default_font_name = pygame.font.get_default_font()
-        self.__font = pygame.font.Font(default_font_name, DEFAULT_FONT_SIZE)
+        # le temps restant est calculé à la demande, aucune tâche ne décompte le temps (voir timers.Timer)
+        self.__timer = timers.Timer(TIME_PER_LEVEL, lambda: self.__publish(0))
+        for threshold in THRESHOLDS:
+            self.__timer.add_alarm(threshold, lambda threshold=threshold: self.__publish(threshold))
 
-        self.__surface = None
-
-        # événement servant à arrêter la tâche (va aussi la réveiller si nécessaire)
-        self.__event = Event()
+    def subscribe(self, listener: Callable) -> None:
+        """
+        Abonne une action aux événements du minuteur (seuils de temps restant et fin du temps). Les actions sont
+        appelées par l'ordonnanceur (voir timers.scheduler), jamais pendant une pause.
+        :param listener: action appelée avec le temps restant du seuil atteint (en secondes, 0 à la fin du temps)
+        :return: aucun
+        """
+        self.__listeners.append(listener)
 
-        self.__is_pause = False
+    def __publish(self, remaining_time: float) -> None:
+        """
+        Publie un événement du minuteur aux abonnés.
+        :param remaining_time: temps restant du seuil atteint (0 à la fin du temps)
+        :return: aucun
+        """
+        self.__is_warning = True
+        for listener in self.__listeners:
+            listener(remaining_time)
 
     def timeout(self) -> bool:
-        if self.__time <= 0:
-            return True
-        return False
+        return self.__timer.has_expired()
 
     def reset_timer(self):
-        self.__time = settings.TIME_PER_LEVEL
+        self.__is_warning = False
+        self.__timer.reset(settings.TIME_PER_LEVEL)
+        self.__timer.start()
 
     def pause(self):
-        self.__is_pause = True
+        self.__timer.pause()
 
     def unpause(self):
-        self.__is_pause = False
+        self.__timer.unpause()
 
     def get(self) -> pygame.Surface:
         """
-        Retourne une surface pour l'affichage du minuteur.
+        Retourne une surface pour l'affichage du minuteur. Une fois le premier seuil atteint, le temps restant est
+        affiché au dixième de seconde et en rouge.
         :return: la surface qui contient le texte (Countdown)
         """
-        countdown_str = f"TIME LEFT : {self.__time}"
-        return self.__font.render(countdown_str, True, (255, 255, 255))
+        if self.__is_warning:
+            countdown_str = f"TIME LEFT : {math.ceil(self.__timer.remaining_time * 10) / 10:.1f}"
+            return resources.fonts.render('HUD', countdown_str, WARNING_COLOR)
 
-    def run(self) -> None:
-        """ Tâche de compilation du Countdown. """
+        countdown_str = f"TIME LEFT : {math.ceil(self.__timer.remaining_time)}"
+        return resources.fonts.render('HUD', countdown_str, COLOR)
 
-        while not self.__event.is_set():
-            if self.__is_pause:
-                continue
-            self.__event.wait(1)
-            self.__time -= 1  # sauvegarde le FPS obtenu pour la dernière seconde écoulée
+    def start(self) -> None:
+        """ Démarre le minuteur. """
+        self.__timer.start()
 
     def stop(self) -> None:
-        """ Arrête la tâche Countdown. """
-        self.__event.set()
+        """ Arrête le minuteur. """
+        self.__timer.stop()
+
+    @property
+    def remaining_time(self) -> float:
+        return self.__timer.remaining_time
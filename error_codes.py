@@ -25,6 +25,8 @@ class Error_codes(IntEnum):
     SQUARES_ICONES_CHAR = 702
     IMG_PROGRESS_BAR = 801
     SQUARES_PROGRESS_BAR = 802
+    FONTS = 901
+    INTEGRITY = 1001
 
 
 ERROR_CODES_TEXT = {
@@ -50,4 +52,6 @@ ERROR_CODES_TEXT = {
     Error_codes.SQUARES_ICONES_CHAR: "Erreur lors de la creation des icones de personnages, ils ne sont pas carrés",
     Error_codes.IMG_PROGRESS_BAR: "Erreur lors de du chargement des images pour la barre de progression de tâches",
     Error_codes.SQUARES_PROGRESS_BAR: "Erreur lors de la creation des images de barre de progression, elles ne sont pas carrées",
+    Error_codes.FONTS: "Erreur lors du chargement des polices de caractères",
+    Error_codes.INTEGRITY: "Fichier de niveau modifié ou corrompu",
 }
@@ -0,0 +1,57 @@
+# Cache sur disque des données dérivées des fichiers du jeu (images de bureau déjà composées, sons décodés) : clés de
+# cache calculées à partir du contenu des fichiers sources et nettoyage des fichiers périmés
+import glob
+import hashlib
+import integrity
+import os
+
+CACHE_DIRECTORY = 'cache'
+
+
+def compute_key(filenames: list, parameters: tuple = ()) -> str or None:
+    """
+    Calcule une clé de cache à partir du contenu des fichiers sources et des paramètres qui influencent les données
+    dérivées. Les empreintes des fichiers sont conservées d'un appel à l'autre (voir integrity.file_digest()).
+    :param filenames: fichiers dont dépendent les données
+    :param parameters: paramètres (version du format, valeurs de configuration, constantes, etc.)
+    :return: la clé de cache, None si un des fichiers est illisible
+    """
+    digest = hashlib.sha1()
+    digest.update(repr(parameters).encode())
+
+    for filename in filenames:
+        file_digest = integrity.file_digest(filename)
+        if not file_digest:
+            return None
+        digest.update(file_digest.encode())
+
+    return digest.hexdigest()
+
+
+def cache_filename(prefix: str, key: str, extension: str) -> str:
+    """
+    Retourne le nom d'un fichier du cache.
+    :param prefix: préfixe commun aux fichiers d'une même donnée (toutes clés confondues)
+    :param key: clé de cache (voir compute_key())
+    :param extension: extension du fichier (avec le point)
+    :return: le nom du fichier
+    """
+    return os.path.join(CACHE_DIRECTORY, f'{prefix}_{key}{extension}')
+
+
+def remove_stale(prefix: str, extension: str, kept_filename: str) -> None:
+    """
+    Supprime les fichiers périmés d'une même donnée (calculés pour d'autres clés).
+    :param prefix: préfixe commun aux fichiers de la donnée (voir cache_filename())
+    :param extension: extension des fichiers (avec le point)
+    :param kept_filename: fichier à conserver (celui de la clé courante)
+    :return: aucun
+    """
+    for filename in glob.glob(cache_filename(glob.escape(prefix), '*', glob.escape(extension))):
+        # les clés ne contiennent pas de soulignés : les fichiers d'un autre préfixe plus long sont ignorés
+        key = os.path.basename(filename)[len(prefix) + 1:-len(extension)]
+        if '_' not in key and os.path.normpath(filename) != os.path.normpath(kept_filename):
+            try:
+                os.remove(filename)
+            except OSError:
+                pass
@@ -1,29 +1,23 @@
 import pygame
+import resources
+import timers
 
-from threading import Thread, Event
 
-DEFAULT_FONT_SIZE = 20
-
-
-class FPS(Thread):
+class FPS:
     """ Trames par seconde (frames per second - FPS). """
 
     def __init__(self) -> None:
         """
         Initialise une instance de FPS. Un objet FPS permet d'estimer le nombre de trames par seconde.
         """
-        super().__init__()
-
         self.__tick = 0
         self.__fps = 0
 
-        default_font_name = pygame.font.get_default_font()
-        self.__font = pygame.font.Font(default_font_name, 15)
-
         self.__surface = None
 
-        # événement servant à arrêter la tâche (va aussi la réveiller si nécessaire)
-        self.__event = Event()
+        # prochaine compilation du FPS planifiée auprès de l'ordonnanceur
+        self.__next_sample_time = None
+        self.__handle = None
 
     def tick(self) -> None:
         """
@@ -39,16 +33,25 @@ class FPS(Thread):
         :return: la surface qui contient le texte (FPS)
         """
         fps_str = f"FPS:{self.__fps}"
-        return self.__font.render(fps_str, True, (255, 255, 255))
+        return resources.fonts.render('HUD-SMALL', fps_str, (255, 255, 255))
+
+    def start(self) -> None:
+        """ Démarre la compilation du FPS (une fois par seconde). """
+        self.__next_sample_time = timers.scheduler.now() + 1
+        self.__handle = timers.scheduler.call_at(
+            self.__next_sample_time, self.__sample)
 
-    def run(self) -> None:
-        """ Tâche de compilation du FPS. """
+    def __sample(self) -> None:
+        """ Compilation du FPS, appelée par l'ordonnanceur à chaque seconde. """
+        self.__fps = self.__tick  # sauvegarde le FPS obtenu pour la dernière seconde écoulée
+        self.__tick = 0
 
-        while not self.__event.is_set():
-            self.__event.wait(1)
-            self.__fps = self.__tick  # sauvegarde le FPS obtenu pour la dernière seconde écoulée
-            self.__tick = 0
+        self.__next_sample_time += 1
+        self.__handle = timers.scheduler.call_at(
+            self.__next_sample_time, self.__sample)
 
     def stop(self) -> None:
-        """ Arrête la tâche FPS. """
-        self.__event.set()
+        """ Arrête la compilation du FPS. """
+        if self.__handle:
+            timers.scheduler.cancel(self.__handle)
+            self.__handle = None
@@ -0,0 +1,87 @@
+import time
+
+# délai maximal retourné entre deux trames (en secondes) - évite un déplacement démesuré après un blocage
+MAX_DELTA_TIME = 0.1
+
+# poids de la dernière trame dans la moyenne mobile du delta de temps (de 0.0 à 1.0)
+DELTA_TIME_SMOOTHING = 0.2
+
+# fin d'attente active (en secondes) - la fin de la trame est attendue activement pour plus de précision
+SPIN_TIME = 0.0005
+
+
+class FramePacer:
+    """ Cadence des trames : limite le nombre de trames par seconde et fournit un delta de temps lissé. """
+
+    def __init__(self, target_fps: int) -> None:
+        """
+        Initialise une instance de FramePacer.
+        :param target_fps: nombre de trames par seconde visé (0 pour ne pas limiter, par exemple avec la
+                           synchronisation verticale)
+        """
+        self.__frame_duration = 1 / target_fps if target_fps > 0 else 0
+
+        # horloge monotone haute résolution
+        self.__clock = time.perf_counter
+
+        self.__previous_time = None
+        self.__next_frame_time = None
+        self.__raw_delta_time = 0
+        self.__delta_time = 0
+
+    def reset(self) -> None:
+        """
+        Recommence la cadence à partir de maintenant. À appeler après un blocage volontaire (chargement de niveau,
+        écran de fin, etc.) pour que ce délai ne soit pas compté dans le delta de temps.
+        :return: aucun
+        """
+        self.__previous_time = self.__clock()
+        self.__next_frame_time = self.__previous_time + self.__frame_duration
+        self.__raw_delta_time = self.__frame_duration
+        self.__delta_time = self.__frame_duration
+
+    def tick(self) -> float:
+        """
+        Méthode à appeler une fois par trame. Attend (sans consommer le processeur) le début de la prochaine trame
+        si la limite de trames par seconde est atteinte.
+        :return: le delta de temps lissé (en secondes) à utiliser pour la trame
+        """
+        if self.__previous_time is None:
+            self.reset()
+
+        if self.__frame_duration:
+            self.__wait_until(self.__next_frame_time)
+
+            # si la trame a pris du retard, on repart de maintenant plutôt que de tenter de rattraper le temps perdu
+            self.__next_frame_time = max(self.__next_frame_time + self.__frame_duration,
+                                         self.__clock())
+
+        now = self.__clock()
+        self.__raw_delta_time = min(now - self.__previous_time, MAX_DELTA_TIME)
+        self.__previous_time = now
+
+        self.__delta_time += (self.__raw_delta_time -
+                              self.__delta_time) * DELTA_TIME_SMOOTHING
+
+        return self.__delta_time
+
+    def __wait_until(self, deadline: float) -> None:
+        """
+        Attend jusqu'à l'instant spécifié.
+        :param deadline: instant à attendre (temps de l'horloge de la cadence)
+        :return: aucun
+        """
+        remaining_time = deadline - self.__clock()
+        if remaining_time > SPIN_TIME:
+            time.sleep(remaining_time - SPIN_TIME)
+
+        while self.__clock() < deadline:
+            pass
+
+    @property
+    def delta_time(self) -> float:
+        return self.__delta_time
+
+    @property
+    def raw_delta_time(self) -> float:
+        return self.__raw_delta_time
@@ -1,27 +1,33 @@
 import math
 from multiprocessing import Event
-import random
 import sys 
 
 import pygame
+import random
 import time
 
+import audio
 import incidents
 import input_manager
+import integrity
 import progress_bar
 import resources
 import settings
+import timers
 
 from asset import Asset
 from character import Character
-from expertise import Expertise
 from level import Level
 from score import Score
-from tools import find_distance
 from fps import FPS
 from player import Player
 from view import View
 from countdown import Countdown
+from error_codes import Error_codes
+from expertise import Expertise
+from replay import EventLog, EventType
+from frame_pacer import FramePacer
+from profiler import FrameProfiler
 
 from pygame.locals import JOYDEVICEADDED, JOYDEVICEREMOVED, JOYBUTTONUP, JOYBUTTONDOWN, JOYAXISMOTION, KEYUP, KEYDOWN
 
@@ -29,10 +35,18 @@ from pygame.locals import JOYDEVICEADDED, JOYDEVICEREMOVED, JOYBUTTONUP, JOYBUTT
 class Game:
     """ Une partie. """
 
-    def __init__(self, screen: pygame.Surface) -> None:
+    def __init__(self, screen: pygame.Surface, seed: int = None, record_filename: str = None,
+                 replay_log: EventLog = None) -> None:
         """
         Initialise une instance de partie (objet Game).
+        Comme pour une simulation sans affichage (voir headless.Simulation), les arrivées, affectations, résolutions
+        et expirations d'incidents sont consignées dans un journal daté par trame. Une partie créée à partir d'un
+        journal rejoue les mêmes arrivées et affectations d'incidents aux mêmes trames (par exemple pour mesurer le
+        temps de trame sous une charge identique).
         :param screen: surface représentant l'écran pygame
+        :param seed: graine du générateur pseudo-aléatoire des incidents (None pour une graine au hasard)
+        :param record_filename: fichier où enregistrer le journal à la fin de la partie (None pour ne pas l'enregistrer)
+        :param replay_log: journal à rejouer (None pour générer les incidents)
         """
         self.__screen = screen
         self.__backdrop_surface = pygame.image.load(
@@ -46,21 +60,44 @@ class Game:
 
         self.__score = Score()
         self.__music = resources.sounds_collection.get('BACKGROUND-MUSIC')
-        self.__arrow = resources.arrow.get()
 
         self.__countdown = Countdown()
+        # fin du temps du niveau, publiée par le minuteur (voir __on_countdown_event())
+        self.__is_time_up = False
+        self.__countdown.subscribe(self.__on_countdown_event)
 
         if input_manager.inputs.get_gamepad_count() == 2:
             self.__players = [Player(Player.PLAYER_ONE),
                               Player(Player.PLAYER_TWO)]
         else:
             self.__players = [Player(Player.PLAYER_ONE)]
-        # On commence au lvl 1
-        self.__level_num = 1
+        # code d'erreur de la partie (fichier de niveau altéré ou illisible, voir __load_level())
+        self.__error_code = Error_codes.SUCCES
+
+        # Journal des événements de la partie (voir replay.EventLog)
+        self.__replay_log = replay_log
+        if replay_log:
+            seed = replay_log.seed
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(63)
+        incidents.spawner.seed(seed)
+
+        # On commence au lvl 1 (ou au premier niveau du journal rejoué)
+        self.__level_num = replay_log.level_number if replay_log else 1
+        self.__record_filename = record_filename
+        self.__event_log = EventLog(self.__level_num, seed, 1 / settings.TARGET_FPS)
+        # numéro de la trame (hors pause) dans le niveau courant et événements du niveau à rejouer
+        self.__frame = 0
+        self.__replay_events = None
+        self.__next_replay_event = 0
+
         self.__level = self.__load_level(self.__level_num)
-        self.__views = self.__setup_views(self.__level)
+        self.__views = self.__setup_views(self.__level) if self.__level else {}
 
         self.__fps = FPS()
+        self.__frame_pacer = FramePacer(settings.TARGET_FPS)
+        # profileur des phases de la trame (F3 : afficher les statistiques, F4 : exporter la trace)
+        self.__profiler = FrameProfiler()
         self.__notification_full_time = 5000
         self.__notification_fade_time = 3000
 
@@ -83,49 +120,75 @@ class Game:
         pygame.display.update()
         time.sleep(sleep_time)
 
-    def run(self) -> None:
-        """ Exécute la partie (boucle de jeu). """
+    def run(self) -> Error_codes:
+        """
+        Exécute la partie (boucle de jeu). La partie se termine par quit_game(), sauf si un niveau ne peut pas être
+        chargé.
+        :return: le code d'erreur si un niveau ne peut pas être chargé
+        """
+        if self.__error_code != Error_codes.SUCCES:
+            return self.__error_code
+
         self.__fps.start()
         self.__countdown.start()
 
         victoire = False
         defaite = False
         new_level = False
-        previous_time = time.time()
         self.__music.play(-1)
 
         self.__level.office.enable_ambience()
         incidents.spawner.start()
+        self.__begin_level_events()
 
         while victoire == False and defaite == False:
 
             if new_level:
                 self.__level.office.enable_ambience()
+                self.__is_time_up = False
                 self.__countdown.reset_timer()
                 incidents.spawner.unpause()
                 incidents.spawner.reset()
+                self.__begin_level_events()
                 self.__new_level_notification = pygame.time.get_ticks()+self.__new_level_notif_time
                 self.__current_incident = ""
                 self.__failed_incident_max = 0
                 new_level = False
 
+            # Le chargement du niveau (ou l'écran précédent) ne doit pas compter dans le temps de la première trame
+            self.__frame_pacer.reset()
+
             self.__running = True
             while self.__running:
-                now = time.time()
-                delta_time = now - previous_time
-                previous_time = now
+                # Attente du début de la trame (limite de trames par seconde) et récupération du delta de temps lissé
+                delta_time = self.__frame_pacer.tick()
                 self.__fps.tick()
+                self.__profiler.begin_frame()
 
-                self.__handle_events()
+                # Déclenchement des minuteries échues (incidents, barres de progression, minuteur, générateur)
+                with self.__profiler.phase('timers'):
+                    timers.scheduler.update()
+
+                # Mise en file du morceau suivant des longues boucles sonores lues par morceaux (ambiance du bureau)
+                with self.__profiler.phase('audio'):
+                    audio.mixer.update()
+
+                with self.__profiler.phase('events'):
+                    self.__handle_events()
                 if self.__running:
                     if not self.__is_paused:
                         self.__check_for_player_two()
-                        self.__handle_incidents()
-                    self.__failed_incident_max += self.__update_game_elements(
-                        delta_time)
+                        with self.__profiler.phase('incidents'):
+                            self.__handle_incidents()
+                    with self.__profiler.phase('update'):
+                        self.__failed_incident_max += self.__update_game_elements(
+                            delta_time)
                     self.__update_display()
+                self.__profiler.end_frame()
+                if not self.__is_paused:
+                    self.__frame += 1
 
-                if (self.__countdown.timeout() and self.__failed_incident_max < settings.MAX_MISTAKES):  # passe de niveau
+                if (self.__is_time_up and self.__failed_incident_max < settings.MAX_MISTAKES):  # passe de niveau
                     self.__running = False
                     self.__level_num += 1
                     new_level = True
@@ -140,6 +203,9 @@ class Game:
 
             if self.__level_num <= settings.MAX_MISTAKES:
                 self.__level = self.__load_level(self.__level_num)
+                if not self.__level:
+                    self.__stop()
+                    return self.__error_code
                 self.__views = self.__setup_views(self.__level)
             else:
                 victoire = True
@@ -148,18 +214,24 @@ class Game:
 
         self.quit_game()
 
-    def __load_level(self, number: int) -> Level:
+    def __load_level(self, number: int) -> Level or None:
         """
         Charge le niveau spécifié.
         :param number: numéro du niveau à charger
-        :return: le niveau chargé
+        :return: le niveau chargé, None si le fichier du niveau est altéré ou illisible (voir error_code)
         """
         # Chargement du niveau de jeu
-        level = Level(number)
-
-        # Liaison des actifs au pointage
+        try:
+            level = Level(number)
+        except integrity.IntegrityError as error:
+            print(error)
+            self.__error_code = Error_codes.INTEGRITY
+            return None
+
+        # Liaison des actifs au pointage (et au journal des événements)
         for asset in level.assets:
-            asset.set_solving_action(self.__score.add_points)
+            asset.set_solving_action(
+                lambda points, solved_asset=asset: self.__on_incident_solved(solved_asset, points))
 
         return level
 
@@ -204,13 +276,53 @@ class Game:
         return view
 
     def quit_game(self):
+        self.__stop()
+
+        pygame.quit()
+        sys.exit()
+
+    def __stop(self) -> None:
+        """
+        Arrête le générateur d'incidents, la musique, le calcul des FPS et le minuteur, puis enregistre le journal
+        des événements (s'il y a lieu).
+        """
         incidents.spawner.stop()
         self.__music.stop()
         self.__fps.stop()
         self.__countdown.stop()
 
-        pygame.quit()
-        sys.exit()
+        if self.__record_filename:
+            self.__event_log.save(self.__record_filename)
+            print(f"Journal enregistré : {self.__record_filename}")
+
+    def __begin_level_events(self) -> None:
+        """
+        Commence les événements d'un niveau : marque le début du niveau dans le journal et, si un journal est rejoué,
+        récupère les événements du niveau à rejouer (le générateur d'incidents est alors mis en pause).
+        :return: aucun
+        """
+        self.__frame = 0
+        self.__event_log.record(EventType.LEVEL, 0, value=self.__level_num)
+
+        if self.__replay_log:
+            self.__replay_events = self.__replay_log.level_events(self.__level_num)
+            self.__next_replay_event = 0
+            incidents.spawner.pause()
+
+    def __on_incident_solved(self, asset: Asset, points: int) -> None:
+        """ Action appelée par un actif lorsqu'un de ses incidents est résolu. """
+        self.__score.add_points(points)
+        self.__event_log.record(EventType.SOLVE, self.__frame, asset.active_incident.expertise,
+                                asset.tile_position, points)
+
+    def __on_countdown_event(self, remaining_time: float) -> None:
+        """
+        Reçoit les événements du minuteur du niveau (seuils de temps restant et fin du temps).
+        :param remaining_time: temps restant du seuil atteint (0 à la fin du temps)
+        :return: aucun
+        """
+        if remaining_time == 0:
+            self.__is_time_up = True
 
     def __handle_events(self) -> None:
         """
@@ -222,6 +334,12 @@ class Game:
                 self.__running = False
                 self.quit_game()
 
+            if event.type == KEYDOWN and event.key == pygame.K_F3:
+                self.__profiler.toggle_overlay()
+            elif event.type == KEYDOWN and event.key == pygame.K_F4:
+                if self.__profiler.export_chrome_trace(settings.PROFILER_TRACE_FILENAME):
+                    print(f"Trace exportée : {settings.PROFILER_TRACE_FILENAME}")
+
             if event.type in [KEYDOWN, KEYUP]:
                 input_manager.inputs.manage_keyboard_event(event)
 
@@ -230,21 +348,49 @@ class Game:
 
     def __handle_incidents(self) -> None:
         """
-        Gère les incidents envoyés par le générateur d'incidents.
+        Gère les incidents envoyés par le générateur d'incidents (ou ceux du journal rejoué, prévus pour la trame
+        courante).
         :return: aucun
         """
+        if self.__replay_events is None:
+            for incident in incidents.spawner.get():
+                self.__assign(incident, self.__level.dispatch_incident(incident))
+            return
+
+        # les incidents renvoyés par le centre d'appels sont ignorés : leur affectation est dans le journal
         for incident in incidents.spawner.get():
-            if incident.expertise == Expertise.HELPDESK:
-                self.__level.helpdesk.add_incident(incident)
-            else:
-                # Sélection d'un actif au hasard parmi tous les actifs autres que le centre d'appels
-                asset = random.choice(self.__level.assets[1:])
+            incidents.pool.release(incident)
+
+        while self.__next_replay_event < len(self.__replay_events):
+            _, frame, expertise, tile_position, time_to_solve = self.__replay_events[self.__next_replay_event]
+            if frame > self.__frame:
+                break
 
-                self.__current_incident = "THERE IS A " + \
-                    str(incident.expertise.name) + " INCIDENT AT DESK N°" + \
-                    asset.name.replace('Asset ', '')
-                self.__incident_timer = pygame.time.get_ticks() + self.__notification_full_time
+            asset = self.__level.asset_at(tile_position)
+            if asset:
+                incident = incidents.pool.acquire(Expertise(expertise), time_to_solve)
                 asset.add_incident(incident)
+                self.__assign(incident, asset)
+            self.__next_replay_event += 1
+
+    def __assign(self, incident: incidents.Incident, asset: Asset) -> None:
+        """
+        Consigne l'arrivée (centre d'appels) ou l'affectation (autres actifs) d'un incident et l'annonce.
+        :param incident: l'incident
+        :param asset: l'actif qui a reçu l'incident
+        :return: aucun
+        """
+        if asset is self.__level.helpdesk:
+            event_type = EventType.SPAWN
+        else:
+            event_type = EventType.ASSIGN
+            self.__current_incident = "THERE IS A " + \
+                str(incident.expertise.name) + " INCIDENT AT DESK N°" + \
+                asset.name.replace('Asset ', '')
+            self.__incident_timer = pygame.time.get_ticks() + self.__notification_full_time
+
+        self.__event_log.record(event_type, self.__frame, incident.expertise, asset.tile_position,
+                                incident.duration)
 
     def __check_for_player_two(self) -> None:
         """ Vérifie si le joueur 2 est actif et met à jour le nombre de joueurs en fonction du résultat. """
@@ -279,7 +425,11 @@ class Game:
             self.__move_characters_if_needed(delta_time)
             self.__solve_incidents_if_needed()
             for asset in self.__level.assets:
-                timeoutIndicents += asset.update()
+                incident = asset.active_incident
+                if asset.update():
+                    timeoutIndicents += 1
+                    self.__event_log.record(EventType.EXPIRE, self.__frame, incident.expertise,
+                                            asset.tile_position)
 
         return timeoutIndicents
 
@@ -290,18 +440,45 @@ class Game:
         :return: aucun
         """
         # Affichage de l'image de fond
-        self.__screen.blit(self.__backdrop_surface, (0, 0))
+        with self.__profiler.phase('backdrop'):
+            self.__screen.blit(self.__backdrop_surface, (0, 0))
 
         # Affichade de la ou les vues sur le bureau (donc du bureau, des actifs et des personnages)
-        for view in self.__views.values():
-            view.draw(self.__display_name)
+        # L'image du bureau est composée une seule fois par trame puis partagée par toutes les vues
+        with self.__profiler.phase('office'):
+            office_surface = self.__level.office.get_image(self.__display_name)
+        for number, view in self.__views.items():
+            with self.__profiler.phase(f'view {number + 1}'):
+                view.draw(office_surface)
+
+        # Affichage des informations (minuteur, pointage, erreurs, FPS, notifications, barres de progression, titres)
+        with self.__profiler.phase('hud'):
+            self.__draw_hud()
+
+        # Affichage fleches directionnelles
+        with self.__profiler.phase('arrows'):
+            self.__update_arrow()
 
+        # Affichage des statistiques du profileur (si demandé)
+        self.__profiler.draw(self.__screen, (10, 40))
+
+        # Basculement de tampon (donc affichage de l'écran)
+        with self.__profiler.phase('flip'):
+            pygame.display.flip()
+
+    def __draw_hud(self) -> None:
+        """
+        Affiche les informations par-dessus les vues (minuteur, pointage, erreurs, FPS, notifications, barres de
+        progression et titres).
+        :return: aucun
+        """
         # Affichage du countdown
         countdown_surface = self.__countdown.get()
         self.__screen.blit(countdown_surface, (10, 10))
 
         # Affichage du score
-        score_surface = self.__value_display(self.__score.get_score_display())
+        score_surface = resources.fonts.render(
+            'HUD', self.__score.get_score_display(), (255, 255, 255))
         self.__screen.blit(score_surface, ((
             self.__screen.get_width() / 2)-(score_surface.get_width()/2), 10))
 
@@ -309,8 +486,8 @@ class Game:
         color = (255, 255, 255)
         if (self.__failed_incident_max) > (settings.MAX_MISTAKES-2):
             color = (255, 0, 0)
-        user_errors_surface = self.__font.render(
-            f"MISTAKES MADE : {self.__failed_incident_max} / {settings.MAX_MISTAKES}", True, color)
+        user_errors_surface = resources.fonts.render(
+            'HUD', f"MISTAKES MADE : {self.__failed_incident_max} / {settings.MAX_MISTAKES}", color)
         self.__screen.blit(user_errors_surface, (self.__screen.get_width(
         )-user_errors_surface.get_width()-10, 10))
 
@@ -321,21 +498,24 @@ class Game:
 
         # Affichage nouvel incident
         if pygame.time.get_ticks() < self.__incident_timer:
-            incident_surface = self.__font.render(
-                self.__current_incident, True, (255, 45, 40))
+            incident_surface = resources.fonts.render(
+                'HUD', self.__current_incident, (255, 45, 40))
 
             display_time_left = self.__incident_timer - pygame.time.get_ticks()
 
+            # la surface provient du cache de textes : son alpha est fixé à chaque trame
+            alpha = 255
             if (display_time_left < self.__notification_fade_time):
                 alpha = (display_time_left)/(self.__notification_fade_time/255)
-                incident_surface.set_alpha(alpha)
+            incident_surface.set_alpha(alpha)
 
             self.__screen.blit(incident_surface, ((self.__screen.get_width(
             ) / 2)-(incident_surface.get_width()/2), (self.__screen.get_height() / 10)),)
 
         # Affichage des barres de progression
         for view, player in zip(self.__views.values(), self.__players):
-            for character in self.__level.characters:
+            bounds = self.__view_bounds(view, player)
+            for character in self.__level.office.characters_inside(bounds):
                 if character.progress_bar:
                     self.__update_progress_bar(view, player, character)
 
@@ -347,12 +527,6 @@ class Game:
         if self.__is_paused:
             self.__display_title("PAUSE")
 
-        # Affichage fleches directionnelles
-        self.__update_arrow()
-
-        # Basculement de tampon (donc affichage de l'écran)
-        pygame.display.flip()
-
     def __update_progress_bar(self, view: View, player: Player, character: Character) -> None:
         # Calculs des vecteurs
         vector_x = character.feet_position[0] - \
@@ -369,25 +543,32 @@ class Game:
                  (2 * len(self.__players))) + vector_x
         bar_y = (self.__screen.get_height() / 2) + vector_y
 
-        # Affichage si la barre est dans l'ecran
-        if not (character.feet_position[0] > player.character.feet_position[0] + view.view_width / 2 or
-                character.feet_position[1] > player.character.feet_position[1] + view.view_heigth / 2 or
-                character.feet_position[0] < player.character.feet_position[0] - view.view_width / 2 or
-                character.feet_position[1] < player.character.feet_position[1] - view.view_heigth / 2):
-            progress_bar_id = progress_bar.compute_progress_bar_id(
-                character.progress_bar)
-            progress_bar_surface = resources.progress_bar_collection.get(
-                progress_bar_id)
-            self.__screen.blit(progress_bar_surface, (
-                bar_x - character.icon.get_width() / 2, bar_y - character.icon.get_width() * 2))
+        # Affichage (le personnage est dans l'ecran, voir __view_bounds)
+        progress_bar_id = progress_bar.compute_progress_bar_id(
+            character.progress_bar)
+        progress_bar_surface = resources.progress_bar_collection.get(
+            progress_bar_id)
+        self.__screen.blit(progress_bar_surface, (
+            bar_x - character.icon.get_width() / 2, bar_y - character.icon.get_width() * 2))
+
+    @staticmethod
+    def __view_bounds(view: View, player: Player) -> tuple:
+        """
+        Retourne la zone du bureau visible dans la vue d'un joueur (centrée sur son personnage).
+        :param view: la vue
+        :param player: le joueur
+        :return: zone (gauche, haut, droite, bas) en pixels
+        """
+        x, y = player.character.feet_position
+        half_width = view.view_width / 2
+        half_height = view.view_heigth / 2
+        return x - half_width, y - half_height, x + half_width, y + half_height
 
     def __display_title(self, title: str) -> None:
         """Affiche un gros titre blanc"""
-        text_font = pygame.font.Font(pygame.font.get_default_font(), 120)
-        outline_font = pygame.font.Font(pygame.font.get_default_font(), 120)
-
-        outline_surface = outline_font.render(title, True, (0, 0, 0))
-        title_surface = text_font.render(title, True, (210, 210, 190))
+        outline_surface = resources.fonts.render('TITLE', title, (0, 0, 0))
+        title_surface = resources.fonts.render(
+            'TITLE', title, (210, 210, 190))
 
         self.__screen.blit(outline_surface, ((self.__screen.get_width(
         ) / 2)-(outline_surface.get_width()/2) - 10, (self.__screen.get_height() / 5) + 10),)
@@ -403,85 +584,72 @@ class Game:
             return
 
         for view, player in zip(self.__views.values(), self.__players):
+            bounds = self.__view_bounds(view, player)
 
-            # Vers les personnages
-            for character in self.__level.characters:
+            # Vers les personnages hors de l'ecran
+            for character in self.__level.office.characters_outside(bounds):
                 self.__draw_arrow(character.feet_position,
                                   player, view, character.icon)
 
-            # Vers les incidents des assets
-            for asset in self.__level.assets:
+            # Vers les incidents des assets hors de l'ecran
+            for asset in self.__level.office.assets_outside(bounds):
                 if asset.active_incident:
                     self.__draw_arrow(asset.center_position,
                                       player, view, asset.image_incident)
 
     def __draw_arrow(self, position: tuple, player: Player, view: View, icon: pygame.Surface) -> None:
         """
-        Dessine une fleche sur un ecran donné en fonction d'une position cible
+        Dessine une fleche sur un ecran donné en fonction d'une position cible (hors de l'ecran, voir __update_arrow)
         :param position: La position cible vers laquelle orienter la fleche
         :param player: Le joueur de qui part la fleche
         :param view: La vue sur laquelle afficher la fleche
         :param icon: L'icone à afficher avec la fleche
         :return: aucun
         """
-        # Si la position cible est hors de l'ecran
-        if (position[0] > player.character.feet_position[0] + view.view_width / 2 or
-            position[1] > player.character.feet_position[1] + view.view_heigth / 2 or
-            position[0] < player.character.feet_position[0] - view.view_width / 2 or
-                position[1] < player.character.feet_position[1] - view.view_heigth / 2):
-
-            # Calcul de la position de la position cible en fonction du centre de chaque ecran
-            # On veut limiter la fleches aux limites de l'ecran
-
-            # Calculs des vecteurs
-            vector_x = position[0] - player.character.feet_position[0]
-            vector_y = position[1] - player.character.feet_position[1]
-
-            # Largeur
-            if vector_x < -view.view_width / 2:
-                vector_x = - view.view_width / 2
-            elif vector_x > view.view_width / 2:
-                # - 15 pour raprocher la fleche de l'ecran
-                vector_x = view.view_width / 2 - 15
-
-            # Hauteur
-            if vector_y < -view.view_heigth / 2:
-                vector_y = - view.view_heigth / 2
-            elif vector_y > view.view_heigth / 2:
-                # - 15 pour raprocher la fleche de l'ecran
-                vector_y = view.view_heigth / 2 - 15
-
-            # Calcul de l'angle de rotation
-            # - car sens anti horaire, +90 car atan2 par de la droite alors qu'on veut partir du top
-            angle = - (math.degrees(math.atan2(vector_y, vector_x)) + 90)
-
-            # Rotation de la fleche en fonction de l'angle
-            rotated_arrow = pygame.transform.rotate(self.__arrow, angle)
-
-            # Coordonées de la fleche en fonction de l'ecran
-            if view == self.__views[0]:
-                multiplier = 1
-            else:
-                multiplier = 3
-            arrow_x = (multiplier * self.__screen.get_width() /
-                       (2 * len(self.__players))) + vector_x
-            arrow_y = (self.__screen.get_height() / 2) + vector_y
-
-            # Coordonées pour l'icone (décalée de quelques %tages des bords de l'ecran, trouver une solution plus jolie si possible)
-            icon_x = arrow_x - vector_x * 0.05
-            icon_y = arrow_y - vector_y * 0.07
+        # Calcul de la position de la position cible en fonction du centre de chaque ecran
+        # On veut limiter la fleches aux limites de l'ecran
 
-            # Affichage
-            self.__screen.blit(icon, (icon_x, icon_y))
-            self.__screen.blit(rotated_arrow, (arrow_x, arrow_y))
-
-    def __value_display(self, string_display) -> pygame.Surface:
-        default_font_name = pygame.font.get_default_font()
+        # Calculs des vecteurs
+        vector_x = position[0] - player.character.feet_position[0]
+        vector_y = position[1] - player.character.feet_position[1]
+
+        # Largeur
+        if vector_x < -view.view_width / 2:
+            vector_x = - view.view_width / 2
+        elif vector_x > view.view_width / 2:
+            # - 15 pour raprocher la fleche de l'ecran
+            vector_x = view.view_width / 2 - 15
+
+        # Hauteur
+        if vector_y < -view.view_heigth / 2:
+            vector_y = - view.view_heigth / 2
+        elif vector_y > view.view_heigth / 2:
+            # - 15 pour raprocher la fleche de l'ecran
+            vector_y = view.view_heigth / 2 - 15
+
+        # Calcul de l'angle de rotation
+        # - car sens anti horaire, +90 car atan2 par de la droite alors qu'on veut partir du top
+        angle = - (math.degrees(math.atan2(vector_y, vector_x)) + 90)
+
+        # Fleche tournée en fonction de l'angle (orientation précalculée la plus proche)
+        rotated_arrow = resources.arrow.get_rotated(angle)
+
+        # Coordonées de la fleche en fonction de l'ecran
+        if view == self.__views[0]:
+            multiplier = 1
+        else:
+            multiplier = 3
+        arrow_x = (multiplier * self.__screen.get_width() /
+                   (2 * len(self.__players))) + vector_x
+        arrow_y = (self.__screen.get_height() / 2) + vector_y
 
-        self.__font = pygame.font.Font(default_font_name, 20)
+        # Coordonées pour l'icone (décalée de quelques %tages des bords de l'ecran, trouver une solution plus jolie si possible)
+        icon_x = arrow_x - vector_x * 0.05
+        icon_y = arrow_y - vector_y * 0.07
 
-        return self.__font.render(string_display, True,
-                                  (255, 255, 255))
+        # Affichage
+        self.__screen.blit(icon, (icon_x, icon_y))
+        self.__screen.blit(rotated_arrow, (arrow_x, arrow_y))
 
     def __add_player_two(self) -> None:
         """
@@ -599,7 +767,8 @@ class Game:
                     movement, delta_time)
                 if self.__level.office.in_navmesh(next_feet_position):
                     # déplacement du personnage
-                    character.feet_position = next_feet_position
+                    self.__level.office.move_character(
+                        character, next_feet_position)
                     # repositionnement de la vue puisque le personnage s'est déplacé
                     self.__views[player.number].center_in_office(
                         character.feet_position)
@@ -677,24 +846,8 @@ class Game:
         :param character: personnage
         :return: l'actif si trouvé, None si aucun actif trouvé
         """
-        asset_found = None
-        distance_found = settings.ACTIONABLE_DISTANCE + 1
-
-        for asset in self.__level.assets:
-            distance = find_distance(
-                asset.center_position, character.feet_position)
-            if distance <= settings.ACTIONABLE_DISTANCE:
-                if asset_found:
-                    # un actif avait déjà été trouvé, on vérifie donc si celui-ci est plus proche du personnage
-                    if distance < distance_found:
-                        asset_found = asset
-                        distance_found = distance
-                else:
-                    # c'est le premier actif à distance d'activation qui est trouvé
-                    asset_found = asset
-                    distance_found = distance
-
-        return asset_found
+        # recherche dans l'index spatial du bureau (seuls les actifs des cellules voisines sont examinés)
+        return self.__level.office.find_closest_asset(character.feet_position, settings.ACTIONABLE_DISTANCE)
 
     def __pause_game_if_needed(self) -> None:
         """
@@ -0,0 +1,373 @@
+# Mode sans affichage : simulation complète d'un niveau (générateur d'incidents, centre d'appels, actifs,
+# personnages et pointage) sans fenêtre, menée par une horloge virtuelle
+#
+# Utilisation : python headless.py [numéro de niveau] [nombre de parties] [--seed GRAINE] [--record JOURNAL]
+#               python headless.py --replay JOURNAL
+import argparse
+import os
+import random
+import sys
+import time
+
+# les pilotes vidéo et audio factices de SDL doivent être choisis avant l'initialisation de pygame
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+import audio
+import incidents
+import integrity
+import resources
+import settings
+import timers
+
+from character import Character
+from countdown import Countdown
+from error_codes import ERROR_CODES_TEXT, Error_codes
+from expertise import Expertise
+from incidents import Incident
+from level import Level
+from replay import EventLog, EventType
+from score import Score
+from tools import find_distance
+
+# pas de simulation par défaut (en secondes) - une trame du jeu
+DEFAULT_TIME_STEP = 1 / 60
+
+# horloge virtuelle partagée par l'ordonnanceur (voir init())
+clock = None
+
+
+def init() -> Error_codes:
+    """
+    Initialise pygame sans fenêtre, l'ordonnanceur (avec une horloge virtuelle), les ressources, la vérification
+    des fichiers de niveau et le générateur d'incidents. À appeler une seule fois, avant de créer une simulation.
+    :return: le code de succes si l'initialisation s'est bien passée, le code d'erreur sinon
+    """
+    global clock
+    if clock:
+        return Error_codes.SUCCES
+
+    pygame.init()
+    pygame.mixer.init()
+    audio.init()
+
+    # une surface d'affichage (invisible) est nécessaire aux conversions d'images (convert(), convert_alpha())
+    pygame.display.set_mode((1, 1))
+
+    clock = timers.VirtualClock()
+    timers.init(clock)
+
+    return_code = resources.init()
+    if return_code == Error_codes.SUCCES:
+        return_code = integrity.init()
+    if return_code != Error_codes.SUCCES:
+        return return_code
+
+    incidents.init()
+
+    return Error_codes.SUCCES
+
+
+class Simulation:
+    """
+    Une partie simulée sur un niveau, sans affichage ni joueurs.
+    Les personnages sont menés par un pilote automatique : chaque personnage libre se rend à l'incident actif le
+    plus proche (en privilégiant ceux de son expertise) et le résout. Le déplacement est modélisé par un temps de
+    trajet (distance en ligne droite divisée par la vitesse du personnage), sans recherche de chemin.
+    Les arrivées d'appels, affectations, résolutions et expirations d'incidents sont consignées dans un journal
+    (voir replay.EventLog). Une simulation créée à partir d'un journal rejoue exactement les mêmes arrivées et
+    affectations d'incidents, aux mêmes pas de simulation, sans tirage aléatoire.
+    """
+
+    def __init__(self, level_number: int, time_step: float = DEFAULT_TIME_STEP, seed: int = None,
+                 replay_log: EventLog = None) -> None:
+        """
+        Initialise une simulation (objet Simulation). headless.init() doit avoir été appelée.
+        Si le fichier du niveau est altéré ou illisible, error_code vaut Error_codes.INTEGRITY et la simulation ne
+        peut pas être menée.
+        :param level_number: numéro du niveau à simuler (ignoré si un journal est rejoué)
+        :param time_step: pas de simulation en secondes de temps virtuel (ignoré si un journal est rejoué)
+        :param seed: graine du générateur pseudo-aléatoire des incidents (None pour une graine au hasard)
+        :param replay_log: journal à rejouer (None pour générer les incidents)
+        """
+        assert clock, "headless.init() doit être appelée avant de créer une simulation"
+
+        # événements d'arrivée et d'affectation à rejouer (None si les incidents sont générés)
+        self.__replay_events = None
+        self.__next_replay_event = 0
+        if replay_log:
+            level_number = replay_log.level_number
+            time_step = replay_log.time_step
+            seed = replay_log.seed
+            self.__replay_events = replay_log.level_events(level_number)
+
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(63)
+        incidents.spawner.seed(seed)
+
+        self.__time_step = time_step
+        self.__seed = seed
+        self.__event_log = EventLog(level_number, seed, time_step)
+
+        self.__score = Score()
+        self.__error_code = Error_codes.SUCCES
+        try:
+            self.__level = Level(level_number)
+        except integrity.IntegrityError as error:
+            print(error)
+            self.__level = None
+            self.__error_code = Error_codes.INTEGRITY
+            return
+
+        for asset in self.__level.assets:
+            asset.set_solving_action(
+                lambda points, solved_asset=asset: self.__on_incident_solved(solved_asset, points))
+
+        self.__countdown = Countdown()
+
+        # personnage -> (actif visé, incident visé, génération de l'incident visé, instant d'arrivée)
+        self.__assignments = {}
+
+        self.__steps = 0
+        self.__spawned = 0
+        self.__dispatched = 0
+        self.__solved = 0
+        self.__mistakes = 0
+
+    def run(self, duration: float = None) -> dict:
+        """
+        Simule le niveau jusqu'à la fin du temps alloué (ou de la durée spécifiée) ou jusqu'au nombre maximal
+        d'erreurs.
+        :param duration: durée maximale à simuler (en secondes de temps virtuel), temps du niveau si None
+        :return: rapport de la simulation (voir __report())
+        """
+        started_at = time.perf_counter()
+        simulation_start = clock()
+        end = simulation_start + (duration if duration is not None else settings.TIME_PER_LEVEL)
+
+        self.start()
+        while clock() < end and not self.__countdown.timeout() and self.__mistakes < settings.MAX_MISTAKES:
+            self.step()
+        self.stop()
+
+        return self.__report(clock() - simulation_start, time.perf_counter() - started_at)
+
+    def start(self) -> None:
+        """
+        Démarre la partie : compte à rebours et générateur d'incidents. Appelée par run(); à appeler directement
+        seulement pour mener la simulation pas à pas (voir step()).
+        :return: aucun
+        """
+        self.__countdown.reset_timer()
+        if self.__replay_events is None:
+            incidents.spawner.unpause()
+        else:
+            # les incidents proviennent du journal : le générateur reste en pause
+            incidents.spawner.pause()
+        incidents.spawner.reset()
+
+    def stop(self) -> None:
+        """
+        Termine la partie : arrête les minuteries du niveau et le compte à rebours.
+        :return: aucun
+        """
+        self.__level.stop()
+        self.__countdown.stop()
+
+    def step(self) -> None:
+        """
+        Avance la simulation d'un pas : temps virtuel, minuteries, incidents, personnages et actifs.
+        :return: aucun
+        """
+        clock.advance(self.__time_step)
+        timers.scheduler.update()
+
+        if self.__replay_events is None:
+            for incident in incidents.spawner.get():
+                self.__assign(incident, self.__level.dispatch_incident(incident))
+        else:
+            # les incidents renvoyés par le centre d'appels sont ignorés : leur affectation est dans le journal
+            for incident in incidents.spawner.get():
+                incidents.pool.release(incident)
+            self.__replay_step()
+
+        self.__drive_characters()
+
+        for asset in self.__level.assets:
+            incident = asset.active_incident
+            if asset.update():
+                self.__mistakes += 1
+                self.__event_log.record(EventType.EXPIRE, self.__steps, incident.expertise,
+                                        asset.tile_position)
+
+        self.__steps += 1
+
+    def __replay_step(self) -> None:
+        """ Confie aux actifs les incidents du journal rejoué prévus pour le pas de simulation courant. """
+        while self.__next_replay_event < len(self.__replay_events):
+            _, step, expertise, tile_position, time_to_solve = self.__replay_events[self.__next_replay_event]
+            if step > self.__steps:
+                break
+
+            incident = incidents.pool.acquire(Expertise(expertise), time_to_solve)
+            asset = self.__level.asset_at(tile_position)
+            asset.add_incident(incident)
+            self.__assign(incident, asset)
+            self.__next_replay_event += 1
+
+    def __assign(self, incident: Incident, asset) -> None:
+        """ Consigne l'arrivée (centre d'appels) ou l'affectation (autres actifs) d'un incident. """
+        if asset is self.__level.helpdesk:
+            self.__spawned += 1
+            event_type = EventType.SPAWN
+        else:
+            self.__dispatched += 1
+            event_type = EventType.ASSIGN
+
+        self.__event_log.record(event_type, self.__steps, incident.expertise, asset.tile_position,
+                                incident.duration)
+
+    def __drive_characters(self) -> None:
+        """ Pilote automatique des personnages : affectation, déplacement et résolution des incidents. """
+        now = clock()
+        targeted_incidents = {incident for _, incident, generation, _ in self.__assignments.values()
+                              if incident.generation == generation}
+
+        for character in self.__level.characters:
+            assignment = self.__assignments.get(character)
+            if not assignment:
+                asset = self.__choose_asset(character, targeted_incidents)
+                if asset:
+                    incident = asset.active_incident
+                    travel_time = find_distance(
+                        character.feet_position, asset.center_position) / character.speed
+                    self.__assignments[character] = (
+                        asset, incident, incident.generation, now + travel_time)
+                    targeted_incidents.add(incident)
+                continue
+
+            asset, incident, generation, arrival_time = assignment
+            if asset.active_incident is not incident or incident.generation != generation:
+                # l'incident a expiré (ou a été résolu) avant la fin du travail du personnage
+                if character.progress_bar:
+                    character.remove_progress_bar(incident)
+                del self.__assignments[character]
+            elif now < arrival_time:
+                continue
+            elif asset is self.__level.helpdesk:
+                self.__level.office.move_character(
+                    character, asset.center_position)
+                asset.solve_incident()
+                del self.__assignments[character]
+            elif not character.progress_bar:
+                self.__level.office.move_character(
+                    character, asset.center_position)
+                character.add_progress_bar(incident)
+            elif character.progress_bar.is_solved:
+                character.remove_progress_bar(incident)
+                asset.solve_incident()
+                del self.__assignments[character]
+
+    def __choose_asset(self, character: Character, targeted_incidents: set):
+        """
+        Choisit l'actif vers lequel envoyer un personnage libre.
+        :param character: le personnage
+        :param targeted_incidents: incidents déjà pris en charge par un autre personnage
+        :return: l'actif choisi, None si aucun incident n'est disponible
+        """
+        best_asset = None
+        best_key = None
+        for asset in self.__level.assets:
+            incident = asset.active_incident
+            if not incident or incident in targeted_incidents or incident.is_being_resolved:
+                continue
+
+            is_expert = character.expertise in (incident.expertise, Expertise.SUPERHERO) or \
+                incident.expertise == Expertise.HELPDESK
+            key = (not is_expert, find_distance(
+                character.feet_position, asset.center_position))
+            if best_key is None or key < best_key:
+                best_asset = asset
+                best_key = key
+
+        return best_asset
+
+    def __on_incident_solved(self, asset, points: int) -> None:
+        """ Action appelée par un actif lorsqu'un de ses incidents est résolu. """
+        self.__solved += 1
+        self.__score.add_points(points)
+        self.__event_log.record(EventType.SOLVE, self.__steps, asset.active_incident.expertise,
+                                asset.tile_position, points)
+
+    def __report(self, simulated_time: float, wall_time: float) -> dict:
+        """
+        Construit le rapport de la simulation.
+        :param simulated_time: temps virtuel simulé (en secondes)
+        :param wall_time: temps réel écoulé (en secondes)
+        :return: dictionnaire du rapport
+        """
+        return {'level': self.__level.number,
+                'seed': self.__seed,
+                'simulated_time': simulated_time,
+                'wall_time': wall_time,
+                'speedup': simulated_time / wall_time if wall_time else float('inf'),
+                'steps': self.__steps,
+                'calls': self.__spawned,
+                'incidents': self.__dispatched,
+                'solved': self.__solved,
+                'mistakes': self.__mistakes,
+                'score': self.__score.get_score()}
+
+    @property
+    def level(self) -> Level:
+        return self.__level
+
+    @property
+    def error_code(self) -> Error_codes:
+        return self.__error_code
+
+    @property
+    def event_log(self) -> EventLog:
+        return self.__event_log
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Simulation d'un niveau sans affichage")
+    parser.add_argument('level', type=int, nargs='?', default=1, help="numéro du niveau")
+    parser.add_argument('runs', type=int, nargs='?', default=1, help="nombre de parties")
+    parser.add_argument('--seed', type=int, help="graine du générateur d'incidents (première partie)")
+    parser.add_argument('--record', help="fichier où enregistrer le journal d'événements de chaque partie")
+    parser.add_argument('--replay', help="journal d'événements à rejouer")
+    arguments = parser.parse_args()
+
+    return_code = init()
+    if return_code != Error_codes.SUCCES:
+        print(ERROR_CODES_TEXT[return_code] + " (Code : " + str(return_code) + ")")
+        sys.exit(return_code)
+
+    replay_log = None
+    if arguments.replay:
+        replay_log = EventLog.load(arguments.replay)
+        if not replay_log:
+            sys.exit(1)
+
+    for run in range(arguments.runs):
+        seed = arguments.seed + run if arguments.seed is not None else None
+        simulation = Simulation(arguments.level, seed=seed, replay_log=replay_log)
+        if simulation.error_code != Error_codes.SUCCES:
+            print(ERROR_CODES_TEXT[simulation.error_code] + " (Code : " + str(simulation.error_code) + ")")
+            sys.exit(simulation.error_code)
+        report = simulation.run()
+        print(', '.join(f'{key}: {value:.2f}' if isinstance(value, float) else f'{key}: {value}'
+                        for key, value in report.items()))
+
+        if arguments.record:
+            filename = arguments.record
+            if arguments.runs > 1:
+                base, extension = os.path.splitext(filename)
+                filename = f'{base}-{run + 1}{extension}'
+            simulation.event_log.save(filename)
+
+    pygame.quit()
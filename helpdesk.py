@@ -1,12 +1,11 @@
 import math
-import random
 
 import resources
 import settings
 
 from asset import Asset
 import incidents
-from incidents import Incident, Expertise
+from incidents import Expertise
 
 
 class Helpdesk(Asset):
@@ -49,12 +48,14 @@ class Helpdesk(Asset):
                 remaining_percentage = self._active_incident.get_remaining_time_percentage()
                 self._solving_action(math.floor(remaining_percentage))
             self._stop_the_phone()
-            self._active_incident.stop()
+            incidents.pool.release(self._active_incident)
             self._active_incident = None
+            self._notify_load_changed()
 
             # Redistribution de l'incident vers un actif autre que le centre d'appels
             # en le renvoyant à travers le spawner
-            incident_type = random.choice(self.__incident_types)
+            incident_type = incidents.spawner.random.choice(
+                self.__incident_types)
 
             # Initialisation des temps par défaut a 30/60
             __time_to_solve_min = 30
@@ -65,10 +66,10 @@ class Helpdesk(Asset):
                 __time_to_solve_min = settings.DEFAULT_TIME_TO_SOLVE_MIN
                 __time_to_solve_max = settings.DEFAULT_TIME_TO_SOLVE_MAX
 
-            # Randomizer le time to solve par defaut et creer l'incident
-            time_to_solve = random.randint(
+            # Randomizer le time to solve par defaut et creer l'incident (recyclé par la réserve d'incidents)
+            time_to_solve = incidents.spawner.random.randint(
                 __time_to_solve_min, __time_to_solve_max)
-            incident = Incident(incident_type, time_to_solve)
+            incident = incidents.pool.acquire(incident_type, time_to_solve)
             incidents.spawner.put(incident)
 
     def _ring_the_phone(self) -> None:
@@ -1,31 +1,141 @@
 # Outils pour assister avec la construction des fichiers binaires utilisés par le jeu
 # Ce code ne fait pas partie du produit final
 from expertise import Expertise
-import pickle
-import hashlib
-import configparser
-config = configparser.ConfigParser(inline_comment_prefixes="#")
-config.read("config/config.ini")
+from array import array
+from level_file import LevelFile
+import integrity
+import settings
+import os
+import json
 
+# manifeste de construction : état des fichiers sources et des fichiers produits lors de la dernière construction
+BUILD_MANIFEST_FILENAME = settings.BUILD_MANIFEST_FILENAME
 
-def create_level_pickles(number: int) -> None:
-    map_filename = f'txt/level{number}.txt'
+# à incrémenter lorsque la conversion des cartes change (force la reconstruction de tous les niveaux)
+LEVEL_BUILD_VERSION = 3
 
-    fw_filename = f'bin/floor_and_walls{number}.pickle'
-    c_filename = f'bin/characters{number}.pickle'
-    a_filename = f'bin/assets{number}.pickle'
 
-    map2pickles(map_filename, fw_filename, c_filename, a_filename)
+def level_filenames(number: int) -> tuple:
+    """
+    Retourne les noms des fichiers d'un niveau.
+    :param number: numéro de niveau
+    :return: (carte source, fichier binaire du niveau)
+    """
+    return f'txt/level{number}.txt', f'bin/level{number}.bin'
+
+
+def create_level_file(number: int) -> bool:
+    map_filename, level_filename = level_filenames(number)
+
+    return map2level(map_filename, level_filename)
+
+
+def build_levels(numbers: list) -> list:
+    """
+    Construction incrémentale des niveaux : seuls les niveaux dont la carte source ou le fichier binaire ont changé
+    depuis la dernière construction (selon le manifeste) sont reconstruits. Aucun fichier n'est écrit si rien n'a
+    changé.
+    :param numbers: numéros des niveaux à construire
+    :return: liste des numéros des niveaux reconstruits
+    """
+    manifest = __load_manifest()
+    levels = manifest.setdefault('levels', {})
+
+    rebuilt = []
+    for number in numbers:
+        entry = levels.get(str(number))
+        if entry and __is_level_up_to_date(number, entry):
+            continue
+
+        if create_level_file(number):
+            levels[str(number)] = __describe_level(number)
+            rebuilt.append(number)
+
+    if rebuilt:
+        __save_manifest(manifest)
+
+    return rebuilt
+
+
+def __is_level_up_to_date(number: int, entry: dict) -> bool:
+    """
+    Vérifie si le fichier binaire d'un niveau correspond à sa carte source.
+    La taille et la date de modification de la carte sont comparées d'abord; le contenu n'est haché que si elles
+    diffèrent (fichier copié, extrait à nouveau, etc.).
+    :param number: numéro de niveau
+    :param entry: description du niveau dans le manifeste (voir __describe_level())
+    :return: True si le niveau est à jour, False s'il doit être reconstruit
+    """
+    map_filename, level_filename = level_filenames(number)
+
+    if entry.get('version') != LEVEL_BUILD_VERSION:
+        return False
+
+    try:
+        source_stat = os.stat(map_filename)
+        if os.stat(level_filename).st_size != entry['outputs'].get(level_filename, {}).get('size'):
+            return False
+    except OSError:
+        return False
+
+    source = entry['source']
+    if source_stat.st_size != source['size']:
+        return False
+
+    if source_stat.st_mtime_ns == source['mtime_ns']:
+        return True
+
+    return integrity.file_digest(map_filename) == source['sha1']
+
+
+def __describe_level(number: int) -> dict:
+    """
+    Décrit l'état des fichiers d'un niveau pour le manifeste.
+    :param number: numéro de niveau
+    :return: version de construction, taille, date de modification et empreinte de la carte source, taille et
+             empreinte du fichier binaire produit (vérifiée au démarrage du jeu, voir integrity)
+    """
+    map_filename, level_filename = level_filenames(number)
+    source_stat = os.stat(map_filename)
 
+    return {'version': LEVEL_BUILD_VERSION,
+            'source': {'size': source_stat.st_size,
+                       'mtime_ns': source_stat.st_mtime_ns,
+                       'sha1': integrity.file_digest(map_filename)},
+            'outputs': {level_filename: {'size': os.stat(level_filename).st_size,
+                                         'sha1': integrity.file_digest(level_filename)}}}
 
-def map2pickles(map_filename: str, fw_filename: str, c_filename: str, a_filename: str) -> None:
+
+def __load_manifest() -> dict:
+    try:
+        with open(BUILD_MANIFEST_FILENAME, "r") as manifest_file:
+            return json.load(manifest_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def __save_manifest(manifest: dict) -> None:
+    try:
+        with open(BUILD_MANIFEST_FILENAME, "w") as manifest_file:
+            json.dump(manifest, manifest_file, indent=4, sort_keys=True)
+    except OSError:
+        print(f"Erreur lors de l'écriture du manifeste : {BUILD_MANIFEST_FILENAME}")
+
+
+def map2level(map_filename: str, level_filename: str) -> bool:
+    """
+    Convertit une carte texte en fichier binaire de niveau (voir level_file).
+    :param map_filename: nom de la carte source
+    :param level_filename: nom du fichier binaire à créer
+    :return: True si la conversion a réussi, False sinon
+    """
 
     try:
         with open(map_filename, "r") as map_file:
             contents = map_file.read()
     except FileNotFoundError:
         print(f"Fichier introuvable : {map_filename}")
-        return
+        return False
 
     lines = contents.split('\n')
 
@@ -96,58 +206,69 @@ def map2pickles(map_filename: str, fw_filename: str, c_filename: str, a_filename
 
                 # ACTIFS
                 elif symbol in assets_symbols:
+                    asset_id = assets_symbols[symbol]
                     if symbol == 'z':  # c'est le helpdesk
-                        assets.insert(0, [x, y])
+                        assets.insert(0, [asset_id, x, y])
                     else:
-                        asset_id = assets_symbols[symbol]
                         assets.append([asset_id, x, y])
 
     __flood_fill(flood_origin, 0, floor_and_walls)
 
-    try:
+    grid = array('b')
+    for column in floor_and_walls:
+        grid.extend(column)
 
-        pickle.dump(floor_and_walls, open(fw_filename, "wb"))
-        __create_checksum(fw_filename)
-    except OSError:
-        print(f"Erreur lors de la création du cornichon : {fw_filename}")
+    level_file = LevelFile(longest_line_length, len(lines), grid, assets, characters)
+    return level_file.save(level_filename)
 
-    try:
-        pickle.dump(characters, open(c_filename, "wb"))
-        __create_checksum(c_filename)
-    except OSError:
-        print(f"Erreur lors de la création du cornichon : {c_filename}")
-
-    try:
-        pickle.dump(assets, open(a_filename, "wb"))
-        __create_checksum(a_filename)
-    except OSError:
-        print(f"Erreur lors de la création du cornichon : {a_filename}")
 
+def __flood_fill(starting_point: tuple, symbol: int, office: list) -> None:
+    """
+    Remplit (8-connexité) les cases vides (-1) accessibles à partir du point de départ avec le symbole spécifié.
+    Remplissage itératif par segments : chaque segment vertical de cases vides d'une colonne est rempli d'un coup,
+    puis un seul point de départ est empilé par segment vide des colonnes voisines.
+    :param starting_point: coordonnée (x, y) du point de départ
+    :param symbol: symbole à placer dans les cases remplies
+    :param office: grille (colonne par colonne) à remplir
+    :return: aucun
+    """
+    width = len(office)
+    height = len(office[0]) if width else 0
 
-__DELTAS = [(1, 0), (1, 1), (0, 1), (-1, 1),
-            (-1, 0), (-1, -1), (0, -1), (1, -1)]
+    x, y = starting_point
+    if not (0 <= x < width and 0 <= y < height) or office[x][y] != -1:
+        return
 
+    stack = [(x, y)]
+    while stack:
+        x, y = stack.pop()
+        column = office[x]
+        if column[y] != -1:
+            continue
 
-def __flood_fill(starting_point: tuple, symbol: int, office: list) -> None:
-    x, y = starting_point
-    if office[x][y] == -1:
-        office[x][y] = symbol
-        for delta in __DELTAS:
-            __flood_fill((x + delta[0], y + delta[1]), symbol, office)
+        # étendre le segment vers le haut et vers le bas, puis le remplir
+        top = y
+        while top > 0 and column[top - 1] == -1:
+            top -= 1
+        bottom = y
+        while bottom < height - 1 and column[bottom + 1] == -1:
+            bottom += 1
+        column[top:bottom + 1] = [symbol] * (bottom - top + 1)
 
+        # les diagonales sont incluses : les colonnes voisines sont examinées une case plus loin de chaque côté
+        first = max(top - 1, 0)
+        last = min(bottom + 1, height - 1)
+        for neighbour_x in (x - 1, x + 1):
+            if not 0 <= neighbour_x < width:
+                continue
 
-def __create_checksum(filename: str) -> None:
-    """
-    Permet de créer un checksum pour le fichier cornichon utilisé pour les niveaux
+            neighbour = office[neighbour_x]
+            in_segment = False
+            for neighbour_y in range(first, last + 1):
+                if neighbour[neighbour_y] == -1:
+                    if not in_segment:
+                        stack.append((neighbour_x, neighbour_y))
+                        in_segment = True
+                else:
+                    in_segment = False
 
-    Parameters:
-    arg1 (str): le nom du fichier
-    """
-    # Permet de retourner un Sha unique pour le fichier
-    with open(filename, "rb") as file_to_check:
-        data = file_to_check.read()
-        md5_returned = hashlib.md5(data).hexdigest()
-    # Écrit le Sha dans le fichier config.ini
-    config['Checksum'][filename] = md5_returned
-    with open('config/config.ini', 'w') as configfile:    # save
-        config.write(configfile)
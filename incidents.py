@@ -1,82 +1,110 @@
 import random
-import time
 import settings
 import resources
-from queue import Queue
-from threading import Thread, Event
+import timers
+from collections import deque
 
 from expertise import Expertise
 
 
-INCIDENT_TICK = 0.25  # en secondes
+# nombre d'incidents préalloués par la réserve d'incidents (la réserve grandit au besoin)
+INCIDENT_POOL_SIZE = 32
 
 
-class Incident(Thread):
-    """ Un incident. """
+class Incident:
+    """
+    Un incident.
+    Les incidents sont recyclés par la réserve d'incidents (voir pool plus bas) : le numéro de génération change
+    chaque fois que l'incident est libéré, ce qui permet de reconnaître une référence périmée à un incident recyclé.
+    """
 
-    def __init__(self, expertise: Expertise, time_to_solve: float) -> None:
+    __slots__ = ('__expertise', '__time_to_solve', '__timer', '__is_paused', '__is_being_resolved', '__generation',
+                 '__is_free')
+
+    def __init__(self, expertise: Expertise, time_to_solve: float, alerts: tuple = None) -> None:
         """
         Initialise l'incident.
         :param expertise: type de l'incident (expertise sollicitée)
         :param time_to_solve: temps de résolution permis (en secondes)
+        :param alerts: actions des alertes à 25 % et à 10 % du temps restant (les sons d'alerte par défaut si absent)
+        """
+        # minuterie de l'incident : le temps restant est calculé à la demande (voir timers.Timer)
+        self.__timer = timers.Timer(time_to_solve)
+        self.__generation = 0
+
+        if alerts is None:
+            alerts = (resources.sounds_collection.get('PERCENT_25_ALERT').play,
+                      resources.sounds_collection.get('PERCENT_10_ALERT').play)
+        self.renew(expertise, time_to_solve, alerts)
+
+    def renew(self, expertise: Expertise, time_to_solve: float, alerts: tuple) -> None:
+        """
+        (Ré)initialise l'incident pour un nouvel usage, sans allouer de nouvelle minuterie.
+        :param expertise: type de l'incident (expertise sollicitée)
+        :param time_to_solve: temps de résolution permis (en secondes)
+        :param alerts: actions des alertes à 25 % et à 10 % du temps restant
+        :return: aucun
         """
-        super().__init__()
-        self.__percent_25_notif = False
-        self.__percent_10_notif = False
         self.__expertise = expertise
         self.__time_to_solve = time_to_solve
-        self.__remaining_time = time_to_solve
-        self.__25_percent_sound = resources.sounds_collection.get(
-            'PERCENT_25_ALERT')
-        self.__10_percent_sound = resources.sounds_collection.get(
-            'PERCENT_10_ALERT')
 
-        # événement servant à arrêter la tâche (va aussi la réveiller si nécessaire)
-        self.__event = Event()
+        self.__timer.reset(time_to_solve)
+        self.__timer.clear_alarms()
+        if expertise != Expertise.HELPDESK:
+            self.__timer.add_alarm(time_to_solve / 4, alerts[0])
+            self.__timer.add_alarm(time_to_solve / 10, alerts[1])
 
         self.__is_paused = False
         self.__is_being_resolved = False
+        self.__is_free = False
 
-    def run(self) -> None:
-        """ Méthode principale exécutée par la tâche d'incident. """
-
-        previous_time = time.time()
+    def retire(self) -> bool:
+        """
+        Arrête l'incident et le marque comme libre (nouvelle génération). Méthode appelée par la réserve d'incidents.
+        :return: True si l'incident vient d'être libéré, False s'il l'était déjà
+        """
+        if self.__is_free:
+            return False
 
-        while not self.__event.is_set():
-            now = time.time()
-            if self.__remaining_time > 0 and not self.__is_paused and not self.__is_being_resolved:
-                self.__remaining_time -= now - previous_time
-                if self.__remaining_time < 0:
-                    self.__remaining_time = 0
-                elif self.__remaining_time <= (self.__time_to_solve/4) and self.expertise != Expertise.HELPDESK and self.__percent_25_notif is False:
-                    self.__25_percent_sound.play()
-                    self.__percent_25_notif = True
-                elif self.__remaining_time <= (self.__time_to_solve/10) and self.expertise != Expertise.HELPDESK and self.__percent_10_notif is False:
-                    self.__10_percent_sound.play()
-                    self.__percent_10_notif = True
-            previous_time = now
+        self.__timer.stop()
+        self.__generation += 1
+        self.__is_free = True
+        return True
 
-            self.__event.wait(INCIDENT_TICK)
+    def start(self) -> None:
+        """ Démarre le décompte de l'incident. """
+        self.__timer.start()
 
     def stop(self) -> None:
-        """ Arrête la tâche d'incident. """
-        self.__event.set()
+        """ Arrête le décompte de l'incident. """
+        self.__timer.stop()
 
     def pause(self) -> None:
         """ Pause la tâche. """
         self.__is_paused = True
+        self.__update_timer()
 
     def unpause(self) -> None:
         """ Relance la tâche. """
         self.__is_paused = False
+        self.__update_timer()
 
     def resolve(self) -> None:
         """ Pause la tâche. """
         self.__is_being_resolved = True
+        self.__update_timer()
 
     def unresolve(self) -> None:
         """ Relance la tâche. """
         self.__is_being_resolved = False
+        self.__update_timer()
+
+    def __update_timer(self) -> None:
+        """ Le temps ne s'écoule pas lorsque l'incident est en pause ou en cours de résolution. """
+        if self.__is_paused or self.__is_being_resolved:
+            self.__timer.pause()
+        else:
+            self.__timer.unpause()
 
     def get_remaining_time_percentage(self) -> float:
         """
@@ -84,14 +112,18 @@ class Incident(Thread):
         :return: pourcentage du temps restant (de 0.0 à 100.0)
         """
         # le pourcentage de résolution est le temps restant sur le temps alloué (x 100 pour une valeur ##.##)
-        return self.__remaining_time / self.__time_to_solve * 100
+        return self.__timer.get_remaining_time_percentage()
 
     def has_expired(self) -> bool:
         """
         Vérifie si l'incident est expiré.
         :return: True si l'incident est expiré, False sinon
         """
-        return self.__remaining_time == 0
+        return self.__timer.has_expired()
+
+    @property
+    def remaining_time(self) -> float:
+        return self.__timer.remaining_time
 
     @property
     def expertise(self) -> Expertise:
@@ -109,16 +141,73 @@ class Incident(Thread):
     def is_being_resolved(self) -> bool:
         return self.__is_being_resolved
 
+    @property
+    def generation(self) -> int:
+        return self.__generation
+
+
+class __IncidentPool:
+    """
+    Réserve d'incidents utilisée par l'objet global pool (voir plus bas).
+    Les incidents libérés (résolus, expirés ou retirés) sont recyclés plutôt que réalloués : en régime permanent, la
+    création d'un incident n'alloue ni incident ni minuterie. Les sons d'alerte sont résolus une seule fois.
+    """
+
+    def __init__(self, size: int = INCIDENT_POOL_SIZE) -> None:
+        """
+        Initialise la réserve d'incidents.
+        :param size: nombre d'incidents préalloués
+        """
+        self.__alerts = (resources.sounds_collection.get('PERCENT_25_ALERT').play,
+                         resources.sounds_collection.get('PERCENT_10_ALERT').play)
+
+        # incidents libres (pile : le dernier incident libéré est le premier réutilisé)
+        self.__free = []
+        for _ in range(size):
+            incident = Incident(Expertise.HELPDESK, 0, self.__alerts)
+            incident.retire()
+            self.__free.append(incident)
+        self.__size = size
+
+    def acquire(self, expertise: Expertise, time_to_solve: float) -> Incident:
+        """
+        Fournit un incident (recyclé si possible, nouveau si la réserve est vide).
+        :param expertise: type de l'incident (expertise sollicitée)
+        :param time_to_solve: temps de résolution permis (en secondes)
+        :return: l'incident
+        """
+        if self.__free:
+            incident = self.__free.pop()
+            incident.renew(expertise, time_to_solve, self.__alerts)
+            return incident
+
+        self.__size += 1
+        return Incident(expertise, time_to_solve, self.__alerts)
+
+    def release(self, incident: Incident) -> None:
+        """
+        Libère un incident : il est arrêté et sera recyclé. Les références qui restent vers l'incident sont périmées
+        (voir Incident.generation).
+        :param incident: l'incident à libérer
+        :return: aucun
+        """
+        if incident.retire():
+            self.__free.append(incident)
+
+    @property
+    def size(self) -> int:
+        return self.__size
+
+    @property
+    def free_count(self) -> int:
+        return len(self.__free)
 
-class __IncidentSpawner(Thread):
+
+class __IncidentSpawner:
     """ Générateur d'incidents. """
 
     def __init__(self) -> None:
         """ Initialise le générateur d'incidents. """
-        super().__init__()
-
-        self.__remaining_time = settings.TIME_PER_LEVEL
-        self.__ticks = 0
         __max_time_between_indicents = 30
         __min_time_between_incidents = 1
         """Si le temps max par défaut est plus grand que 0 dans les settings et que le temps min par 
@@ -128,14 +217,23 @@ class __IncidentSpawner(Thread):
             __max_time_between_indicents = settings.DEFAULT_MAX_TIME_BETWEEN_INDICENTS
             __min_time_between_incidents = settings.DEFAULT_MIN_TIME_BETWEEN_INDICENTS
 
-        self.__queue = Queue()  # queue dans laquelle on place les incidents générés
-        # événement servant à arrêter la tâche (va aussi la réveiller si nécessaire)
-        self.__event = Event()
-        self.__multiplier = 1
-        self.__next_event_time = 2
+        # queue dans laquelle on place les incidents générés (boucle de jeu seulement, aucun verrou nécessaire)
+        self.__queue = deque()
+        # générateur pseudo-aléatoire de la partie (voir seed()) : tous les tirages liés aux incidents passent par lui
+        self.__random = random.Random()
+        # générateur du routage des incidents (voir routing.Router), dérivé de la même graine : les tirages du routage
+        # ne décalent pas la suite des incidents
+        self.__routing_random = random.Random()
+        self.__is_stopped = False
         self.__min_time_between = __min_time_between_incidents
         self.__max_time_between = __max_time_between_indicents
 
+        # minuterie du niveau (les incidents arrivent plus souvent à mesure que le niveau avance)
+        self.__level_timer = timers.Timer(settings.TIME_PER_LEVEL)
+        # minuterie avant le prochain incident
+        self.__next_incident_timer = timers.Timer(
+            self.get_first_event_time(), self.__create_and_send_next_incident)
+
         # va créer des incidents seulement si __creating_incidents est True
         self.__creating_incidents = True
 
@@ -147,52 +245,58 @@ class __IncidentSpawner(Thread):
             __time_before_first_incident = settings.TIME_BEFORE_FIRST_INCIDENT
         return __time_before_first_incident
 
-    def run(self) -> None:
-        """ Méthode principale exécutée par la tâche du générateur d'incidents. """
-        self.__next_event_time = self.get_first_event_time()
-
-        # tant que la tâche exécute, on génère des événements
-        while not self.__event.is_set():
-            if self.__ticks >= self.__next_event_time:
-                self.__create_and_send_next_incident()
-                self.__next_event_time = self.__ticks + \
-                    (self.__multiplier*random.randint(self.__min_time_between,
-                     self.__max_time_between))
-            self.__event.wait(1)
-            self.__ticks += 1
-            self.__remaining_time -= 1
-            self.__multiplier = 0.5 + \
-                ((self.__remaining_time/settings.TIME_PER_LEVEL)/2)
+    def seed(self, seed: int = None) -> None:
+        """
+        Réinitialise le générateur pseudo-aléatoire des incidents et celui du routage. Une même graine produit la même
+        suite d'incidents, quels que soient les tirages du routage.
+        :param seed: graine (None pour une graine imprévisible)
+        :return: aucun
+        """
+        self.__random.seed(seed)
+        self.__routing_random.seed(None if seed is None else f'routing-{seed}')
+
+    def start(self) -> None:
+        """ Démarre la génération d'incidents. """
+        self.__level_timer.start()
+        self.__next_incident_timer.start()
 
     def pause(self) -> None:
         """ Pause la génération d'incidents. """
         self.__creating_incidents = False
+        self.__level_timer.pause()
+        self.__next_incident_timer.pause()
 
     def reset(self) -> None:
-        self.__remaining_time = settings.TIME_PER_LEVEL
-        self.__multiplier = 1
-        self.__ticks = 0
-        self.__next_event_time = self.get_first_event_time()
+        """ Recommence la génération d'incidents au début d'un niveau. """
+        self.__level_timer.reset(settings.TIME_PER_LEVEL)
+        self.__next_incident_timer.reset(self.get_first_event_time())
+        if not self.__creating_incidents:
+            self.__level_timer.pause()
+            self.__next_incident_timer.pause()
+        self.start()
 
     def unpause(self) -> None:
         """ Relance la génération d'incidents. """
         self.__creating_incidents = True
+        self.__level_timer.unpause()
+        self.__next_incident_timer.unpause()
 
     def stop(self) -> None:
         """ Arrête le générateur d'incidents. """
-        self.__event.set()
+        self.__is_stopped = True
+        self.__level_timer.stop()
+        self.__next_incident_timer.stop()
 
     def get(self) -> list:
         """
         Récupère tous les incidents se trouvant dans la queue d'incidents.
         :return: liste contenant les incidents récupérés
         """
-        incidents = []
-
-        if not self.__event.is_set():
-            while not self.__queue.empty():
-                incidents.append(self.__queue.get())
+        if self.__is_stopped or not self.__queue:
+            return []
 
+        incidents = list(self.__queue)
+        self.__queue.clear()
         return incidents
 
     def put(self, incident: Incident) -> None:
@@ -201,31 +305,56 @@ class __IncidentSpawner(Thread):
         :param incident: incident à placer dans la queue
         :return: aucun
         """
-        if not self.__event.is_set():
-            self.__queue.put(incident)
+        if not self.__is_stopped:
+            self.__queue.append(incident)
+        else:
+            pool.release(incident)
 
     def __create_and_send_next_incident(self) -> None:
         """
-        Crée et envoie le prochain incident.
+        Crée et envoie le prochain incident, puis planifie le suivant.
+        Action appelée par l'ordonnanceur lorsque la minuterie du prochain incident expire.
         """
 
         if self.__creating_incidents:
             # Création d'un incident pour le centre d'appels (tous les incidents entrent par le centre d'appels)
-            time_to_solve = random.randint(
+            time_to_solve = self.__random.randint(
                 settings.HELPDESK_MIN_SOLVING_TIME, settings.HELPDESK_MAX_SOLVING_TIME)
 
-            incident = Incident(Expertise.HELPDESK, time_to_solve)
+            incident = pool.acquire(Expertise.HELPDESK, time_to_solve)
 
             # Envoi de l'incident sur la queue d'incidents
-            self.__queue.put(incident)
+            self.__queue.append(incident)
+
+        # Planification du prochain incident (plus le niveau avance, plus les incidents sont rapprochés)
+        multiplier = 0.5 + \
+            ((self.__level_timer.remaining_time / settings.TIME_PER_LEVEL) / 2)
+        self.__next_incident_timer.reset(
+            multiplier * self.__random.randint(self.__min_time_between, self.__max_time_between))
+        self.__next_incident_timer.start()
+
+    @property
+    def routing_random(self) -> random.Random:
+        return self.__routing_random
+
+    @property
+    def random(self) -> random.Random:
+        return self.__random
 
 
 # générateur d'incidents (singleton du GoF implémenté avec un Global Object Pattern de python)
 spawner = None
 
+# réserve d'incidents (singleton du GoF implémenté avec un Global Object Pattern de python)
+pool = None
+
 
 def init() -> None:
-    """ Initialise le spawner, mais ne le démarre pas. """
+    """ Initialise la réserve d'incidents et le spawner, mais ne le démarre pas. Les sons doivent être chargés. """
+
+    global pool
+    if not pool:
+        pool = __IncidentPool()
 
     global spawner
     if not spawner:
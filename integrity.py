@@ -0,0 +1,122 @@
+# Vérification de l'intégrité des fichiers de niveau à partir du manifeste de construction (voir
+# helper_tools.build_levels). Le manifeste est lu une seule fois au démarrage et rien n'est jamais écrit sur le disque :
+# un fichier déjà vérifié n'est haché à nouveau que si sa taille ou sa date de modification a changé. La vérification
+# échoue si le manifeste est absent ou illisible, ou si un fichier de niveau n'y figure pas.
+import glob
+import hashlib
+import json
+import os
+
+import settings
+
+from error_codes import Error_codes
+
+# taille des blocs lus pour calculer l'empreinte d'un fichier
+HASH_CHUNK_SIZE = 1 << 16
+
+# fichiers de niveau qui doivent tous figurer dans le manifeste (voir helper_tools.level_filenames())
+LEVEL_FILES_PATTERN = os.path.join('bin', 'level*.bin')
+
+
+class IntegrityError(Exception):
+    """ Un fichier ne correspond pas à l'empreinte du manifeste (ou n'y figure pas). """
+
+
+# empreintes déjà calculées : fichier -> (taille, date de modification, empreinte)
+__digests = {}
+
+
+def file_digest(filename: str) -> str or None:
+    """
+    Calcule l'empreinte SHA-1 d'un fichier, par blocs. L'empreinte est conservée : elle n'est calculée à nouveau que
+    si la taille ou la date de modification du fichier change.
+    :param filename: nom du fichier
+    :return: l'empreinte (en hexadécimal), None si le fichier est illisible
+    """
+    try:
+        stat = os.stat(filename)
+        known = __digests.get(filename)
+        if known and known[0] == stat.st_size and known[1] == stat.st_mtime_ns:
+            return known[2]
+
+        digest = hashlib.sha1()
+        with open(filename, "rb") as file_to_hash:
+            while chunk := file_to_hash.read(HASH_CHUNK_SIZE):
+                digest.update(chunk)
+    except OSError:
+        return None
+
+    __digests[filename] = (stat.st_size, stat.st_mtime_ns, digest.hexdigest())
+    return digest.hexdigest()
+
+
+class __IntegrityChecker:
+    """ Vérificateur d'intégrité : empreintes attendues des fichiers de niveau, selon le manifeste. """
+
+    def __init__(self, manifest_filename: str) -> None:
+        """
+        Initialise le vérificateur (lecture du manifeste).
+        :param manifest_filename: nom du manifeste de construction
+        """
+        # fichier (chemin normalisé) -> empreinte attendue (les fichiers absents du manifeste sont refusés)
+        self.__expected = {}
+        self.__is_manifest_valid = False
+
+        try:
+            with open(manifest_filename, "r") as manifest_file:
+                manifest = json.load(manifest_file)
+            levels = manifest['levels']
+            for level in levels.values():
+                for filename, output in level.get('outputs', {}).items():
+                    if isinstance(output, dict) and 'sha1' in output:
+                        self.__expected[os.path.normpath(filename)] = output['sha1']
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            print(f"Manifeste introuvable ou illisible : {manifest_filename}")
+            return
+
+        self.__is_manifest_valid = True
+
+    def verify(self, filename: str) -> bool:
+        """
+        Vérifie qu'un fichier correspond à l'empreinte du manifeste.
+        :param filename: nom du fichier
+        :return: True si le fichier est intact, False s'il est modifié, illisible ou absent du manifeste
+        """
+        expected = self.__expected.get(os.path.normpath(filename))
+        return expected is not None and file_digest(filename) == expected
+
+    def verify_all(self) -> list:
+        """
+        Vérifie tous les fichiers du manifeste ainsi que tous les fichiers de niveau présents (voir
+        LEVEL_FILES_PATTERN), qui doivent figurer dans le manifeste.
+        :return: liste des fichiers modifiés, illisibles ou absents du manifeste
+        """
+        filenames = set(self.__expected)
+        filenames.update(os.path.normpath(filename) for filename in glob.glob(LEVEL_FILES_PATTERN))
+        return sorted(filename for filename in filenames if not self.verify(filename))
+
+    @property
+    def is_manifest_valid(self) -> bool:
+        return self.__is_manifest_valid
+
+
+checker = None
+
+
+def init() -> Error_codes:
+    """
+    Lit le manifeste de construction et vérifie tous les fichiers de niveau qu'il décrit ainsi que ceux présents sur
+    le disque. À appeler au démarrage (ou après une construction de niveaux, pour relire le manifeste).
+    :return: le code de succes si le manifeste est lisible et tous les fichiers de niveau y figurent et sont intacts,
+             le code d'erreur sinon
+    """
+    global checker
+    checker = __IntegrityChecker(settings.BUILD_MANIFEST_FILENAME)
+    if not checker.is_manifest_valid:
+        return Error_codes.INTEGRITY
+
+    failed = checker.verify_all()
+    for filename in failed:
+        print(f"Fichier modifié, illisible ou absent du manifeste : {filename}")
+
+    return Error_codes.INTEGRITY if failed else Error_codes.SUCCES
@@ -1,34 +1,16 @@
+import integrity
+import level_cache
+import office
+import settings
+from level_file import LevelFile
 from office import Office
 from helpdesk import Helpdesk
 from character import Character
 from asset import Asset
+from expertise import Expertise
+from incidents import Incident
+from routing import Router, RoutingPolicy
 import incidents
-import pickle
-import hashlib
-import configparser
-
-
-def check_checksum(filename: str) -> None:
-    """
-    Permet de valider le checksum du fichier config.ini pour savoir si c'est le même
-    :param str: le nom du fichier
-    """
-    config = configparser.ConfigParser(inline_comment_prefixes="#")
-    config.read("config/config.ini")
-    try:
-        with open(filename, "rb") as file_to_check:
-            data = file_to_check.read()
-            md5_returned = hashlib.md5(data).hexdigest()
-            try:
-                if md5_returned != config.get("Checksum", filename):
-                    raise Exception("Fichier modifié")
-            except configparser.NoOptionError:
-                config['Checksum'][filename] = md5_returned
-                with open('config/config.ini', 'w') as configfile:    # save
-                    config.write(configfile)
-    except OSError:
-        print(f"Erreur de lecture : {filename}")
-        return None
 
 
 class Level:
@@ -41,22 +23,43 @@ class Level:
         """
         self.__number = number
 
+        # Lecture du fichier du niveau (grille de tuiles, actifs et personnages), après vérification de son empreinte
+        # (seulement s'il a changé depuis la vérification au démarrage, voir integrity)
+        level_filename = f'bin/level{number}.bin'
+        if not integrity.checker.verify(level_filename):
+            raise integrity.IntegrityError(f"Fichier modifié ou absent du manifeste : {level_filename}")
+        level_file = LevelFile.load(level_filename)
+        if not level_file:
+            raise integrity.IntegrityError(f"Fichier de niveau introuvable, illisible ou altéré : {level_filename}")
+
         # Construction du bureau
         self.__office = Office()
-        floor_and_walls = self.__load_floor_and_walls(number)
-        self.__office.build(floor_and_walls)
+
+        # L'image statique du bureau est reprise du cache si le niveau, les tuiles et la découpe n'ont pas changé
+        cache_key = level_cache.compute_key([level_filename, settings.TILES_FILENAME], (office.BORDER_WIDTH,))
+        prebaked = level_cache.load(cache_key)
+        self.__office.build(level_file.floor_and_walls(), prebaked)
+        if not prebaked:
+            level_cache.store(cache_key, self.__office.static_image, self.__office.walkable_grid,
+                              *self.__office.grid_size)
 
         # Ajout des actifs informationnels
-        self.__assets = self.__load_assets(number)
+        self.__assets = self.__create_assets(level_file.assets)
         self.__helpdesk = self.__assets[0]
+        self.__assets_by_tile = {}
         for asset in self.__assets:
             self.__office.add_asset(asset)
+            self.__assets_by_tile[tuple(asset.tile_position)] = asset
 
         # Ajout des personnages
-        self.__characters = self.__load_characters(number)
+        self.__characters = self.__create_characters(level_file.characters)
         for character in self.__characters:
             self.__office.add_character(character)
 
+        # Routage des incidents vers les actifs autres que le centre d'appels
+        self.__router = Router(self.__assets[1:], RoutingPolicy[settings.ROUTING_POLICY.upper()],
+                               incidents.spawner.routing_random, self.__office, self.__characters)
+
     def stop(self) -> None:
         """ Arrête l'exploitation de ce niveau et effectue les opérations de nettoyage nécessaire. """
         # Arrêt des éléments d'ambience dans le bureau
@@ -70,30 +73,42 @@ class Level:
             asset.stop_and_remove_all_incidents()
 
         # Récupération des incidents en attente dans la queue du générateur d'incidents (donc nettoyage de la queue)
-        incidents.spawner.get()
+        for incident in incidents.spawner.get():
+            incidents.pool.release(incident)
 
-    @staticmethod
-    def __load_assets(number: int) -> list or None:
+    def dispatch_incident(self, incident: Incident) -> Asset:
+        """
+        Confie un incident à un actif du niveau : au centre d'appels pour les incidents du centre d'appels, à l'actif
+        choisi par le routeur parmi les autres actifs sinon (voir routing.Router).
+        :param incident: l'incident à confier
+        :return: l'actif qui a reçu l'incident
         """
-        Charge les actifs pour le niveau spécifié (number).
-        :param number: numéro de niveau
-        :return: liste d'actifs si l'opération est réussie, None sinon
+        if incident.expertise == Expertise.HELPDESK:
+            asset = self.__helpdesk
+        else:
+            # Sélection d'un actif selon la politique de routage (charge des actifs, experts, hasard)
+            asset = self.__router.route(incident)
+
+        asset.add_incident(incident)
+        return asset
+
+    def asset_at(self, tile_position: tuple) -> Asset or None:
+        """
+        Retourne l'actif situé à une position de tuile donnée.
+        :param tile_position: position (x, y) de la tuile
+        :return: l'actif, None s'il n'y a pas d'actif à cette position
         """
-        assets_filename = f'bin/assets{number}.pickle'
-        check_checksum(assets_filename)
-        try:
-            with open(assets_filename, "rb") as assets_file:
-                assets_data = pickle.load(assets_file)
-        except FileNotFoundError:
-            print(f"Fichier introuvable : {assets_filename}")
-            return None
-        except OSError:
-            print(f"Erreur de lecture : {assets_filename}")
-            return None
+        return self.__assets_by_tile.get(tuple(tile_position))
 
+    @staticmethod
+    def __create_assets(assets_data: list) -> list:
+        """
+        Crée les actifs du niveau.
+        :param assets_data: actifs du fichier de niveau [(identifiant, x, y)], le centre d'appels en premier
+        :return: liste d'actifs
+        """
         assets = []
-        x = assets_data[0][0]
-        y = assets_data[0][1]
+        _, x, y = assets_data[0]
         # les premières données sont pour le centre d'appels
         helpdesk = Helpdesk((x, y))
         assets.append(helpdesk)
@@ -110,24 +125,12 @@ class Level:
         return assets
 
     @staticmethod
-    def __load_characters(number: int) -> list or None:
+    def __create_characters(characters_data: list) -> list:
         """
-        Charge les personnages pour le niveau spécifié (number).
-        :param number: numéro de niveau
-        :return: liste de personnages si l'opération est réussie, None sinon
+        Crée les personnages du niveau.
+        :param characters_data: personnages du fichier de niveau [(nom, identifiant, expertise, vitesse, x, y)]
+        :return: liste de personnages
         """
-        characters_filename = f'bin/characters{number}.pickle'
-        check_checksum(characters_filename)
-        try:
-            with open(characters_filename, "rb") as characters_file:
-                characters_data = pickle.load(characters_file)
-        except FileNotFoundError:
-            print(f"Fichier introuvable : {characters_filename}")
-            return None
-        except OSError:
-            print(f"Erreur de lecture : {characters_filename}")
-            return None
-
         characters = []
         characters_names = []
 
@@ -144,7 +147,7 @@ class Level:
                 characters_names.append(character_data[0])
 
             character_id = character_data[1]
-            expertise = character_data[2]
+            expertise = Expertise(character_data[2])
             speed = character_data[3]
             x = character_data[4]
             y = character_data[5]
@@ -155,30 +158,6 @@ class Level:
 
         return characters
 
-    @staticmethod
-    def __load_floor_and_walls(number: int) -> list or None:
-        """
-        Charge le plancher et les murs du bureau pour le niveau spécifié (number).
-        :param number: numéro de niveau
-        :return: grille représentant le plancher et les murs (liste de listes) si l'opération est réussie, None sinon
-        """
-        floor_and_walls_filename = f'bin/floor_and_walls{number}.pickle'
-        check_checksum(floor_and_walls_filename)
-
-        try:
-
-            with open(floor_and_walls_filename, "rb") as floor_and_walls_file:
-                floor_and_walls = pickle.load(floor_and_walls_file)
-
-        except FileNotFoundError:
-            print(f"Fichier introuvable : {floor_and_walls_filename}")
-            return None
-        except OSError:
-            print(f"Erreur de lecture : {floor_and_walls_filename}")
-            return None
-
-        return floor_and_walls
-
     @property
     def number(self) -> int:
         return self.__number
@@ -0,0 +1,97 @@
+# Cache des images statiques de bureau (plancher et murs) déjà composées, pour éviter de reconstruire le bureau à
+# chaque chargement de niveau
+import file_cache
+import mmap
+import os
+import struct
+
+import pygame
+
+# à incrémenter lorsque le format du fichier ou la façon de composer le bureau change
+CACHE_VERSION = 1
+
+__MAGIC = b'C93O'
+
+# en-tête : signature, version, largeur et hauteur de l'image (en pixels), largeur et hauteur du bureau (en tuiles)
+__HEADER = struct.Struct('<4sHIIII')
+
+
+def compute_key(filenames: list, parameters: tuple = ()) -> str or None:
+    """
+    Calcule la clé de cache d'un bureau à partir du contenu des fichiers sources et des paramètres de composition
+    (voir file_cache.compute_key()).
+    :param filenames: fichiers dont dépend l'image (niveau, feuille de tuiles, etc.)
+    :param parameters: paramètres de composition (valeurs de configuration, constantes, etc.)
+    :return: la clé de cache, None si un des fichiers est illisible
+    """
+    return file_cache.compute_key(filenames, (CACHE_VERSION, parameters))
+
+
+def __cache_filename(key: str) -> str:
+    return file_cache.cache_filename('office', key, '.bin')
+
+
+def load(key: str) -> tuple or None:
+    """
+    Charge l'image statique d'un bureau et sa grille de tuiles praticables à partir du cache.
+    Les pixels sont lus directement du fichier projeté en mémoire.
+    :param key: clé de cache (voir compute_key())
+    :return: (surface, grille praticable) si le bureau est dans le cache, None sinon - la grille praticable contient
+             un octet par tuile, colonne par colonne
+    """
+    if not key:
+        return None
+
+    try:
+        with open(__cache_filename(key), "rb") as cache_file, \
+                mmap.mmap(cache_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            magic, version, width, height, columns, rows = __HEADER.unpack_from(
+                data)
+            walkable_offset = __HEADER.size
+            pixels_offset = walkable_offset + columns * rows
+            if magic != __MAGIC or version != CACHE_VERSION or \
+                    len(data) != pixels_offset + width * height * 3:
+                return None
+
+            walkable = data[walkable_offset:pixels_offset]
+
+            # copie des pixels projetés vers une surface au format habituel (le fichier peut alors être fermé)
+            surface = pygame.Surface((width, height))
+            with memoryview(data) as view, view[pixels_offset:] as pixels:
+                image = pygame.image.frombuffer(pixels, (width, height), 'RGB')
+                surface.blit(image, (0, 0))
+                del image
+    except (OSError, ValueError, struct.error):
+        return None
+
+    return surface, walkable
+
+
+def store(key: str, surface: pygame.Surface, walkable: bytes, columns: int, rows: int) -> None:
+    """
+    Enregistre l'image statique d'un bureau et sa grille de tuiles praticables dans le cache.
+    :param key: clé de cache (voir compute_key())
+    :param surface: image statique du bureau
+    :param walkable: grille praticable (un octet par tuile, colonne par colonne)
+    :param columns: largeur du bureau (en tuiles)
+    :param rows: hauteur du bureau (en tuiles)
+    :return: aucun
+    """
+    if not key:
+        return
+
+    width, height = surface.get_size()
+    filename = __cache_filename(key)
+    temporary_filename = filename + '.tmp'
+
+    try:
+        os.makedirs(file_cache.CACHE_DIRECTORY, exist_ok=True)
+        with open(temporary_filename, "wb") as cache_file:
+            cache_file.write(__HEADER.pack(__MAGIC, CACHE_VERSION,
+                                           width, height, columns, rows))
+            cache_file.write(walkable)
+            cache_file.write(pygame.image.tobytes(surface, 'RGB'))
+        # remplacement atomique : un autre lancement ne lit jamais un fichier à moitié écrit
+        os.replace(temporary_filename, filename)
+    except OSError:
+        print(f"Erreur lors de l'écriture du cache : {filename}")
@@ -0,0 +1,152 @@
+# Fichier binaire d'un niveau : grille de tuiles, actifs et personnages dans un seul fichier versionné, avec une
+# empreinte du contenu pour détecter les fichiers altérés (voir helper_tools.map2level)
+import hashlib
+import struct
+
+from array import array
+
+# à incrémenter lorsque le format du fichier change
+LEVEL_FILE_VERSION = 1
+
+
+class LevelFile:
+    """
+    Contenu d'un fichier de niveau.
+    La grille contient un identifiant de tuile (un octet signé, -1 pour le vide) par tuile, colonne par colonne.
+    Les actifs sont des tuples (identifiant, x, y), le premier étant le centre d'appels; les personnages sont des
+    tuples (nom, identifiant, expertise, vitesse, x, y). Les positions sont en tuiles.
+    """
+
+    __MAGIC = b'C93L'
+
+    # en-tête : signature, version, largeur et hauteur (en tuiles), nombre d'actifs, nombre de personnages,
+    # empreinte SHA-1 de tout ce qui suit l'en-tête
+    __HEADER = struct.Struct('<4sHHHHH20s')
+
+    # actif : identifiant, position de tuile (x, y)
+    __ASSET = struct.Struct('<BHH')
+
+    # personnage : identifiant, expertise, vitesse, position de tuile (x, y), longueur du nom (suivi du nom en UTF-8)
+    __CHARACTER = struct.Struct('<BBHHHB')
+
+    def __init__(self, columns: int, rows: int, grid: array, assets: list, characters: list) -> None:
+        """
+        Initialise le contenu d'un fichier de niveau (objet LevelFile).
+        :param columns: largeur du bureau (en tuiles)
+        :param rows: hauteur du bureau (en tuiles)
+        :param grid: identifiants de tuiles (array('b'), colonne par colonne)
+        :param assets: actifs [(identifiant, x, y)], le centre d'appels en premier
+        :param characters: personnages [(nom, identifiant, expertise, vitesse, x, y)]
+        """
+        self.__columns = columns
+        self.__rows = rows
+        self.__grid = grid
+        self.__assets = assets
+        self.__characters = characters
+
+    def save(self, filename: str) -> bool:
+        """
+        Enregistre le niveau dans un fichier.
+        :param filename: nom du fichier
+        :return: True si l'enregistrement a réussi, False sinon
+        """
+        body = bytearray(self.__grid.tobytes())
+        for asset_id, x, y in self.__assets:
+            body += self.__ASSET.pack(asset_id, x, y)
+        for name, character_id, expertise, speed, x, y in self.__characters:
+            encoded_name = name.encode()
+            body += self.__CHARACTER.pack(character_id, expertise, speed, x, y, len(encoded_name))
+            body += encoded_name
+
+        header = self.__HEADER.pack(self.__MAGIC, LEVEL_FILE_VERSION, self.__columns, self.__rows,
+                                    len(self.__assets), len(self.__characters), hashlib.sha1(body).digest())
+        try:
+            with open(filename, "wb") as level_file:
+                level_file.write(header)
+                level_file.write(body)
+        except OSError:
+            print(f"Erreur lors de l'écriture du niveau : {filename}")
+            return False
+
+        return True
+
+    @staticmethod
+    def load(filename: str) -> 'LevelFile' or None:
+        """
+        Charge un niveau à partir d'un fichier (une seule lecture, aucune désérialisation de code).
+        :param filename: nom du fichier
+        :return: le contenu du niveau, None si le fichier est introuvable, illisible, invalide ou altéré
+        """
+        try:
+            with open(filename, "rb") as level_file:
+                data = level_file.read()
+            magic, version, columns, rows, asset_count, character_count, digest = \
+                LevelFile.__HEADER.unpack_from(data)
+        except FileNotFoundError:
+            print(f"Fichier introuvable : {filename}")
+            return None
+        except (OSError, struct.error):
+            print(f"Erreur de lecture : {filename}")
+            return None
+
+        with memoryview(data) as view, view[LevelFile.__HEADER.size:] as body:
+            if magic != LevelFile.__MAGIC or version != LEVEL_FILE_VERSION or \
+                    hashlib.sha1(body).digest() != digest:
+                print(f"Fichier de niveau invalide ou modifié : {filename}")
+                return None
+
+            try:
+                offset = columns * rows
+                grid = array('b')
+                grid.frombytes(body[:offset])
+
+                assets = []
+                for _ in range(asset_count):
+                    assets.append(LevelFile.__ASSET.unpack_from(body, offset))
+                    offset += LevelFile.__ASSET.size
+
+                characters = []
+                for _ in range(character_count):
+                    character_id, expertise, speed, x, y, name_length = \
+                        LevelFile.__CHARACTER.unpack_from(body, offset)
+                    offset += LevelFile.__CHARACTER.size
+                    name = bytes(body[offset:offset + name_length]).decode()
+                    offset += name_length
+                    characters.append((name, character_id, expertise, speed, x, y))
+            except (struct.error, UnicodeDecodeError):
+                print(f"Fichier de niveau invalide : {filename}")
+                return None
+
+        if len(grid) != columns * rows:
+            print(f"Fichier de niveau invalide : {filename}")
+            return None
+
+        return LevelFile(columns, rows, grid, assets, characters)
+
+    def floor_and_walls(self) -> list:
+        """
+        Retourne la grille sous la forme attendue par Office.build().
+        :return: liste de colonnes (listes d'identifiants de tuiles)
+        """
+        rows = self.__rows
+        return [self.__grid[x * rows:(x + 1) * rows].tolist() for x in range(self.__columns)]
+
+    @property
+    def columns(self) -> int:
+        return self.__columns
+
+    @property
+    def rows(self) -> int:
+        return self.__rows
+
+    @property
+    def grid(self) -> array:
+        return self.__grid
+
+    @property
+    def assets(self) -> list:
+        return self.__assets
+
+    @property
+    def characters(self) -> list:
+        return self.__characters
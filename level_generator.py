@@ -0,0 +1,174 @@
+# Génération procédurale de grands bureaux, au format des cartes de txt/ (voir helper_tools.map2level), pour
+# éprouver le chargement, l'affichage et la simulation sur des niveaux de milliers de tuiles
+# Ce code ne fait pas partie du produit final
+#
+# Utilisation : python level_generator.py COLONNES RANGÉES [--room-size LARGEUR HAUTEUR] [--density DENSITÉ]
+#               [--characters NOMBRE] [--seed GRAINE] [--level NUMÉRO | --output FICHIER]
+import argparse
+import random
+
+# symbole de mur selon les murs voisins (haut, bas, gauche, droite)
+WALL_SYMBOLS = {(False, False, False, False): '0',
+                (False, False, True, True): '1',
+                (True, True, False, False): '2',
+                (False, False, False, True): '3',
+                (False, False, True, False): '4',
+                (False, True, False, False): '5',
+                (True, False, False, False): '6',
+                (False, True, False, True): '7',
+                (True, False, False, True): '8',
+                (True, False, True, False): '9',
+                (False, True, True, False): 'A',
+                (True, True, False, True): 'B',
+                (True, False, True, True): 'C',
+                (True, True, True, False): 'D',
+                (False, True, True, True): 'E',
+                (True, True, True, True): 'F'}
+
+FLOOR = ' '
+FLOOD_ORIGIN = 'x'
+HELPDESK = 'z'
+ASSETS = 'abcdefghij'
+# chaque personnage ne peut être présent qu'une fois dans un niveau
+CHARACTERS = 'STUVWXYZ'
+
+# dimensions par défaut d'une pièce (en tuiles, cloison comprise)
+DEFAULT_ROOM_SIZE = (12, 10)
+
+# largeur des portes percées dans les cloisons entre deux pièces
+DOOR_WIDTH = 3
+
+# distance entre deux emplacements de poste de travail dans une pièce
+DESK_SPACING = 3
+
+
+def generate_office(columns: int, rows: int, room_size: tuple = DEFAULT_ROOM_SIZE, asset_density: float = 0.5,
+                    character_count: int = len(CHARACTERS), seed: int = None) -> str:
+    """
+    Génère un bureau : une grille de pièces entourée de murs, chaque cloison entre deux pièces voisines étant percée
+    d'une porte (toutes les pièces sont donc accessibles). Les postes de travail (actifs) occupent au hasard une
+    partie des emplacements d'une grille régulière dans chaque pièce; le centre d'appels et le point d'origine du
+    plancher sont dans la première pièce et les personnages sont répartis au hasard sur le plancher libre.
+    :param columns: largeur du bureau (en tuiles, au moins 8)
+    :param rows: hauteur du bureau (en tuiles, au moins 8)
+    :param room_size: dimensions (largeur, hauteur) d'une pièce en tuiles, cloison comprise (au moins 6 x 6)
+    :param asset_density: proportion des emplacements de postes de travail occupés (de 0 à 1)
+    :param character_count: nombre de personnages (de 0 à 8)
+    :param seed: graine du générateur pseudo-aléatoire (None pour une graine au hasard)
+    :return: le texte de la carte (une ligne par rangée de tuiles)
+    """
+    room_width, room_height = room_size
+    if columns < 8 or rows < 8 or room_width < 6 or room_height < 6:
+        raise ValueError("Bureau ou pièces trop petits")
+    if not 0 <= asset_density <= 1 or not 0 <= character_count <= len(CHARACTERS):
+        raise ValueError("Densité de postes de travail ou nombre de personnages invalide")
+
+    generator = random.Random(seed)
+
+    # cloisons intérieures (la dernière pièce de chaque rangée et colonne est agrandie plutôt que trop petite)
+    partition_columns = list(range(room_width, columns - room_width // 2, room_width))
+    partition_rows = list(range(room_height, rows - room_height // 2, room_height))
+    room_columns = [0] + partition_columns + [columns - 1]
+    room_rows = [0] + partition_rows + [rows - 1]
+
+    # grille des murs, rangée par rangée
+    walls = [[False] * columns for _ in range(rows)]
+    for x in range(columns):
+        walls[0][x] = walls[rows - 1][x] = True
+    for y in range(rows):
+        walls[y][0] = walls[y][columns - 1] = True
+
+    for x in partition_columns:
+        for top, bottom in zip(room_rows, room_rows[1:]):
+            door = __door(generator, top, bottom)
+            for y in range(top + 1, bottom):
+                walls[y][x] = y not in door
+    for y in partition_rows:
+        for left, right in zip(room_columns, room_columns[1:]):
+            door = __door(generator, left, right)
+            for x in range(left + 1, right):
+                walls[y][x] = x not in door
+    for x in partition_columns:
+        for y in partition_rows:
+            walls[y][x] = True
+
+    grid = [[__wall_symbol(walls, x, y) if walls[y][x] else FLOOR for x in range(columns)] for y in range(rows)]
+
+    # centre d'appels et point d'origine du plancher dans la première pièce
+    grid[1][1] = FLOOD_ORIGIN
+    grid[2][2] = HELPDESK
+
+    # postes de travail : emplacements à deux tuiles des cloisons (les portes et les passages restent dégagés)
+    for top, bottom in zip(room_rows, room_rows[1:]):
+        for left, right in zip(room_columns, room_columns[1:]):
+            for y in range(top + 2, bottom - 1, DESK_SPACING):
+                for x in range(left + 2, right - 1, DESK_SPACING):
+                    if grid[y][x] == FLOOR and generator.random() < asset_density:
+                        grid[y][x] = generator.choice(ASSETS)
+
+    # personnages sur des tuiles de plancher libres
+    free_tiles = [(x, y) for y in range(1, rows - 1) for x in range(1, columns - 1) if grid[y][x] == FLOOR]
+    for symbol, (x, y) in zip(CHARACTERS[:character_count], generator.sample(free_tiles, character_count)):
+        grid[y][x] = symbol
+
+    return '\n'.join(''.join(line) for line in grid)
+
+
+def __door(generator: random.Random, start: int, end: int) -> range:
+    """
+    Choisit l'emplacement d'une porte dans une cloison.
+    :param generator: générateur pseudo-aléatoire
+    :param start: position du mur à une extrémité de la cloison
+    :param end: position du mur à l'autre extrémité de la cloison
+    :return: positions des tuiles de la porte
+    """
+    width = min(DOOR_WIDTH, end - start - 1)
+    first = generator.randint(start + 1, end - width)
+    return range(first, first + width)
+
+
+def __wall_symbol(walls: list, x: int, y: int) -> str:
+    """
+    Retourne le symbole d'un mur selon les murs qui le touchent (haut, bas, gauche, droite).
+    :param walls: grille des murs (rangée par rangée)
+    :param x: colonne du mur
+    :param y: rangée du mur
+    :return: le symbole
+    """
+    rows = len(walls)
+    columns = len(walls[0])
+    return WALL_SYMBOLS[(y > 0 and walls[y - 1][x],
+                         y < rows - 1 and walls[y + 1][x],
+                         x > 0 and walls[y][x - 1],
+                         x < columns - 1 and walls[y][x + 1])]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Génération d'un bureau")
+    parser.add_argument('columns', type=int, help="largeur du bureau (en tuiles)")
+    parser.add_argument('rows', type=int, help="hauteur du bureau (en tuiles)")
+    parser.add_argument('--room-size', type=int, nargs=2, default=DEFAULT_ROOM_SIZE, metavar=('LARGEUR', 'HAUTEUR'),
+                        help="dimensions d'une pièce (en tuiles, cloison comprise)")
+    parser.add_argument('--density', type=float, default=0.5, help="proportion des emplacements de postes occupés")
+    parser.add_argument('--characters', type=int, default=len(CHARACTERS), help="nombre de personnages")
+    parser.add_argument('--seed', type=int, help="graine du générateur pseudo-aléatoire")
+    destination = parser.add_mutually_exclusive_group()
+    destination.add_argument('--level', type=int, help="numéro du niveau à créer (carte et fichier binaire)")
+    destination.add_argument('--output', help="fichier de la carte (sortie standard si absent)")
+    arguments = parser.parse_args()
+
+    contents = generate_office(arguments.columns, arguments.rows, tuple(arguments.room_size), arguments.density,
+                               arguments.characters, arguments.seed)
+
+    if arguments.level is not None:
+        import helper_tools
+
+        map_filename = helper_tools.level_filenames(arguments.level)[0]
+        with open(map_filename, "w") as map_file:
+            map_file.write(contents)
+        helper_tools.create_level_file(arguments.level)
+    elif arguments.output:
+        with open(arguments.output, "w") as map_file:
+            map_file.write(contents)
+    else:
+        print(contents)
@@ -4,8 +4,19 @@ import settings
 
 from asset import Asset
 from character import Character
+from spatial_grid import SpatialGrid
 from tile import Tile
 
+# dimension (en tuiles) d'une cellule des index spatiaux du bureau
+SPATIAL_CELL_TILES = 4
+
+# largeur (en pixels) de la bordure retirée des tuiles adjacentes au vide
+BORDER_WIDTH = 5
+
+# voisins d'une tuile (delta x, delta y) - l'index d'un voisin est le numéro de son bit dans le motif de voisinage
+NEIGHBOURS = ((-1, 0), (0, -1), (1, 0), (0, 1),
+              (-1, -1), (-1, 1), (1, -1), (1, 1))
+
 
 class Office:
     """ Le bureau. """
@@ -18,6 +29,12 @@ class Office:
         self.__surface = None
         self.__tile_size = None
 
+        # Rendu en mode retenu : le fond (plancher, murs et actifs) est conservé et seules les zones touchées par
+        # les éléments dynamiques (personnages, minuteries d'incidents, noms) sont restaurées puis redessinées
+        self.__background = None
+        self.__composite = None
+        self.__dirty_rects = []
+
         self.__ambience_sound = resources.sounds_collection.get(
             'OFFICE-AMBIENCE')
         self.__ambience_enabled = False
@@ -25,10 +42,16 @@ class Office:
         self.__assets = {}
         self.__characters = {}
 
-    def build(self, floor_and_walls: list) -> None:
+        # index spatiaux (voir build()) : actifs selon leur centre et personnages selon la position de leurs pieds
+        self.__assets_grid = None
+        self.__characters_grid = None
+
+    def build(self, floor_and_walls: list, prebaked: tuple = None) -> None:
         """
         Construit le bureau (agencement de tuiles) à partir de la grille fournie (floor_and_walls).
         :param floor_and_walls: grille contenant les identifiants de tuiles à utiliser
+        :param prebaked: (image statique, grille praticable) déjà composées pour cette grille (voir level_cache), None
+                         pour composer l'image à partir des tuiles
         :return: aucun
         """
         # Créer l'ensemble des tuiles représentant la structure du bureau ainsi que la surface (l'image)
@@ -42,12 +65,22 @@ class Office:
         tile = resources.tiles_collection.get(0)
         self.__tile_size = tile.get_width()
 
-        surface = pygame.Surface(
-            (width * self.__tile_size, height * self.__tile_size))
+        self.__assets_grid = SpatialGrid(self.__tile_size * SPATIAL_CELL_TILES)
+        self.__characters_grid = SpatialGrid(
+            self.__tile_size * SPATIAL_CELL_TILES)
+
+        if prebaked:
+            surface, walkable = prebaked
+            if surface.get_size() != (width * self.__tile_size, height * self.__tile_size) or \
+                    len(walkable) != width * height:
+                prebaked = None
 
-        __DELTAS = [(1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0),
-                    (-1, -1), (0, -1), (1, -1), (0, 0)]
-        __BORDER_WIDTH = 5
+        if not prebaked:
+            surface = pygame.Surface(
+                (width * self.__tile_size, height * self.__tile_size))
+
+        # Tuiles découpées, rendues une seule fois par combinaison (identifiant de tuile, motif de voisinage)
+        cropped_tiles = {}
 
         for y in range(height):
             for x in range(width):
@@ -66,74 +99,66 @@ class Office:
                 if tile_id == Tile.SPECIAL:
                     tile_id = Tile.FLOOR
 
+                if prebaked:
+                    self.__floor_and_walls[x][y].walkable = bool(
+                        walkable[x * height + y])
+                    continue
+
                 if tile_id == Tile.FLOOR:
                     self.__floor_and_walls[x][y].walkable = True
 
-                if not (tile := resources.tiles_collection.get(tile_id).copy()):
-                    continue
+                # Motif de voisinage : un bit par voisin vide (ou hors du bureau)
+                pattern = 0
+                for bit, (delta_x, delta_y) in enumerate(NEIGHBOURS):
+                    neighbour_x = x + delta_x
+                    neighbour_y = y + delta_y
+                    if not (0 <= neighbour_x < width and 0 <= neighbour_y < height) or \
+                            floor_and_walls[neighbour_x][neighbour_y] == Tile.VOID:
+                        pattern |= 1 << bit
 
-                # Cropping
-                # Recuperation de la matrice autour de la case (9*9)
-                outline = [[-1 for _ in range(3)]for _ in range(3)]
-                for delta in __DELTAS:
-                    # On met -1 si on sort des bords de la liste
-                    try:
-                        outline[delta[0] + 1][delta[1] + 1] = floor_and_walls[x + delta[0]][y + delta[1]
-                                                                                            ] if x + delta[0] > -1 and y + delta[1] > -1 else -1
-                    except IndexError:
-                        outline[delta[0] + 1][delta[1] + 1] = -1
-
-                # Bords adjacents à un vide (et angles exterieurs par extension)
-                # Gauche
-                if outline[0][1] == -1:
-                    for k in range(__BORDER_WIDTH):
-                        for l in range(self.__tile_size):
-                            tile.set_at((k, l), 0)
-                # Haut
-                if outline[1][0] == -1:
-                    for k in range(self.__tile_size):
-                        for l in range(__BORDER_WIDTH):
-                            tile.set_at((k, l), 0)
-                # Droite
-                if outline[2][1] == -1:
-                    # On ajoute 1 pour atteindre le max
-                    for k in range(__BORDER_WIDTH + 1):
-                        for l in range(self.__tile_size):
-                            tile.set_at((self.__tile_size - k, l), 0)
-                # Bas
-                if outline[1][2] == -1:
-                    for k in range(self.__tile_size):
-                        for l in range(__BORDER_WIDTH + 1):
-                            tile.set_at((k, self.__tile_size - l), 0)
-
-                # Angles interieurs
-                # Haut Gauche
-                if outline[0][0] == -1:
-                    for k in range(__BORDER_WIDTH):
-                        for l in range(__BORDER_WIDTH):
-                            tile.set_at((k, l), 0)
-                # Haut Droite
-                if outline[0][2] == -1:
-                    for k in range(__BORDER_WIDTH):
-                        for l in range(__BORDER_WIDTH + 1):
-                            tile.set_at((k, self.__tile_size - l), 0)
-                # Bas Gauche
-                if outline[2][0] == -1:
-                    for k in range(__BORDER_WIDTH + 1):
-                        for l in range(__BORDER_WIDTH):
-                            tile.set_at((self.__tile_size - k, l), 0)
-                # Bas Droite
-                if outline[2][2] == -1:
-                    for k in range(__BORDER_WIDTH + 1):
-                        for l in range(__BORDER_WIDTH + 1):
-                            tile.set_at(
-                                (self.__tile_size - k, self.__tile_size - l), 0)
+                key = (tile_id, pattern)
+                if key not in cropped_tiles:
+                    cropped_tiles[key] = self.__crop_tile(tile_id, pattern)
 
                 # On place la tuile
-                surface.blit(tile, (pos_x, pos_y),
-                             (0, 0, self.__tile_size, self.__tile_size))
+                if tile := cropped_tiles[key]:
+                    surface.blit(tile, (pos_x, pos_y),
+                                 (0, 0, self.__tile_size, self.__tile_size))
 
         self.__surface = surface
+        self.__background = surface.copy()
+        self.__composite = surface.copy()
+        self.__dirty_rects = []
+
+    def __crop_tile(self, tile_id: int, pattern: int) -> pygame.Surface or None:
+        """
+        Retourne une copie de la tuile dont les bordures adjacentes au vide sont retirées (remplies de noir).
+        Les bords adjacents à un vide retirent une bande complète, les coins (angles intérieurs) un carré.
+        :param tile_id: identifiant de tuile
+        :param pattern: motif de voisinage (un bit par voisin vide, voir NEIGHBOURS)
+        :return: la tuile découpée, None si l'identifiant de tuile n'existe pas
+        """
+        if not (tile := resources.tiles_collection.get(tile_id)):
+            return None
+
+        tile = tile.copy()
+        size = self.__tile_size
+        far = size - BORDER_WIDTH
+
+        crop_rects = ((0, 0, BORDER_WIDTH, size),                   # gauche
+                      (0, 0, size, BORDER_WIDTH),                   # haut
+                      (far, 0, BORDER_WIDTH, size),                 # droite
+                      (0, far, size, BORDER_WIDTH),                 # bas
+                      (0, 0, BORDER_WIDTH, BORDER_WIDTH),           # haut gauche
+                      (0, far, BORDER_WIDTH, BORDER_WIDTH),         # bas gauche
+                      (far, 0, BORDER_WIDTH, BORDER_WIDTH),         # haut droite
+                      (far, far, BORDER_WIDTH, BORDER_WIDTH))       # bas droite
+
+        for bit, rect in enumerate(crop_rects):
+            if pattern & (1 << bit):
+                tile.fill((0, 0, 0), rect)
+
+        return tile
 
     def add_asset(self, asset: Asset) -> None:
         """
@@ -143,11 +168,17 @@ class Office:
         """
         self.__assets[asset.name] = asset
 
+        # L'image de l'actif ne change jamais : elle fait partie du fond
+        asset.draw_static(self.__background)
+        asset.draw_static(self.__composite)
+
         # Configuration de la tuile sous-jacente pour qu'elle devienne un obstacle
         x, y = asset.tile_position
         tile = self.__floor_and_walls[x][y]
         tile.walkable = False
 
+        self.__assets_grid.insert(asset, asset.center_position)
+
     def add_character(self, character: Character) -> None:
         """
         Ajoute un personnage au bureau.
@@ -155,6 +186,59 @@ class Office:
         :return: aucun
         """
         self.__characters[character.name] = character
+        self.__characters_grid.insert(character, character.feet_position)
+
+    def move_character(self, character: Character, feet_position: tuple) -> None:
+        """
+        Déplace un personnage du bureau (et met à jour l'index spatial des personnages).
+        :param character: le personnage à déplacer
+        :param feet_position: nouvelle position des pieds du personnage (en pixels)
+        :return: aucun
+        """
+        character.feet_position = feet_position
+        self.__characters_grid.move(character, feet_position)
+
+    def find_closest_asset(self, point: tuple, max_distance: float) -> Asset or None:
+        """
+        Trouve l'actif le plus près d'un point donné, à une distance maximale donnée.
+        :param point: coordonnée (x, y) en pixels
+        :param max_distance: distance maximale (en pixels) entre le point et le centre de l'actif
+        :return: l'actif si trouvé, None sinon
+        """
+        return self.__assets_grid.find_closest(point, max_distance)
+
+    def assets_within(self, point: tuple, max_distance: float) -> list:
+        """
+        Retourne les actifs dont le centre se trouve à une distance maximale d'un point donné.
+        :param point: coordonnée (x, y) en pixels
+        :param max_distance: distance maximale (en pixels) entre le point et le centre de l'actif
+        :return: liste des actifs
+        """
+        return self.__assets_grid.query_radius(point, max_distance)
+
+    def assets_outside(self, bounds: tuple) -> list:
+        """
+        Retourne les actifs dont le centre se trouve hors d'une zone donnée.
+        :param bounds: zone (gauche, haut, droite, bas) en pixels
+        :return: liste des actifs
+        """
+        return self.__assets_grid.query_outside(bounds)
+
+    def characters_inside(self, bounds: tuple) -> list:
+        """
+        Retourne les personnages dont les pieds se trouvent dans une zone donnée.
+        :param bounds: zone (gauche, haut, droite, bas) en pixels
+        :return: liste des personnages
+        """
+        return self.__characters_grid.query_inside(bounds)
+
+    def characters_outside(self, bounds: tuple) -> list:
+        """
+        Retourne les personnages dont les pieds se trouvent hors d'une zone donnée.
+        :param bounds: zone (gauche, haut, droite, bas) en pixels
+        :return: liste des personnages
+        """
+        return self.__characters_grid.query_outside(bounds)
 
     def disable_ambience(self) -> None:
         """ Désactive les éléments d'ambience du bureau. """
@@ -171,18 +255,28 @@ class Office:
     def get_image(self, display_name) -> pygame.Surface:
         """
         Retourne l'image du bureau incluant les actifs et les personnages.
-        :return: surface représentant une image du bureau
+        Seules les zones modifiées à la trame précédente sont restaurées à partir du fond avant de redessiner les
+        éléments dynamiques : le coût d'une trame dépend de ce qui bouge et non de la taille du bureau.
+        :param display_name: True pour afficher le nom des actifs et des personnages
+        :return: surface représentant une image du bureau (ne pas modifier, elle est réutilisée d'une trame à l'autre)
         """
+        composite = self.__composite
+
+        # Restauration du fond sous les éléments dessinés à la trame précédente
+        for rect in self.__dirty_rects:
+            composite.blit(self.__background, rect, rect)
 
-        combined = self.__surface.copy()
+        dirty_rects = []
 
         for asset in self.__assets.values():
-            asset.draw(combined, display_name)
+            dirty_rects.extend(asset.draw(composite, display_name))
 
         for character in self.__characters.values():
-            character.draw(combined, display_name)
+            dirty_rects.extend(character.draw(composite, display_name))
 
-        return combined
+        self.__dirty_rects = dirty_rects
+
+        return composite
 
     def in_navmesh(self, point: tuple) -> bool:
         """
@@ -205,3 +299,20 @@ class Office:
         tile_y = int(point[1] // self.__tile_size)
 
         return self.__floor_and_walls[tile_x][tile_y]
+
+    @property
+    def size(self) -> tuple:
+        return self.__surface.get_size()
+
+    @property
+    def grid_size(self) -> tuple:
+        return len(self.__floor_and_walls), len(self.__floor_and_walls[0])
+
+    @property
+    def static_image(self) -> pygame.Surface:
+        return self.__surface
+
+    @property
+    def walkable_grid(self) -> bytes:
+        """ Grille des tuiles praticables : un octet par tuile (1 si praticable), colonne par colonne. """
+        return bytes(tile.walkable for column in self.__floor_and_walls for tile in column)
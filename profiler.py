@@ -0,0 +1,206 @@
+import json
+import math
+import time
+
+from collections import deque
+
+import pygame
+import resources
+
+# nombre de trames conservées pour les statistiques et la trace
+DEFAULT_HISTORY = 600
+
+# intervalle (en secondes) entre deux mises à jour de l'affichage des statistiques
+OVERLAY_REFRESH_INTERVAL = 0.5
+
+# centiles affichés
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(sorted_values: list, rank: float) -> float:
+    """
+    Calcule un centile (méthode du rang le plus proche).
+    :param sorted_values: valeurs triées en ordre croissant (au moins une valeur)
+    :param rank: centile voulu (de 0 à 100)
+    :return: la valeur du centile
+    """
+    index = max(math.ceil(rank / 100 * len(sorted_values)) - 1, 0)
+    return sorted_values[min(index, len(sorted_values) - 1)]
+
+
+class PhaseTimer:
+    """ Chronomètre d'une phase de trame, utilisé comme gestionnaire de contexte (voir FrameProfiler.phase()). """
+
+    def __init__(self, profiler: 'FrameProfiler', name: str) -> None:
+        self.__profiler = profiler
+        self.__name = name
+        self.__start = 0
+
+    def __enter__(self) -> 'PhaseTimer':
+        self.__start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.__profiler.record(self.__name, self.__start, time.perf_counter_ns())
+
+
+class FrameProfiler:
+    """
+    Profileur de trames : mesure la durée de chaque phase de la boucle de jeu, affiche les centiles (p50, p95, p99)
+    par-dessus le jeu et exporte les dernières trames au format de trace de Chrome (chrome://tracing, Perfetto).
+    """
+
+    def __init__(self, history: int = DEFAULT_HISTORY) -> None:
+        """
+        Initialise un profileur (objet FrameProfiler).
+        :param history: nombre de trames conservées
+        """
+        self.__history = history
+
+        # origine des temps de la trace (en nanosecondes)
+        self.__origin = time.perf_counter_ns()
+
+        # phase -> durées (en nanosecondes) des dernières trames, dans l'ordre de première apparition des phases
+        self.__durations = {}
+        # chronomètres réutilisés d'une trame à l'autre
+        self.__phase_timers = {}
+        # événements [(nom, début, fin)] des dernières trames (une liste par trame), pour la trace
+        self.__trace = deque(maxlen=history)
+        self.__frame_events = None
+
+        self.__frame_start = None
+
+        self.__overlay_visible = False
+        self.__overlay_surface = None
+        self.__overlay_refresh_time = 0
+
+    def begin_frame(self) -> None:
+        """ Marque le début d'une trame. """
+        self.__frame_events = []
+        self.__frame_start = time.perf_counter_ns()
+
+    def end_frame(self) -> None:
+        """ Marque la fin d'une trame (la durée de la trame est enregistrée comme la phase 'frame'). """
+        if self.__frame_start is None:
+            return
+
+        self.record('frame', self.__frame_start, time.perf_counter_ns())
+        self.__trace.append(self.__frame_events)
+        self.__frame_events = None
+        self.__frame_start = None
+
+    def phase(self, name: str) -> PhaseTimer:
+        """
+        Retourne le chronomètre d'une phase, à utiliser avec with : with profiler.phase('update'): ...
+        :param name: nom de la phase
+        :return: le chronomètre
+        """
+        phase_timer = self.__phase_timers.get(name)
+        if not phase_timer:
+            phase_timer = PhaseTimer(self, name)
+            self.__phase_timers[name] = phase_timer
+        return phase_timer
+
+    def record(self, name: str, start: int, end: int) -> None:
+        """
+        Enregistre la durée d'une phase.
+        :param name: nom de la phase
+        :param start: début (temps de time.perf_counter_ns())
+        :param end: fin (temps de time.perf_counter_ns())
+        :return: aucun
+        """
+        durations = self.__durations.get(name)
+        if durations is None:
+            durations = deque(maxlen=self.__history)
+            self.__durations[name] = durations
+        durations.append(end - start)
+
+        if self.__frame_events is not None:
+            self.__frame_events.append((name, start, end))
+
+    def statistics(self) -> dict:
+        """
+        Calcule les centiles de durée de chaque phase sur les dernières trames.
+        :return: dictionnaire phase -> (p50, p95, p99) en millisecondes
+        """
+        statistics = {}
+        for name, durations in self.__durations.items():
+            if durations:
+                sorted_durations = sorted(durations)
+                statistics[name] = tuple(percentile(sorted_durations, rank) / 1e6 for rank in PERCENTILES)
+        return statistics
+
+    def toggle_overlay(self) -> None:
+        """ Affiche ou cache les statistiques par-dessus le jeu. """
+        self.__overlay_visible = not self.__overlay_visible
+        self.__overlay_surface = None
+
+    def draw(self, destination: pygame.Surface, position: tuple) -> None:
+        """
+        Dessine les statistiques (si elles sont affichées). Le texte n'est recalculé que quelques fois par seconde.
+        :param destination: surface sur laquelle dessiner
+        :param position: position (x, y) du coin supérieur gauche
+        :return: aucun
+        """
+        if not self.__overlay_visible:
+            return
+
+        now = time.perf_counter()
+        if self.__overlay_surface is None or now >= self.__overlay_refresh_time:
+            self.__overlay_surface = self.__render_overlay()
+            self.__overlay_refresh_time = now + OVERLAY_REFRESH_INTERVAL
+
+        destination.blit(self.__overlay_surface, position)
+
+    def __render_overlay(self) -> pygame.Surface:
+        """
+        Construit la surface des statistiques : une ligne par phase, une colonne par centile.
+        :return: la surface
+        """
+        font = resources.fonts.get('HUD-SMALL')
+        color = (255, 255, 255)
+
+        rows = [['PHASE (ms)'] + [f'p{rank}' for rank in PERCENTILES]]
+        for name, values in self.statistics().items():
+            rows.append([name] + [f'{value:.2f}' for value in values])
+        rows = [[font.render(text, True, color) for text in row] for row in rows]
+
+        # colonnes alignées à gauche pour les noms et à droite pour les valeurs
+        margin = 5
+        column_widths = [max(row[i].get_width() for row in rows) + 2 * margin for i in range(len(rows[0]))]
+        line_height = font.get_linesize()
+
+        overlay = pygame.Surface((sum(column_widths) + 2 * margin, len(rows) * line_height + 2 * margin),
+                                 pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 160))
+        for row_index, row in enumerate(rows):
+            y = margin + row_index * line_height
+            overlay.blit(row[0], (margin, y))
+            x = margin + column_widths[0]
+            for column_index, surface in enumerate(row[1:], 1):
+                x += column_widths[column_index]
+                overlay.blit(surface, (x - margin - surface.get_width(), y))
+
+        return overlay
+
+    def export_chrome_trace(self, filename: str) -> bool:
+        """
+        Exporte les dernières trames au format de trace de Chrome (Trace Event Format, événements complets 'X').
+        :param filename: nom du fichier JSON à créer
+        :return: True si l'exportation a réussi, False sinon
+        """
+        trace_events = [{'name': name, 'cat': 'frame', 'ph': 'X', 'pid': 1, 'tid': 1,
+                         'ts': (start - self.__origin) / 1000, 'dur': (end - start) / 1000}
+                        for frame_events in self.__trace for name, start, end in frame_events]
+        try:
+            with open(filename, "w") as trace_file:
+                json.dump({'traceEvents': trace_events, 'displayTimeUnit': 'ms'}, trace_file)
+        except OSError:
+            print(f"Erreur lors de l'écriture de la trace : {filename}")
+            return False
+
+        return True
+
+    @property
+    def overlay_visible(self) -> bool:
+        return self.__overlay_visible
@@ -1,14 +1,10 @@
 import math
 import pygame
 import settings
-import time
-import datetime
-from threading import Thread, Event
+import timers
 
-PROGRESS_TICK = 0.25  # en secondes
 
-
-class ProgressBar(Thread):
+class ProgressBar:
     """ Barre de progression de resolution d'un incident. """
 
     def __init__(self, time_to_solve: float) -> None:
@@ -16,22 +12,18 @@ class ProgressBar(Thread):
         Initialise la barre.
         :param time_to_solve: temps de résolution (en secondes)
         """
-        super().__init__()
-        self.__time_to_solve = time_to_solve
-        self.__remaining_time = time_to_solve
-
-        # événement servant à arrêter la tâche (va aussi la réveiller si nécessaire)
-        self.__event = Event()
+        # minuterie de résolution : le temps restant est calculé à la demande (voir timers.Timer)
+        self.__timer = timers.Timer(time_to_solve)
 
-        self.__is_paused = False
-
-        self.__is_solved = False
+    def start(self) -> None:
+        """ Démarre le décompte de la résolution. """
+        self.__timer.start()
 
     def pause(self):
-        self.__is_paused = True
+        self.__timer.pause()
 
     def unpause(self):
-        self.__is_paused = False
+        self.__timer.unpause()
 
     def get(self) -> pygame.Surface:
         """
@@ -40,38 +32,21 @@ class ProgressBar(Thread):
         """
         return
 
-    def run(self) -> None:
-        """ Méthode principale exécutée par la tâche de resolution. """
-
-        previous_time = time.time()
-
-        while not self.__event.is_set():
-            now = time.time()
-            if self.__remaining_time > 0 and not self.__is_paused:
-                self.__remaining_time -= now - previous_time
-                if self.__remaining_time < 0:
-                    self.__remaining_time = 0
-                    self.__is_solved = True
-
-            previous_time = now
-
-            self.__event.wait(PROGRESS_TICK)
-
     def get_remaining_time_percentage(self) -> float:
         """
         Récupère le temps qui reste (en pourcentage).
         :return: pourcentage du temps restant (de 0.0 à 100.0)
         """
         # le pourcentage de résolution est le temps restant sur le temps alloué (x 100 pour une valeur ##.##)
-        return self.__remaining_time / self.__time_to_solve * 100
+        return self.__timer.get_remaining_time_percentage()
 
     def stop(self) -> None:
-        """ Arrête la tâche de resolution. """
-        self.__event.set()
+        """ Arrête le décompte de la résolution. """
+        self.__timer.stop()
 
     @property
     def is_solved(self) -> bool:
-        return self.__is_solved
+        return self.__timer.has_expired()
 
 
 @staticmethod
@@ -0,0 +1,147 @@
+# Journal binaire des événements d'une partie (arrivées d'appels, affectations, résolutions et expirations
+# d'incidents), pour rejouer exactement la même charge d'une exécution à l'autre (voir headless et game)
+import struct
+
+from enum import IntEnum
+
+
+class EventType(IntEnum):
+    """ Type d'événement du journal. Attention: les valeurs sont enregistrées dans les fichiers. """
+    SPAWN = 1  # un appel arrive au centre d'appels
+    ASSIGN = 2  # un incident est confié à un actif
+    SOLVE = 3  # un incident est résolu
+    EXPIRE = 4  # un incident expire
+    LEVEL = 5  # un niveau commence (partie sur plusieurs niveaux, voir level_events())
+
+
+# à incrémenter lorsque le format du fichier change
+LOG_VERSION = 1
+
+
+class EventLog:
+    """
+    Journal d'événements. Les événements sont datés par numéro de pas de simulation (ou de trame, pour le jeu)
+    plutôt qu'en secondes : un journal rejoué avec le même pas déclenche chaque événement exactement au même pas.
+    Un journal peut couvrir plusieurs niveaux : chaque niveau commence alors par un événement LEVEL (valeur : numéro
+    du niveau) et ses pas sont comptés à partir de 0.
+    """
+
+    __MAGIC = b'C93E'
+
+    # en-tête : signature, version, numéro de niveau, graine, pas de simulation (en secondes)
+    __HEADER = struct.Struct('<4sHHQd')
+
+    # événement : type, numéro du pas de simulation, expertise, position de tuile (x, y) de l'actif, valeur (temps
+    # de résolution permis pour SPAWN et ASSIGN, points obtenus pour SOLVE, numéro du niveau pour LEVEL) - 14 octets
+    __RECORD = struct.Struct('<BIBhhf')
+
+    def __init__(self, level_number: int, seed: int, time_step: float) -> None:
+        """
+        Initialise un journal vide (objet EventLog).
+        :param level_number: numéro du niveau joué
+        :param seed: graine du générateur pseudo-aléatoire des incidents
+        :param time_step: pas de simulation (en secondes)
+        """
+        self.__level_number = level_number
+        self.__seed = seed
+        self.__time_step = time_step
+
+        # événements encodés les uns à la suite des autres (voir __RECORD)
+        self.__data = bytearray()
+
+    def record(self, event_type: EventType, step: int, expertise: int = 0, tile_position: tuple = (0, 0),
+               value: float = 0.0) -> None:
+        """
+        Ajoute un événement au journal.
+        :param event_type: type d'événement
+        :param step: numéro du pas de simulation
+        :param expertise: expertise sollicitée par l'incident
+        :param tile_position: position de tuile (x, y) de l'actif concerné
+        :param value: temps de résolution permis (SPAWN, ASSIGN), points obtenus (SOLVE) ou numéro du niveau (LEVEL)
+        :return: aucun
+        """
+        self.__data += self.__RECORD.pack(event_type, step, expertise, *tile_position, value)
+
+    def events(self) -> list:
+        """
+        Retourne les événements du journal, dans l'ordre où ils ont été enregistrés.
+        :return: liste de tuples (type, pas, expertise, (x, y), valeur)
+        """
+        return [(EventType(event_type), step, expertise, (x, y), value)
+                for event_type, step, expertise, x, y, value in self.__RECORD.iter_unpack(self.__data)]
+
+    def level_events(self, level_number: int, event_types: tuple = (EventType.SPAWN, EventType.ASSIGN)) -> list:
+        """
+        Retourne les événements d'un niveau (ceux qui suivent son événement LEVEL, ou tous les événements pour le
+        niveau du journal si le journal ne contient aucun événement LEVEL).
+        :param level_number: numéro du niveau
+        :param event_types: types d'événements retenus (arrivées et affectations par défaut, ceux qu'on rejoue)
+        :return: liste de tuples (type, pas, expertise, (x, y), valeur)
+        """
+        events = self.events()
+        current_level = self.__level_number
+        selected = []
+        for event in events:
+            if event[0] == EventType.LEVEL:
+                current_level = int(event[4])
+            elif current_level == level_number and event[0] in event_types:
+                selected.append(event)
+        return selected
+
+    def count(self, event_type: EventType) -> int:
+        """
+        Compte les événements d'un type donné.
+        :param event_type: type d'événement
+        :return: nombre d'événements
+        """
+        return sum(1 for event in self.__RECORD.iter_unpack(self.__data) if event[0] == event_type)
+
+    def save(self, filename: str) -> None:
+        """
+        Enregistre le journal dans un fichier.
+        :param filename: nom du fichier
+        :return: aucun
+        """
+        with open(filename, "wb") as log_file:
+            log_file.write(self.__HEADER.pack(self.__MAGIC, LOG_VERSION, self.__level_number, self.__seed,
+                                              self.__time_step))
+            log_file.write(self.__data)
+
+    @staticmethod
+    def load(filename: str) -> 'EventLog' or None:
+        """
+        Charge un journal à partir d'un fichier.
+        :param filename: nom du fichier
+        :return: le journal, None si le fichier est illisible ou invalide
+        """
+        try:
+            with open(filename, "rb") as log_file:
+                data = log_file.read()
+            magic, version, level_number, seed, time_step = EventLog.__HEADER.unpack_from(data)
+        except (OSError, struct.error):
+            print(f"Erreur de lecture : {filename}")
+            return None
+
+        if magic != EventLog.__MAGIC or version != LOG_VERSION or \
+                (len(data) - EventLog.__HEADER.size) % EventLog.__RECORD.size:
+            print(f"Journal invalide : {filename}")
+            return None
+
+        event_log = EventLog(level_number, seed, time_step)
+        event_log.__data = bytearray(data[EventLog.__HEADER.size:])
+        return event_log
+
+    @property
+    def level_number(self) -> int:
+        return self.__level_number
+
+    @property
+    def seed(self) -> int:
+        return self.__seed
+
+    @property
+    def time_step(self) -> float:
+        return self.__time_step
+
+    def __len__(self) -> int:
+        return len(self.__data) // self.__RECORD.size
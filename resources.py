@@ -1,6 +1,12 @@
+import audio
+import os
 import pygame
 import settings
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from audio import Category, ChunkedSound, ManagedSound, Playback, StreamedSound
 from expertise import Expertise
 from error_codes import Error_codes
 
@@ -9,6 +15,7 @@ class __CharactersCollection:
     """ Collection de personnages utilisée par l'objet global characters_collection (voir plus bas). """
 
     def __init__(self) -> None:
+        self.__sheet = None
         self.__surfaces = None
 
     def init(self) -> Error_codes:
@@ -30,7 +37,18 @@ class __CharactersCollection:
         if not characters_sheet:
             return Error_codes.IMG_CHAR
 
+        # la découpe est faite à la première utilisation (voir __get_surfaces())
+        self.__sheet = characters_sheet
+
+        return Error_codes.SUCCES
+
+    def __get_surfaces(self) -> list:
+        """ Retourne les surfaces des personnages, en découpant l'image chargée au premier appel. """
+        if self.__surfaces is not None:
+            return self.__surfaces
+
         # découpe la surface de personnages en surfaces individuelles (une pour chaque personnage)
+        characters_sheet = self.__sheet
         height = characters_sheet.get_height()
         width = characters_sheet.get_width() / settings.NB_CHARACTERS
 
@@ -41,8 +59,9 @@ class __CharactersCollection:
             source_area = pygame.Rect(i * width, 0, width, height)
             character_surface.blit(characters_sheet, (0, 0), source_area)
             self.__surfaces.append(character_surface)
+        self.__sheet = None
 
-        return Error_codes.SUCCES
+        return self.__surfaces
 
     def get(self, character_id: int) -> pygame.Surface or None:
         """
@@ -50,9 +69,9 @@ class __CharactersCollection:
         :param character_id: identifiant de personnage
         :return: la surface si disponible, None sinon
         """
-        assert self.__surfaces
+        assert self.__surfaces or self.__sheet
         if 0 <= character_id < settings.NB_CHARACTERS:
-            return self.__surfaces[character_id]
+            return self.__get_surfaces()[character_id]
 
         return None
 
@@ -64,7 +83,8 @@ class __CharactersIconCollection:
     """
 
     def __init__(self) -> None:
-        self.__incident_surfaces = None
+        self.__sheet = None
+        self.__surfaces = None
 
     def init(self) -> Error_codes:
         """
@@ -88,7 +108,18 @@ class __CharactersIconCollection:
         if icons_sheet.get_width() % icons_sheet.get_height() != 0:
             return Error_codes.SQUARES_ICONES_CHAR
 
+        # la découpe est faite à la première utilisation (voir __get_surfaces())
+        self.__sheet = icons_sheet
+
+        return Error_codes.SUCCES
+
+    def __get_surfaces(self) -> list:
+        """ Retourne les surfaces des icônes, en découpant l'image chargée au premier appel. """
+        if self.__surfaces is not None:
+            return self.__surfaces
+
         # découpe la surface d'icones en surfaces individuelles (une pour chaque icone)
+        icons_sheet = self.__sheet
         height = width = icons_sheet.get_height()
         self.__surfaces = []
         for i in range(icons_sheet.get_width() // width):
@@ -96,8 +127,9 @@ class __CharactersIconCollection:
             source_area = pygame.Rect(i * width, 0, width, height)
             icon_surface.blit(icons_sheet, (0, 0), source_area)
             self.__surfaces.append(icon_surface)
+        self.__sheet = None
 
-        return Error_codes.SUCCES
+        return self.__surfaces
 
     def get(self, icon_id: int) -> pygame.Surface or None:
         """
@@ -106,9 +138,10 @@ class __CharactersIconCollection:
         :param icon_id: identifiant de l'icone
         :return: la surface si disponible, None sinon
         """
-        assert self.__surfaces
-        if 0 <= icon_id < len(self.__surfaces):
-            return self.__surfaces[icon_id]
+        assert self.__surfaces or self.__sheet
+        surfaces = self.__get_surfaces()
+        if 0 <= icon_id < len(surfaces):
+            return surfaces[icon_id]
 
         return None
 
@@ -117,6 +150,7 @@ class __ProgressBarCollection:
     "Collection de barres pour la progression du travail du personnage utilisée par l'objet global progress_bar_collection"
 
     def __init__(self) -> None:
+        self.__sheet = None
         self.__surfaces = None
 
     def init(self) -> Error_codes:
@@ -141,7 +175,18 @@ class __ProgressBarCollection:
         if progress_bar_sheet.get_width() % progress_bar_sheet.get_height() != 0:
             return Error_codes.SQUARES_PROGRESS_BAR
 
-        # découpe la surface de tuiles en surfaces individuelles (une pour chaque tuile)
+        # la découpe est faite à la première utilisation (voir __get_surfaces())
+        self.__sheet = progress_bar_sheet
+
+        return Error_codes.SUCCES
+
+    def __get_surfaces(self) -> list:
+        """ Retourne les surfaces des barres, en découpant l'image chargée au premier appel. """
+        if self.__surfaces is not None:
+            return self.__surfaces
+
+        # découpe la surface de barres en surfaces individuelles (une pour chaque barre)
+        progress_bar_sheet = self.__sheet
         height = width = progress_bar_sheet.get_height()
         self.__surfaces = []
         for i in range(progress_bar_sheet.get_width() // width):
@@ -150,8 +195,9 @@ class __ProgressBarCollection:
             source_area = pygame.Rect(i * width, 0, width, height)
             progress_bar_surface.blit(progress_bar_sheet, (0, 0), source_area)
             self.__surfaces.append(progress_bar_surface)
+        self.__sheet = None
 
-        return Error_codes.SUCCES
+        return self.__surfaces
 
     def get(self, bar_id: int) -> pygame.Surface or None:
         """
@@ -159,9 +205,10 @@ class __ProgressBarCollection:
         :param bar_id: identifiant de barre
         :return: la surface si disponible, None sinon
         """
-        assert self.__surfaces
-        if 0 <= bar_id < len(self.__surfaces):
-            return self.__surfaces[bar_id]
+        assert self.__surfaces or self.__sheet
+        surfaces = self.__get_surfaces()
+        if 0 <= bar_id < len(surfaces):
+            return surfaces[bar_id]
 
         return None
 
@@ -170,6 +217,7 @@ class __TilesCollection:
     """ Collection de tuiles utilisée par l'objet global tiles_collection (voir plus bas). """
 
     def __init__(self) -> None:
+        self.__sheet = None
         self.__surfaces = None
 
     def init(self) -> Error_codes:
@@ -193,7 +241,18 @@ class __TilesCollection:
         if tiles_sheet.get_width() % tiles_sheet.get_height() != 0:
             return Error_codes.SQUARES_TILES
 
+        # la découpe est faite à la première utilisation (voir __get_surfaces())
+        self.__sheet = tiles_sheet
+
+        return Error_codes.SUCCES
+
+    def __get_surfaces(self) -> list:
+        """ Retourne les surfaces des tuiles, en découpant l'image chargée au premier appel. """
+        if self.__surfaces is not None:
+            return self.__surfaces
+
         # découpe la surface de tuiles en surfaces individuelles (une pour chaque tuile)
+        tiles_sheet = self.__sheet
         height = width = tiles_sheet.get_height()
         self.__surfaces = []
         for i in range(tiles_sheet.get_width() // width):
@@ -201,8 +260,9 @@ class __TilesCollection:
             source_area = pygame.Rect(i * width, 0, width, height)
             tile_surface.blit(tiles_sheet, (0, 0), source_area)
             self.__surfaces.append(tile_surface)
+        self.__sheet = None
 
-        return Error_codes.SUCCES
+        return self.__surfaces
 
     def get(self, tile_id: int) -> pygame.Surface or None:
         """
@@ -210,9 +270,10 @@ class __TilesCollection:
         :param tile_id: identifiant de tuile
         :return: la surface si disponible, None sinon
         """
-        assert self.__surfaces
-        if 0 <= tile_id < len(self.__surfaces):
-            return self.__surfaces[tile_id]
+        assert self.__surfaces or self.__sheet
+        surfaces = self.__get_surfaces()
+        if 0 <= tile_id < len(surfaces):
+            return surfaces[tile_id]
 
         return None
 
@@ -221,9 +282,9 @@ class __TilesCollection:
         Retourne les dimensions d'une image de tuile.
         :return: Dimensions d'une tuile (largeur, hauteur)
         """
-        assert self.__surfaces and len(self.__surfaces) > 0
+        assert self.__surfaces or self.__sheet
 
-        return self.__surfaces[0].get_size()
+        return self.__get_surfaces()[0].get_size()
 
     def pixel_pos_to_tile_pos(self, pixel_position: tuple) -> tuple:
         """
@@ -231,11 +292,12 @@ class __TilesCollection:
         :param pixel_position: Position (coordonnée) en pixels
         :return: Position (coordonnée) de la tuile
         """
-        assert self.__surfaces and len(self.__surfaces) > 0
+        assert self.__surfaces or self.__sheet
 
+        tile = self.__get_surfaces()[0]
         pixel_x, pixel_y = pixel_position
-        tile_x = pixel_x % self.__surfaces[0].get_width()
-        tile_y = pixel_y % self.__surfaces[0].get_height()
+        tile_x = pixel_x % tile.get_width()
+        tile_y = pixel_y % tile.get_height()
         return tile_x, tile_y
 
     def tile_pos_to_pixel_pos(self, tile_position: tuple) -> tuple:
@@ -244,11 +306,12 @@ class __TilesCollection:
         :param tile_position: Position (coordonnée) de la tuile
         :return: Position (coordonnée) en pixels
         """
-        assert self.__surfaces and len(self.__surfaces) > 0
+        assert self.__surfaces or self.__sheet
 
+        tile = self.__get_surfaces()[0]
         tile_x, tile_y = tile_position
-        pixel_x = tile_x * self.__surfaces[0].get_width()
-        pixel_y = tile_y * self.__surfaces[0].get_height()
+        pixel_x = tile_x * tile.get_width()
+        pixel_y = tile_y * tile.get_height()
         return pixel_x, pixel_y
 
     def tile_pos_to_center_pixel_pos(self, tile_position: tuple) -> tuple:
@@ -257,11 +320,12 @@ class __TilesCollection:
         :param tile_position: Position (coordonnée) de la tuile
         :return: Position (coordonnée) du centre de la tuile en pixels
         """
-        assert self.__surfaces and len(self.__surfaces) > 0
+        assert self.__surfaces or self.__sheet
 
+        tile = self.__get_surfaces()[0]
         pixel_x, pixel_y = self.tile_pos_to_pixel_pos(tile_position)
-        center_x = pixel_x + (self.__surfaces[0].get_width() / 2)
-        center_y = pixel_y + (self.__surfaces[0].get_height() / 2)
+        center_x = pixel_x + (tile.get_width() / 2)
+        center_y = pixel_y + (tile.get_height() / 2)
         return center_x, center_y
 
 
@@ -269,6 +333,7 @@ class __AssetsCollection:
     """ Collection d'actifs (assets) utilisée par l'objet global assets_collection (voir plus bas). """
 
     def __init__(self) -> None:
+        self.__sheet = None
         self.__surfaces = None
 
     def init(self) -> Error_codes:
@@ -294,7 +359,18 @@ class __AssetsCollection:
         if assets_sheet.get_width() % assets_sheet.get_height() != 0:
             return Error_codes.SQUARES_ASSETS
 
+        # la découpe est faite à la première utilisation (voir __get_surfaces())
+        self.__sheet = assets_sheet
+
+        return Error_codes.SUCCES
+
+    def __get_surfaces(self) -> list:
+        """ Retourne les surfaces des actifs, en découpant l'image chargée au premier appel. """
+        if self.__surfaces is not None:
+            return self.__surfaces
+
         # découpe la surface d'actifs en surfaces individuelles (une pour chaque actif)
+        assets_sheet = self.__sheet
         height = width = assets_sheet.get_height()
         self.__surfaces = []
         for i in range(assets_sheet.get_width() // width):
@@ -302,8 +378,9 @@ class __AssetsCollection:
             source_area = pygame.Rect(i * width, 0, width, height)
             asset_surface.blit(assets_sheet, (0, 0), source_area)
             self.__surfaces.append(asset_surface)
+        self.__sheet = None
 
-        return Error_codes.SUCCES
+        return self.__surfaces
 
     def get(self, asset_id: int) -> pygame.Surface or None:
         """
@@ -311,9 +388,10 @@ class __AssetsCollection:
         :param asset_id: identifiant d'actif
         :return: la surface si disponible, None sinon
         """
-        assert self.__surfaces
-        if 0 <= asset_id < len(self.__surfaces):
-            return self.__surfaces[asset_id]
+        assert self.__surfaces or self.__sheet
+        surfaces = self.__get_surfaces()
+        if 0 <= asset_id < len(surfaces):
+            return surfaces[asset_id]
 
         return None
 
@@ -321,8 +399,12 @@ class __AssetsCollection:
 class __Arrow:
     """ image utilisée par l'objet global arrow (voir plus bas). """
 
+    # nombre d'orientations précalculées de la fleche (sur 360 degrés)
+    ROTATIONS = 128
+
     def __init__(self) -> None:
-        self.__surfaces = None
+        self.__surface = None
+        self.__rotated_surfaces = None
 
     def init(self) -> Error_codes:
         """
@@ -348,6 +430,10 @@ class __Arrow:
         asset_surface.blit(arrow_sheet, (0, 0),)
         self.__surface = asset_surface
 
+        # atlas des fleches tournées, une surface par orientation (index 0 : fleche non tournée), chaque orientation
+        # étant calculée à sa première utilisation
+        self.__rotated_surfaces = [None] * self.ROTATIONS
+
         return Error_codes.SUCCES
 
     def get(self) -> pygame.Surface:
@@ -358,6 +444,21 @@ class __Arrow:
         assert self.__surface
         return self.__surface
 
+    def get_rotated(self, angle: float) -> pygame.Surface:
+        """
+        Retourne la surface de la fleche tournée de l'angle spécifié, arrondi à l'orientation précalculée la plus
+        proche.
+        :param angle: angle de rotation en degrés (sens anti horaire, comme pygame.transform.rotate())
+        :return: la surface
+        """
+        assert self.__rotated_surfaces
+        index = round(angle * self.ROTATIONS / 360) % self.ROTATIONS
+        rotated_surface = self.__rotated_surfaces[index]
+        if rotated_surface is None:
+            rotated_surface = pygame.transform.rotate(self.__surface, index * 360 / self.ROTATIONS)
+            self.__rotated_surfaces[index] = rotated_surface
+        return rotated_surface
+
 
 class __IncidentsCollection:
     """
@@ -366,6 +467,9 @@ class __IncidentsCollection:
     """
 
     def __init__(self) -> None:
+        self.__sheet = None
+        self.__timer_surfaces = None
+        self.__icons_surfaces = None
         self.__incident_surfaces = None
 
     def init(self) -> Error_codes:
@@ -392,34 +496,51 @@ class __IncidentsCollection:
         if incidents_sheet.get_width() % incidents_sheet.get_height() != 0:
             return Error_codes.SQUARES_INCIDENTS
 
+        # Le découpage est fait à la première utilisation et les surfaces combinées (minuterie + icône) d'une
+        # expertise ne sont construites que lorsqu'un incident de cette expertise est affiché (voir get())
+        self.__sheet = incidents_sheet
+        self.__incident_surfaces = [None] * settings.NB_SKILLS
+
+        return Error_codes.SUCCES
+
+    def __slice(self) -> None:
+        """ Découpe l'image chargée en images de minuterie et en icônes d'incident. """
+        incidents_sheet = self.__sheet
+
         # Découpage de la surface chargée en surfaces individuelles (une pour chaque image de minuterie)
         height = width = incidents_sheet.get_height()
-        timer_surfaces = []
+        self.__timer_surfaces = []
         for i in range(settings.NB_INCIDENT_TIMER_IMAGES):
             timer_surface = pygame.Surface((width, height), pygame.SRCALPHA)
             source_area = pygame.Rect(i * width, 0, width, height)
             timer_surface.blit(incidents_sheet, (0, 0), source_area)
-            timer_surfaces.append(timer_surface)
+            self.__timer_surfaces.append(timer_surface)
 
         # Découpage de la surface chargée en surfaces individuelles (une pour chaque icône d'incident)
-        icons_surfaces = []
+        self.__icons_surfaces = []
         for i in range(settings.NB_INCIDENT_TIMER_IMAGES, settings.NB_INCIDENT_TIMER_IMAGES + settings.NB_SKILLS):
             icon_surface = pygame.Surface((width, height), pygame.SRCALPHA)
             source_area = pygame.Rect(i * width, 0, width, height)
             icon_surface.blit(incidents_sheet, (0, 0), source_area)
-            icons_surfaces.append(icon_surface)
+            self.__icons_surfaces.append(icon_surface)
+
+        self.__sheet = None
+
+    def __get_series(self, expertise_id: int) -> list:
+        """ Retourne les surfaces combinées (minuterie + icône) d'une expertise, en les construisant au besoin. """
+        series = self.__incident_surfaces[expertise_id]
+        if series is None:
+            if self.__timer_surfaces is None:
+                self.__slice()
 
-        # Construction des surfaces combinées (minuterie + icône)
-        self.__incident_surfaces = []
-        for skill_index in range(settings.NB_SKILLS):
             series = []
-            for timer_index in range(len(timer_surfaces)):
-                combined_surface = timer_surfaces[timer_index].copy()
-                combined_surface.blit(icons_surfaces[skill_index], (0, 0))
+            for timer_surface in self.__timer_surfaces:
+                combined_surface = timer_surface.copy()
+                combined_surface.blit(self.__icons_surfaces[expertise_id], (0, 0))
                 series.append(combined_surface)
-            self.__incident_surfaces.append(series)
+            self.__incident_surfaces[expertise_id] = series
 
-        return Error_codes.SUCCES
+        return series
 
     def get(self, timer_id: int, expertise: Expertise) -> pygame.Surface or None:
         """
@@ -430,19 +551,87 @@ class __IncidentsCollection:
         :return: la surface si disponible, None sinon
         """
         assert self.__incident_surfaces
-        expertise_id = int(expertise)
-        if 0 <= timer_id < len(self.__incident_surfaces[expertise_id]):
-            return self.__incident_surfaces[expertise_id][timer_id]
+        series = self.__get_series(int(expertise))
+        if 0 <= timer_id < len(series):
+            return series[timer_id]
 
         return None
 
 
 class __SoundsCollection:
-    """ Collection de sons utilisée par l'objet global sounds_collection (voir plus bas). """
+    """
+    Collection de sons utilisée par l'objet global sounds_collection (voir plus bas).
+    Les sons sont décodés en parallèle par un bassin de fils d'exécution (voir start_loading()), ce qui permet de
+    commencer le décodage pendant les écrans de démarrage.
+    """
+
+    # nom du son -> (fichier, volume (None pour le volume par défaut), catégorie, mode de lecture (les longues boucles
+    # ne restent pas décodées en mémoire), code d'erreur)
+    SOUNDS = {'HELPDESK-PHONE-RING': (settings.PHONE_RING_SOUND_FILENAME, None, Category.LOOP, Playback.DECODED,
+                                      Error_codes.SOUND_PHONE),
+              'HELPDESK-PHONE-HANGUP': (settings.PHONE_HANGUP_SOUND_FILENAME, None, Category.EFFECT, Playback.DECODED,
+                                        Error_codes.SOUND_HANGUP),
+              'INCIDENT-SOLVE': (settings.SOLVE_SOUND_FILENAME, None, Category.EFFECT, Playback.DECODED,
+                                 Error_codes.SOUND_SOLVE),
+              'INCIDENT-FAIL': (settings.FAILURE_SOUND_FILENAME, None, Category.EFFECT, Playback.DECODED,
+                                Error_codes.SOUND_FAIL),
+              'OFFICE-AMBIENCE': (settings.OFFICE_AMBIENCE_SOUND, 0.10, Category.LOOP, Playback.CHUNKED,
+                                  Error_codes.SOUND_AMBIENCE),
+              'BACKGROUND-MUSIC': (settings.BACKGROUND_MUSIC, 0.25, None, Playback.MUSIC, Error_codes.SOUND_MUSIC),
+              'SQUEAKY_TOY_SOUND': (settings.SQUEAKY_TILE_SOUND_FILENAME, 0.3, Category.EFFECT, Playback.DECODED,
+                                    Error_codes.SOUND_SQUEAK),
+              'PERCENT_25_ALERT': (settings.PERCENT_25_ALERT_FILENAME, None, Category.ALERT, Playback.DECODED,
+                                   Error_codes.SOUND_25_LEFT),
+              'PERCENT_10_ALERT': (settings.PERCENT_10_ALERT_FILENAME, None, Category.ALERT, Playback.DECODED,
+                                   Error_codes.SOUND_10_LEFT)}
+
+    # nombre maximal de fils d'exécution pour le décodage
+    MAX_WORKERS = 4
 
     def __init__(self) -> None:
-        self.__surfaces = None
         self.__sounds = None
+        # nom du son -> décodage en cours (concurrent.futures.Future)
+        self.__pending = None
+
+    def start_loading(self) -> None:
+        """
+        Lance le décodage de tous les sons en arrière-plan, sans attendre. pygame.mixer doit être initialisé.
+        :return: aucun
+        """
+        if self.__pending is not None:
+            return
+
+        executor = ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, os.cpu_count() or 1),
+                                      thread_name_prefix='sounds')
+        self.__pending = {}
+        for name, (filename, volume, category, playback, _) in self.SOUNDS.items():
+            if playback == Playback.DECODED:
+                self.__pending[name] = executor.submit(self.__load, filename, volume, category)
+            elif playback == Playback.CHUNKED:
+                self.__pending[name] = executor.submit(self.__load_chunked, filename, volume, category)
+        # les fils d'exécution se terminent d'eux-mêmes une fois tous les sons décodés
+        executor.shutdown(wait=False)
+
+    @staticmethod
+    def __load(filename: str, volume: float or None, category: Category) -> ManagedSound:
+        sound = pygame.mixer.Sound(filename)
+        if volume is not None:
+            sound.set_volume(volume)
+        return ManagedSound(sound, category)
+
+    def __load_chunked(self, filename: str, volume: float or None, category: Category) -> str or ManagedSound:
+        """
+        Décode un son lu par morceaux dans le cache (voir audio.decode_to_cache()). Si le cache ne peut pas être écrit,
+        le son est plutôt décodé en mémoire : le jeu démarre quand même.
+        :param filename: nom du fichier du son
+        :param volume: volume (None pour le volume par défaut)
+        :param category: catégorie du son
+        :return: le nom du fichier d'échantillons bruts, ou le son décodé si le cache ne peut pas être écrit
+        """
+        cache_filename = audio.decode_to_cache(filename)
+        if cache_filename:
+            return cache_filename
+        return self.__load(filename, volume, category)
 
     def init(self) -> Error_codes:
         """
@@ -450,106 +639,113 @@ class __SoundsCollection:
         La méthode init() permet d'éviter de ralentir l'importation du module avec des entrées/sorties. Elle permet
         aussi de diminuer l'impact d'importations multiples et de gérer les erreurs à un seul endroit, une fois les
         importations terminées.
+        Attend la fin du décodage des sons (lancé ici s'il ne l'a pas déjà été par start_loading()). Les sons lus par
+        pygame.mixer.music ne sont pas décodés : seule la présence de leur fichier est vérifiée. Les sons lus par
+        morceaux sont décodés dans le cache, au premier lancement seulement (voir audio.decode_to_cache()), ou en
+        mémoire si le cache ne peut pas être écrit.
+        audio.mixer doit être initialisé.
         :return: le code de succes si l'initialisation s'est bien passée, le code d'erreur sinon
         """
-        self.__sounds = {}
-        try:
-            sound = pygame.mixer.Sound(settings.PHONE_RING_SOUND_FILENAME)
-        except:
-            return Error_codes.SOUND_PHONE
-
-        if not sound:
-            return Error_codes.SOUND_PHONE
-        self.__sounds['HELPDESK-PHONE-RING'] = sound
-
-        try:
-            sound = pygame.mixer.Sound(settings.PHONE_HANGUP_SOUND_FILENAME)
-        except:
-            return Error_codes.SOUND_HANGUP
-
-        if not sound:
-            return Error_codes.SOUND_HANGUP
-        self.__sounds['HELPDESK-PHONE-HANGUP'] = sound
-
-        try:
-            sound = pygame.mixer.Sound(settings.SOLVE_SOUND_FILENAME)
-        except:
-            return Error_codes.SOUND_SOLVE
-
-        if not sound:
-            return Error_codes.SOUND_SOLVE
-        self.__sounds['INCIDENT-SOLVE'] = sound
+        self.start_loading()
 
-        try:
-            sound = pygame.mixer.Sound(settings.FAILURE_SOUND_FILENAME)
-        except:
-            return Error_codes.SOUND_FAIL
-
-        if not sound:
-            return Error_codes.SOUND_FAIL
-        self.__sounds['INCIDENT-FAIL'] = sound
-
-        try:
-            sound = pygame.mixer.Sound(settings.OFFICE_AMBIENCE_SOUND)
-        except:
-            return Error_codes.SOUND_AMBIENCE
-
-        if not sound:
-            return Error_codes.SOUND_AMBIENCE
-        sound.set_volume(0.10)
-        self.__sounds['OFFICE-AMBIENCE'] = sound
+        self.__sounds = {}
+        for name, (filename, volume, category, playback, error_code) in self.SOUNDS.items():
+            if playback == Playback.MUSIC:
+                if not os.path.isfile(filename):
+                    return error_code
+                self.__sounds[name] = StreamedSound(filename, 1.0 if volume is None else volume)
+
+        for name, pending in self.__pending.items():
+            _, volume, category, playback, error_code = self.SOUNDS[name]
+            try:
+                sound = pending.result()
+            except:
+                return error_code
+
+            if not sound:
+                return error_code
+            if playback == Playback.CHUNKED and isinstance(sound, str):
+                # le décodage a produit le fichier d'échantillons bruts du son
+                sound = ChunkedSound(sound, 1.0 if volume is None else volume, category)
+            self.__sounds[name] = sound
 
-        try:
-            sound = pygame.mixer.Sound(settings.BACKGROUND_MUSIC)
-        except:
-            return Error_codes.SOUND_MUSIC
+        # Renvoi des codes d'erreur
+        return Error_codes.SUCCES
 
-        if not sound:
-            return Error_codes.SOUND_MUSIC
-        sound.set_volume(0.25)
-        self.__sounds['BACKGROUND-MUSIC'] = sound
+    def get(self, name: str) -> ManagedSound or StreamedSound or ChunkedSound or None:
+        """
+        Retourne le son correspondant au nom spécifié (name).
+        :param name: nom du son
+        :return: le son si disponible, None sinon
+        """
+        assert self.__sounds
+        return self.__sounds.get(name, None)
 
-        try:
-            sound = pygame.mixer.Sound(settings.SQUEAKY_TILE_SOUND_FILENAME)
-        except:
-            return Error_codes.SOUND_SQUEAK
 
-        if not sound:
-            return Error_codes.SOUND_SQUEAK
-        sound.set_volume(0.3)
-        self.__sounds['SQUEAKY_TOY_SOUND'] = sound
+class __Fonts:
+    """
+    Polices et cache de textes rendus utilisés par l'objet global fonts (voir plus bas).
+    Les polices sont chargées une seule fois; les surfaces de texte sont conservées dans un cache LRU (les moins
+    récemment utilisées sont retirées en premier), de sorte qu'un texte qui ne change pas n'est rendu qu'une fois.
+    """
 
-        # Chargement son alarme 25%
-        try:
-            sound = pygame.mixer.Sound(settings.PERCENT_25_ALERT_FILENAME)
-        except:
-            return Error_codes.SOUND_25_LEFT
+    # nombre maximal de surfaces de texte conservées dans le cache
+    TEXT_CACHE_SIZE = 256
 
-        if not sound:
-            return Error_codes.SOUND_25_LEFT
-        self.__sounds['PERCENT_25_ALERT'] = sound
+    def __init__(self) -> None:
+        self.__fonts = None
+        self.__texts = OrderedDict()
 
-        # Chargement son alarme 10%
+    def init(self) -> Error_codes:
+        """
+        Initialise l'instance unique de resources.fonts.
+        La méthode init() permet d'éviter de ralentir l'importation du module avec des entrées/sorties. Elle permet
+        aussi de diminuer l'impact d'importations multiples et de gérer les erreurs à un seul endroit, une fois les
+        importations terminées.
+        :return: le code de succes si l'initialisation s'est bien passée, le code d'erreur sinon
+        """
+        default_font_name = pygame.font.get_default_font()
         try:
-            sound = pygame.mixer.Sound(settings.PERCENT_10_ALERT_FILENAME)
+            self.__fonts = {'HUD': pygame.font.Font(default_font_name, 20),
+                            'HUD-SMALL': pygame.font.Font(default_font_name, 15),
+                            'TITLE': pygame.font.Font(default_font_name, 120),
+                            'LABEL': pygame.font.SysFont(None, 24)}
         except:
-            return Error_codes.SOUND_10_LEFT
+            return Error_codes.FONTS
 
-        if not sound:
-            return Error_codes.SOUND_10_LEFT
-        self.__sounds['PERCENT_10_ALERT'] = sound
-
-        # Renvoi des codes d'erreur
         return Error_codes.SUCCES
 
-    def get(self, name: str) -> pygame.mixer.Sound or None:
+    def get(self, name: str) -> pygame.font.Font or None:
         """
-        Retourne le son correspondant au nom spécifié (name).
-        :param name: nom du son
-        :return: le son si disponible, None sinon
+        Retourne la police correspondant au nom spécifié (name).
+        :param name: nom de la police
+        :return: la police si disponible, None sinon
         """
-        assert self.__sounds
-        return self.__sounds.get(name, None)
+        assert self.__fonts
+        return self.__fonts.get(name, None)
+
+    def render(self, name: str, text: str, color: tuple) -> pygame.Surface:
+        """
+        Retourne la surface du texte spécifié, rendu avec la police (name) et la couleur (color) demandées.
+        La surface retournée est partagée : elle ne doit pas être modifiée, sauf pour son alpha qui doit alors être
+        fixé à chaque utilisation.
+        :param name: nom de la police
+        :param text: texte à afficher
+        :param color: couleur (r, g, b) du texte
+        :return: la surface qui contient le texte
+        """
+        key = (name, text, color)
+        surface = self.__texts.get(key)
+        if surface is not None:
+            self.__texts.move_to_end(key)
+            return surface
+
+        surface = self.get(name).render(text, True, color)
+        self.__texts[key] = surface
+        if len(self.__texts) > self.TEXT_CACHE_SIZE:
+            self.__texts.popitem(last=False)
+
+        return surface
 
 
 # collection de personnages (singleton du GoF implémenté avec un Global Object Pattern de python)
@@ -577,9 +773,23 @@ sounds_collection = None
 # Image de fleche
 arrow = None
 
+# polices et cache de textes rendus (singleton du GoF implémenté avec un Global Object Pattern de python)
+fonts = None
+
+
+def start_loading() -> None:
+    """
+    Lance le décodage des sons en arrière-plan (par exemple pendant les écrans de démarrage). Facultatif : init()
+    le lance si ce n'est pas déjà fait, puis attend qu'il se termine. pygame.mixer doit être initialisé.
+    """
+    global sounds_collection
+    if not sounds_collection:
+        sounds_collection = __SoundsCollection()
+    sounds_collection.start_loading()
+
 
 def init() -> Error_codes:
-    """ Initialise l'ensemble des ressources. """
+    """ Initialise l'ensemble des ressources. Les images sont découpées à leur première utilisation. """
 
     global characters_collection
     if not characters_collection:
@@ -623,12 +833,13 @@ def init() -> Error_codes:
         if return_code != Error_codes.SUCCES:
             return return_code
 
+    # le décodage des sons a pu être lancé plus tôt (voir start_loading())
     global sounds_collection
     if not sounds_collection:
         sounds_collection = __SoundsCollection()
-        return_code = sounds_collection.init()
-        if return_code != Error_codes.SUCCES:
-            return return_code
+    return_code = sounds_collection.init()
+    if return_code != Error_codes.SUCCES:
+        return return_code
 
     global arrow
     if not arrow:
@@ -637,4 +848,11 @@ def init() -> Error_codes:
         if return_code != Error_codes.SUCCES:
             return return_code
 
+    global fonts
+    if not fonts:
+        fonts = __Fonts()
+        return_code = fonts.init()
+        if return_code != Error_codes.SUCCES:
+            return return_code
+
     return Error_codes.SUCCES
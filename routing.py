@@ -0,0 +1,212 @@
+# Routage des incidents vers les actifs : index de charge des actifs (tas et arbre de Fenwick) et politiques de choix
+# de l'actif (le moins chargé, le plus près d'un expert, au hasard pondéré par la charge)
+import heapq
+import random
+import timers
+
+from enum import IntEnum
+
+from expertise import Expertise
+
+# distance maximale (en pixels) entre un expert et les actifs examinés par la politique NEAREST_EXPERT
+NEAREST_EXPERT_RADIUS = 256
+
+# poids d'un actif pour la politique WEIGHTED_RANDOM selon sa charge : 2 ** (MAX_WEIGHT_SHIFT - charge), au moins 1
+MAX_WEIGHT_SHIFT = 3
+
+
+class RoutingPolicy(IntEnum):
+    """ Politique de choix de l'actif qui reçoit un incident. """
+    LEAST_LOADED = 0  # l'actif le moins chargé (égalités départagées au hasard)
+    NEAREST_EXPERT = 1  # l'actif le moins chargé près d'un personnage expert de l'incident
+    WEIGHTED_RANDOM = 2  # au hasard, les actifs peu chargés étant plus probables
+
+
+class FenwickTree:
+    """
+    Arbre de Fenwick (arbre indexé binaire) : sommes préfixes et recherche par somme cumulée en O(log n).
+    """
+
+    def __init__(self, size: int) -> None:
+        """
+        Initialise un arbre de Fenwick (objet FenwickTree) dont toutes les valeurs sont nulles.
+        :param size: nombre de valeurs
+        """
+        self.__size = size
+        # l'indice 0 n'est pas utilisé (les indices de l'arbre commencent à 1)
+        self.__tree = [0] * (size + 1)
+        self.__total = 0
+
+    def add(self, index: int, delta: int) -> None:
+        """
+        Ajoute une quantité à une valeur.
+        :param index: indice de la valeur (à partir de 0)
+        :param delta: quantité à ajouter
+        :return: aucun
+        """
+        self.__total += delta
+        index += 1
+        while index <= self.__size:
+            self.__tree[index] += delta
+            index += index & -index
+
+    def prefix_sum(self, index: int) -> int:
+        """
+        Calcule la somme des valeurs jusqu'à un indice (exclu).
+        :param index: indice (à partir de 0)
+        :return: la somme des valeurs d'indice inférieur
+        """
+        total = 0
+        while index > 0:
+            total += self.__tree[index]
+            index -= index & -index
+        return total
+
+    def find(self, value: float) -> int:
+        """
+        Trouve l'indice dont l'intervalle de sommes cumulées contient une valeur donnée, c'est-à-dire le plus petit
+        indice i tel que la somme des valeurs jusqu'à i (inclus) dépasse value.
+        :param value: valeur recherchée (de 0 inclus jusqu'au total exclu)
+        :return: l'indice (à partir de 0)
+        """
+        index = 0
+        step = 1 << self.__size.bit_length()
+        while step:
+            following = index + step
+            if following <= self.__size and self.__tree[following] <= value:
+                index = following
+                value -= self.__tree[following]
+            step >>= 1
+        return min(index, self.__size - 1)
+
+    @property
+    def total(self) -> int:
+        return self.__total
+
+
+class Router:
+    """
+    Routeur d'incidents.
+    La charge de chaque actif (nombre d'incidents en attente ou actifs, puis échéance de l'incident actif) est tenue à
+    jour à chaque changement (voir Asset.set_load_changed_action()), dans un tas pour la politique LEAST_LOADED et
+    dans un arbre de Fenwick pour la politique WEIGHTED_RANDOM : le choix d'un actif se fait en O(log n).
+    """
+
+    # taille relative du tas (par rapport au nombre d'actifs) au-delà de laquelle les entrées périmées sont purgées
+    __HEAP_COMPACTION_RATIO = 4
+
+    def __init__(self, assets: list, policy: RoutingPolicy, generator: random.Random, office=None,
+                 characters: list = None) -> None:
+        """
+        Initialise un routeur (objet Router) et s'abonne aux changements de charge des actifs.
+        :param assets: actifs qui peuvent recevoir des incidents
+        :param policy: politique de choix de l'actif
+        :param generator: générateur pseudo-aléatoire (départage des égalités et politique WEIGHTED_RANDOM), propre
+                          au routage pour ne pas décaler les tirages des incidents (voir incidents.spawner.routing_random)
+        :param office: bureau (index spatial des actifs, nécessaire à la politique NEAREST_EXPERT)
+        :param characters: personnages (nécessaires à la politique NEAREST_EXPERT)
+        """
+        self.__assets = assets
+        self.__policy = policy
+        self.__random = generator
+        self.__office = office
+        self.__characters = characters or []
+
+        self.__indices = {asset: index for index, asset in enumerate(assets)}
+        self.__loads = [0] * len(assets)
+        self.__weights = [0] * len(assets)
+        self.__weights_tree = FenwickTree(len(assets))
+
+        # tas d'entrées [charge, échéance, départage, indice de l'actif] - l'indice vaut None si l'entrée est périmée
+        self.__heap = []
+        self.__entries = [None] * len(assets)
+
+        for index, asset in enumerate(assets):
+            asset.set_load_changed_action(lambda changed_index=index: self.update(changed_index))
+            self.update(index)
+
+    def route(self, incident) -> object:
+        """
+        Choisit l'actif qui recevra un incident, selon la politique du routeur.
+        :param incident: l'incident à confier
+        :return: l'actif choisi
+        """
+        if self.__policy == RoutingPolicy.NEAREST_EXPERT:
+            asset = self.__nearest_expert(incident.expertise)
+            if asset:
+                return asset
+        elif self.__policy == RoutingPolicy.WEIGHTED_RANDOM:
+            return self.__assets[self.__weights_tree.find(self.__random.random() * self.__weights_tree.total)]
+
+        return self.__least_loaded()
+
+    def update(self, index: int) -> None:
+        """
+        Met à jour la charge d'un actif (action appelée par l'actif lorsque sa charge change).
+        :param index: indice de l'actif
+        :return: aucun
+        """
+        asset = self.__assets[index]
+        load = asset.load
+        self.__loads[index] = load
+
+        # l'échéance de l'incident actif ne change pas avec le temps (contrairement au temps restant) : elle peut
+        # servir de clé dans le tas
+        active_incident = asset.active_incident
+        deadline = timers.scheduler.now() + active_incident.remaining_time if active_incident else 0
+
+        if self.__entries[index]:
+            self.__entries[index][3] = None
+        entry = [load, deadline, self.__random.random(), index]
+        self.__entries[index] = entry
+        heapq.heappush(self.__heap, entry)
+        if len(self.__heap) > self.__HEAP_COMPACTION_RATIO * len(self.__assets):
+            self.__heap = [entry for entry in self.__heap if entry[3] is not None]
+            heapq.heapify(self.__heap)
+
+        weight = 1 << (MAX_WEIGHT_SHIFT - min(load, MAX_WEIGHT_SHIFT))
+        self.__weights_tree.add(index, weight - self.__weights[index])
+        self.__weights[index] = weight
+
+    def __least_loaded(self) -> object:
+        """
+        Retourne l'actif le moins chargé (le dessus du tas, après retrait des entrées périmées).
+        :return: l'actif
+        """
+        while self.__heap[0][3] is None:
+            heapq.heappop(self.__heap)
+        return self.__assets[self.__heap[0][3]]
+
+    def __nearest_expert(self, expertise: Expertise) -> object or None:
+        """
+        Retourne l'actif le moins chargé parmi ceux situés près d'un personnage expert de l'incident (le plus près
+        en cas d'égalité). Seuls les actifs voisins des experts sont examinés (index spatial du bureau).
+        :param expertise: expertise sollicitée par l'incident
+        :return: l'actif, None si aucun expert n'a d'actif à proximité
+        """
+        if not self.__office:
+            return None
+
+        found = None
+        found_key = None
+        for character in self.__characters:
+            if character.expertise not in (expertise, Expertise.SUPERHERO):
+                continue
+
+            x, y = character.feet_position
+            for asset in self.__office.assets_within(character.feet_position, NEAREST_EXPERT_RADIUS):
+                index = self.__indices.get(asset)
+                if index is None:
+                    continue
+
+                center_x, center_y = asset.center_position
+                key = self.__loads[index], (center_x - x) ** 2 + (center_y - y) ** 2
+                if found_key is None or key < found_key:
+                    found = asset
+                    found_key = key
+
+        return found
+
+    @property
+    def policy(self) -> RoutingPolicy:
+        return self.__policy
@@ -22,6 +22,7 @@ INCIDENTS_FILENAME = config.get("Images", "INCIDENTS_FILENAME")
 ARROW_FILENAME = config.get("Images", "ARROW_FILENAME")
 
 OFFICE_FILENAME = config.get("Assets", "OFFICE_FILENAME")
+BUILD_MANIFEST_FILENAME = config.get("Assets", "BUILD_MANIFEST_FILENAME")
 
 BACKGROUND_MUSIC = config.get("Sounds", "BACKGROUND_MUSIC")
 OFFICE_AMBIENCE_SOUND = config.get("Sounds", "OFFICE_AMBIENCE_SOUND")
@@ -46,7 +47,11 @@ NB_CHARACTERS = int(config.get("Settings", "NB_CHARACTERS"))
 NB_SKILLS = int(config.get("Settings", "NB_SKILLS"))
 
 TIME_PER_LEVEL = int(config.get("Settings", "TIME_PER_LEVEL"))  # en secondes
+COUNTDOWN_WARNING_TIME = int(config.get(
+    "Settings", "COUNTDOWN_WARNING_TIME"))  # temps restant (en secondes) à partir duquel le minuteur avertit
 MAX_MISTAKES = int(config.get("Settings", "MAX_MISTAKES"))
+# politique de routage des incidents : least_loaded, nearest_expert ou weighted_random (voir routing.RoutingPolicy)
+ROUTING_POLICY = config.get("Settings", "ROUTING_POLICY")
 
 DEFAULT_TIME_TO_SOLVE_MIN = int(config.get(
     "Settings", "DEFAULT_TIME_TO_SOLVE_MIN"))
@@ -64,6 +69,11 @@ TIMER_PERCENTAGE_SLICE_SIZE = int(config.get(
 
 INACTIVITY_THRESHOLD = int(config.get("Settings", "INACTIVITY_THRESHOLD"))
 
+TARGET_FPS = int(config.get("Settings", "TARGET_FPS"))  # 0 pour ne pas limiter
+VSYNC = config.getboolean("Settings", "VSYNC")
+# fichier de trace (format de Chrome) exporté par le profileur de trames
+PROFILER_TRACE_FILENAME = config.get("Settings", "PROFILER_TRACE_FILENAME")
+
 DEFAULT_MIN_TIME_BETWEEN_INDICENTS = int(config.get(
     "Settings", "DEFAULT_MIN_TIME_BETWEEN_INDICENTS"))
 DEFAULT_MAX_TIME_BETWEEN_INDICENTS = int(config.get(
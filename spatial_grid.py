@@ -0,0 +1,175 @@
+class SpatialGrid:
+    """
+    Index spatial à grille uniforme.
+    Chaque élément est rangé dans la cellule qui contient sa position (en pixels). Les recherches par distance ou
+    par rectangle n'examinent que les cellules concernées plutôt que tous les éléments.
+    """
+
+    def __init__(self, cell_size: float) -> None:
+        """
+        Initialise une grille (objet SpatialGrid).
+        :param cell_size: dimension (largeur et hauteur) d'une cellule, en pixels
+        """
+        self.__cell_size = cell_size
+
+        # cellule (x, y) -> {élément: position}
+        self.__cells = {}
+        # élément -> (position, cellule, ordre d'insertion)
+        self.__items = {}
+        self.__insertions = 0
+
+    def __cell_of(self, position: tuple) -> tuple:
+        """
+        Retourne la cellule qui contient la position spécifiée.
+        :param position: position (x, y) en pixels
+        :return: coordonnée (x, y) de la cellule
+        """
+        return int(position[0] // self.__cell_size), int(position[1] // self.__cell_size)
+
+    def insert(self, item, position: tuple) -> None:
+        """
+        Ajoute un élément à la grille.
+        :param item: l'élément à ajouter
+        :param position: position (x, y) de l'élément, en pixels
+        :return: aucun
+        """
+        cell = self.__cell_of(position)
+        self.__cells.setdefault(cell, {})[item] = position
+        self.__items[item] = (position, cell, self.__insertions)
+        self.__insertions += 1
+
+    def move(self, item, position: tuple) -> None:
+        """
+        Déplace un élément de la grille.
+        :param item: l'élément à déplacer
+        :param position: nouvelle position (x, y) de l'élément, en pixels
+        :return: aucun
+        """
+        _, previous_cell, order = self.__items[item]
+        cell = self.__cell_of(position)
+
+        if cell != previous_cell:
+            self.__remove_from_cell(item, previous_cell)
+            self.__cells.setdefault(cell, {})
+
+        self.__cells[cell][item] = position
+        self.__items[item] = (position, cell, order)
+
+    def remove(self, item) -> None:
+        """
+        Retire un élément de la grille.
+        :param item: l'élément à retirer
+        :return: aucun
+        """
+        _, cell, _ = self.__items.pop(item)
+        self.__remove_from_cell(item, cell)
+
+    def __remove_from_cell(self, item, cell: tuple) -> None:
+        """ Retire un élément d'une cellule (et la cellule elle-même si elle devient vide). """
+        items = self.__cells[cell]
+        del items[item]
+        if not items:
+            del self.__cells[cell]
+
+    def find_closest(self, point: tuple, max_distance: float):
+        """
+        Trouve l'élément le plus près du point spécifié, à une distance maximale donnée.
+        En cas d'égalité, l'élément ajouté en premier est retourné.
+        :param point: position (x, y) en pixels
+        :param max_distance: distance maximale (en pixels)
+        :return: l'élément si trouvé, None sinon
+        """
+        found = None
+        found_key = None
+
+        for item, squared_distance in self.__query_radius(point, max_distance):
+            key = squared_distance, self.__items[item][2]
+            if found_key is None or key < found_key:
+                found = item
+                found_key = key
+
+        return found
+
+    def query_radius(self, point: tuple, radius: float) -> list:
+        """
+        Retourne les éléments situés à une distance maximale du point spécifié.
+        :param point: position (x, y) en pixels
+        :param radius: distance maximale (en pixels)
+        :return: liste des éléments trouvés
+        """
+        return [item for item, _ in self.__query_radius(point, radius)]
+
+    def __query_radius(self, point: tuple, radius: float) -> list:
+        """ Retourne les paires (élément, distance au carré) situées à une distance maximale du point. """
+        x, y = point
+        squared_radius = radius * radius
+        first_x, first_y = self.__cell_of((x - radius, y - radius))
+        last_x, last_y = self.__cell_of((x + radius, y + radius))
+
+        found = []
+        for cell_x in range(first_x, last_x + 1):
+            for cell_y in range(first_y, last_y + 1):
+                items = self.__cells.get((cell_x, cell_y))
+                if not items:
+                    continue
+                for item, (item_x, item_y) in items.items():
+                    squared_distance = (item_x - x) ** 2 + (item_y - y) ** 2
+                    if squared_distance <= squared_radius:
+                        found.append((item, squared_distance))
+
+        return found
+
+    def query_inside(self, bounds: tuple) -> list:
+        """
+        Retourne les éléments situés dans le rectangle spécifié (bornes incluses).
+        :param bounds: rectangle (gauche, haut, droite, bas) en pixels
+        :return: liste des éléments trouvés
+        """
+        return self.__query_bounds(bounds, True)
+
+    def query_outside(self, bounds: tuple) -> list:
+        """
+        Retourne les éléments situés hors du rectangle spécifié (bornes incluses dans le rectangle).
+        :param bounds: rectangle (gauche, haut, droite, bas) en pixels
+        :return: liste des éléments trouvés
+        """
+        return self.__query_bounds(bounds, False)
+
+    def __query_bounds(self, bounds: tuple, inside: bool) -> list:
+        """
+        Retourne les éléments situés dans (inside à True) ou hors (inside à False) du rectangle spécifié.
+        Les cellules entièrement d'un côté ou de l'autre du rectangle sont traitées d'un bloc; seuls les éléments
+        des cellules chevauchant la bordure du rectangle sont vérifiés un à un.
+        """
+        left, top, right, bottom = bounds
+        size = self.__cell_size
+
+        found = []
+        for (cell_x, cell_y), items in self.__cells.items():
+            cell_left = cell_x * size
+            cell_top = cell_y * size
+            cell_right = cell_left + size
+            cell_bottom = cell_top + size
+
+            if cell_left >= left and cell_right <= right and cell_top >= top and cell_bottom <= bottom:
+                # cellule entièrement dans le rectangle
+                if inside:
+                    found.extend(items)
+            elif cell_right < left or cell_left > right or cell_bottom < top or cell_top > bottom:
+                # cellule entièrement hors du rectangle
+                if not inside:
+                    found.extend(items)
+            else:
+                # cellule sur la bordure du rectangle
+                for item, (x, y) in items.items():
+                    if (left <= x <= right and top <= y <= bottom) == inside:
+                        found.append(item)
+
+        return found
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def __contains__(self, item) -> bool:
+        return item in self.__items
+
@@ -0,0 +1,310 @@
+import heapq
+import itertools
+import time
+
+from typing import Callable
+
+
+class Timer:
+    """
+    Minuterie (compte à rebours) pouvant être mise en pause.
+    Le temps restant est calculé à la demande à partir de l'horloge monotone de l'ordonnanceur : aucune tâche ne
+    décompte le temps. Les alarmes et l'expiration sont déclenchées par l'ordonnanceur (voir scheduler plus bas).
+    """
+
+    def __init__(self, duration: float, expiring_action: Callable = None) -> None:
+        """
+        Initialise une minuterie (objet Timer). La minuterie ne décompte pas tant que start() n'est pas appelée.
+        :param duration: durée de la minuterie (en secondes)
+        :param expiring_action: action à faire lorsque la minuterie expire (optionnelle)
+        """
+        self.__duration = duration
+        self.__expiring_action = expiring_action
+
+        # alarmes [(temps restant, action)] triées du plus grand au plus petit temps restant
+        self.__alarms = []
+
+        self.__reset_state()
+
+    def __reset_state(self) -> None:
+        """ Remet la minuterie dans son état initial (ni démarrée, ni en pause, ni expirée). """
+        # temps restant au moment du dernier démarrage et instant de ce démarrage (None si la minuterie ne décompte pas)
+        self.__remaining_time = self.__duration
+        self.__resumed_at = None
+
+        self.__next_alarm = 0
+        self.__handle = None
+
+        self.__is_started = False
+        self.__is_paused = False
+        self.__is_stopped = False
+        self.__is_expired = False
+
+    def add_alarm(self, remaining_time: float, action: Callable) -> None:
+        """
+        Ajoute une alarme déclenchée une seule fois lorsque le temps restant atteint la valeur spécifiée.
+        :param remaining_time: temps restant (en secondes) auquel déclencher l'action
+        :param action: action à faire
+        :return: aucun
+        """
+        self.__alarms.append((remaining_time, action))
+        self.__alarms.sort(key=lambda alarm: alarm[0], reverse=True)
+
+    def clear_alarms(self) -> None:
+        """
+        Retire toutes les alarmes (par exemple avant de réutiliser la minuterie avec une autre durée).
+        La minuterie ne doit pas être en train de décompter.
+        :return: aucun
+        """
+        self.__alarms.clear()
+        self.__next_alarm = 0
+
+    def start(self) -> None:
+        """ Démarre le décompte de la minuterie. """
+        if self.__is_started or self.__is_stopped:
+            return
+
+        self.__is_started = True
+        if not self.__is_paused:
+            self.__resume()
+
+    def stop(self) -> None:
+        """ Arrête définitivement la minuterie (le temps restant est figé et aucune action ne sera déclenchée). """
+        if self.__is_stopped:
+            return
+
+        self.__suspend()
+        self.__is_stopped = True
+
+    def pause(self) -> None:
+        """ Pause la minuterie. """
+        if self.__is_paused:
+            return
+
+        self.__is_paused = True
+        self.__suspend()
+
+    def unpause(self) -> None:
+        """ Relance la minuterie. """
+        if not self.__is_paused:
+            return
+
+        self.__is_paused = False
+        if self.__is_started and not self.__is_stopped:
+            self.__resume()
+
+    def reset(self, duration: float) -> None:
+        """
+        Réinitialise la minuterie avec une nouvelle durée. La minuterie doit être redémarrée avec start().
+        Les alarmes sont conservées.
+        :param duration: nouvelle durée (en secondes)
+        :return: aucun
+        """
+        self.__suspend()
+        self.__duration = duration
+        self.__reset_state()
+
+    def get_remaining_time_percentage(self) -> float:
+        """
+        Récupère le temps qui reste (en pourcentage).
+        :return: pourcentage du temps restant (de 0.0 à 100.0)
+        """
+        return self.remaining_time / self.__duration * 100
+
+    def has_expired(self) -> bool:
+        """
+        Vérifie si la minuterie est expirée.
+        :return: True si la minuterie est expirée, False sinon
+        """
+        return self.remaining_time == 0
+
+    def __resume(self) -> None:
+        """ (Re)démarre le décompte à partir du temps restant. """
+        if self.__is_expired:
+            return
+
+        self.__resumed_at = scheduler.now()
+        self.__schedule_next_event()
+
+    def __suspend(self) -> None:
+        """ Interrompt le décompte en mémorisant le temps restant. """
+        if self.__handle:
+            scheduler.cancel(self.__handle)
+            self.__handle = None
+
+        if self.__resumed_at is not None:
+            self.__remaining_time = self.remaining_time
+            self.__resumed_at = None
+
+    def __schedule_next_event(self) -> None:
+        """ Enregistre auprès de l'ordonnanceur la prochaine alarme (ou l'expiration) de la minuterie. """
+        if self.__next_alarm < len(self.__alarms):
+            threshold = max(self.__alarms[self.__next_alarm][0], 0)
+        else:
+            threshold = 0
+
+        deadline = self.__resumed_at + (self.__remaining_time - threshold)
+        self.__handle = scheduler.call_at(deadline, self.__on_deadline)
+
+    def __on_deadline(self) -> None:
+        """ Action appelée par l'ordonnanceur lorsque la prochaine échéance de la minuterie est atteinte. """
+        self.__handle = None
+
+        # l'échéance visée est atteinte, même si l'arrondi de l'horloge laisse un temps restant infinitésimal
+        if self.__next_alarm >= len(self.__alarms):
+            self.__expire()
+            return
+
+        self.__alarms[self.__next_alarm][1]()
+        self.__next_alarm += 1
+
+        # déclenchement des autres alarmes dépassées (si l'ordonnanceur a été appelé en retard)
+        remaining_time = self.remaining_time
+        while self.__next_alarm < len(self.__alarms) and self.__alarms[self.__next_alarm][0] >= remaining_time:
+            self.__alarms[self.__next_alarm][1]()
+            self.__next_alarm += 1
+
+        # une alarme peut avoir mis la minuterie en pause ou l'avoir arrêtée
+        if self.__resumed_at is not None and not self.__handle:
+            self.__schedule_next_event()
+
+    def __expire(self) -> None:
+        """ Fait expirer la minuterie. """
+        self.__remaining_time = 0
+        self.__resumed_at = None
+        self.__is_expired = True
+
+        if self.__expiring_action:
+            self.__expiring_action()
+
+    @property
+    def duration(self) -> float:
+        return self.__duration
+
+    @property
+    def remaining_time(self) -> float:
+        if self.__resumed_at is None:
+            return self.__remaining_time
+
+        remaining_time = self.__remaining_time - \
+            (scheduler.now() - self.__resumed_at)
+        return remaining_time if remaining_time > 0 else 0
+
+    @property
+    def is_started(self) -> bool:
+        return self.__is_started
+
+    @property
+    def is_paused(self) -> bool:
+        return self.__is_paused
+
+
+class __Scheduler:
+    """
+    Ordonnanceur de la simulation : une seule horloge monotone et un tas d'échéances, vidé par la boucle de jeu.
+    Remplace les tâches (threads) qui décomptaient le temps chacune de leur côté.
+    """
+
+    def __init__(self, clock: Callable = time.monotonic) -> None:
+        """
+        Initialise l'ordonnanceur.
+        :param clock: horloge monotone (fonction retournant un temps en secondes)
+        """
+        self.__clock = clock
+
+        # tas d'entrées [échéance, numéro de séquence, action] - l'action vaut None si l'entrée est annulée
+        self.__heap = []
+        self.__sequence = itertools.count()
+
+    def now(self) -> float:
+        """
+        Retourne le temps courant de l'horloge de l'ordonnanceur.
+        :return: temps courant (en secondes)
+        """
+        return self.__clock()
+
+    def call_at(self, deadline: float, action: Callable) -> list:
+        """
+        Planifie une action à une échéance donnée.
+        :param deadline: échéance (temps de l'horloge de l'ordonnanceur, en secondes)
+        :param action: action à faire
+        :return: la référence de l'entrée planifiée (pour l'annuler avec cancel())
+        """
+        entry = [deadline, next(self.__sequence), action]
+        heapq.heappush(self.__heap, entry)
+        return entry
+
+    def call_later(self, delay: float, action: Callable) -> list:
+        """
+        Planifie une action après un délai donné.
+        :param delay: délai (en secondes)
+        :param action: action à faire
+        :return: la référence de l'entrée planifiée (pour l'annuler avec cancel())
+        """
+        return self.call_at(self.now() + delay, action)
+
+    @staticmethod
+    def cancel(entry: list) -> None:
+        """
+        Annule une action planifiée (l'entrée est simplement ignorée lorsqu'elle atteint le dessus du tas).
+        :param entry: référence retournée par call_at() ou call_later()
+        :return: aucun
+        """
+        entry[2] = None
+
+    def update(self) -> None:
+        """
+        Déclenche toutes les actions dont l'échéance est atteinte. Méthode à appeler à chaque trame.
+        :return: aucun
+        """
+        now = self.now()
+        while self.__heap and self.__heap[0][0] <= now:
+            entry = heapq.heappop(self.__heap)
+            action = entry[2]
+            if action:
+                entry[2] = None
+                action()
+
+    def __len__(self) -> int:
+        return len(self.__heap)
+
+
+class VirtualClock:
+    """
+    Horloge virtuelle : le temps n'avance que lorsque advance() est appelée.
+    Permet de mener la simulation plus vite que le temps réel (voir headless).
+    """
+
+    def __init__(self, start: float = 0.0) -> None:
+        """
+        Initialise une horloge virtuelle (objet VirtualClock).
+        :param start: temps initial (en secondes)
+        """
+        self.__now = start
+
+    def __call__(self) -> float:
+        return self.__now
+
+    def advance(self, delta_time: float) -> None:
+        """
+        Fait avancer le temps de l'horloge.
+        :param delta_time: temps à ajouter (en secondes)
+        :return: aucun
+        """
+        self.__now += delta_time
+
+
+# ordonnanceur (singleton du GoF implémenté avec un Global Object Pattern de python)
+scheduler = None
+
+
+def init(clock: Callable = time.monotonic) -> None:
+    """
+    Initialise l'ordonnanceur.
+    :param clock: horloge monotone de la simulation (horloge du système par défaut, VirtualClock pour une simulation
+                  sans affichage)
+    """
+
+    global scheduler
+    if scheduler is None:
+        scheduler = __Scheduler(clock)
@@ -26,14 +26,7 @@ class View:
 
         self.__office = office
 
-        office_surface = office.get_image(False)
-        self.__office_width = office_surface.get_width()
-        self.__office_height = office_surface.get_height()
-
-        padded_width = (2 * screen.get_width()) + self.__office_width
-        padded_height = (2 * screen.get_height()) + self.__office_height
-        self.__padded_office_surface = pygame.Surface(
-            (padded_width, padded_height), depth=32)
+        self.__office_width, self.__office_height = office.size
 
         # Positionnement par défaut au centre du bureau
         center_x, center_y = self.__office_width / 2, self.__office_height / 2
@@ -76,29 +69,63 @@ class View:
         x, y = pixel_center
         self.__screen_rect = self.__center_to_rect(x, y)
 
-    def draw(self, display_name) -> None:
-        """ Dessine la vue à l'écran. """
-        # nettoyage de la surface d'extraction
-        self.__padded_office_surface.fill((0, 0, 0))
-
-        # "ajout" des marges noires autour du bureau
-        self.__padded_office_surface.blit(self.__office.get_image(display_name),
-                                          (self.__screen.get_width(), self.__screen.get_height()))
-
-        # calcul de la zone à extraire
-        top = self.__office_rect.top + self.__screen.get_height()
-        left = self.__office_rect.left + self.__screen.get_width()
-        width = self.__view_width
-        height = self.__view_height
-        area = pygame.Rect(left, top, width, height)
-
-        # extraction de la vue
-        self.__screen.blit(self.__padded_office_surface,
-                           self.__screen_rect, area)
+    def draw(self, office_surface: pygame.Surface) -> None:
+        """
+        Dessine la vue à l'écran.
+        Seule la partie visible du bureau est copiée directement à l'écran; les bandes de la vue qui débordent du
+        bureau sont remplies de noir.
+        :param office_surface: image du bureau pour la trame courante (voir Office.get_image), partagée par toutes
+                               les vues
+        :return: aucun
+        """
+        # calcul de la zone du bureau réellement visible dans la vue
+        visible_area = self.__office_rect.clip(office_surface.get_rect())
+
+        if visible_area.width == 0 or visible_area.height == 0:
+            # la vue est complètement hors du bureau
+            self.__screen.fill((0, 0, 0), self.__screen_rect)
+        else:
+            if visible_area.size != self.__office_rect.size:
+                self.__fill_margins(visible_area)
+
+            # extraction de la vue
+            left = self.__screen_rect.left + \
+                (visible_area.left - self.__office_rect.left)
+            top = self.__screen_rect.top + \
+                (visible_area.top - self.__office_rect.top)
+            self.__screen.blit(office_surface, (left, top), visible_area)
 
         # rectangle autour de la vue
         pygame.draw.rect(self.__screen, (255, 255, 255), self.__screen_rect, 2)
 
+    def __fill_margins(self, visible_area: pygame.Rect) -> None:
+        """
+        Remplit de noir les bandes de la vue (à l'écran) qui se trouvent hors du bureau.
+        :param visible_area: zone du bureau visible dans la vue (coordonnées du bureau)
+        :return: aucun
+        """
+        black = (0, 0, 0)
+        screen_left, screen_top = self.__screen_rect.topleft
+        width, height = self.__screen_rect.size
+
+        top_margin = visible_area.top - self.__office_rect.top
+        bottom_margin = self.__office_rect.bottom - visible_area.bottom
+        left_margin = visible_area.left - self.__office_rect.left
+        right_margin = self.__office_rect.right - visible_area.right
+
+        if top_margin > 0:
+            self.__screen.fill(
+                black, (screen_left, screen_top, width, top_margin))
+        if bottom_margin > 0:
+            self.__screen.fill(
+                black, (screen_left, screen_top + height - bottom_margin, width, bottom_margin))
+        if left_margin > 0:
+            self.__screen.fill(
+                black, (screen_left, screen_top + top_margin, left_margin, visible_area.height))
+        if right_margin > 0:
+            self.__screen.fill(black, (screen_left + width - right_margin, screen_top + top_margin,
+                                       right_margin, visible_area.height))
+
     def resize(self, width: int, height: int) -> None:
         """
         Modifie les dimensions de la vue. Repositionne également la vue en fonction de ces nouvelles dimensions.